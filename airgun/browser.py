@@ -2,23 +2,35 @@
 tests.
 """
 
+import atexit
 import base64
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from datetime import datetime
+from http import HTTPStatus
+import json
 import logging
 import os
+from textwrap import dedent
+import threading
+import time
 import urllib
 from urllib.parse import unquote
 
 from box import Box
 from selenium import webdriver
-from wait_for import TimedOutError, wait_for
+from selenium.common.exceptions import WebDriverException
+from wait_for import TimedOutError
 from webdriver_kaifuku import BrowserManager
 from widgetastic.browser import Browser, DefaultPlugin
 from widgetastic.exceptions import NoAlertPresentException, NoSuchElementException
+from widgetastic.widget import Widget
 import yaml
 
-from airgun import settings
+from airgun import settings, tracing
+from airgun.exceptions import APIRequestError
+from airgun.metrics import instrument
+from airgun.utils import to_bool
+from airgun.waits import wait_for
 from airgun.widgets import (
     ConfirmationDialog,
     Pf4ConfirmationDialog,
@@ -27,6 +39,187 @@ from airgun.widgets import (
 
 LOGGER = logging.getLogger(__name__)
 
+# GET request of arguments[0] by the logged in session of the browser, see
+# AirgunBrowser.api_get()
+API_GET_SCRIPT = """
+    var request = new XMLHttpRequest();
+    request.open('GET', arguments[0], false);
+    request.setRequestHeader('Accept', 'application/json');
+    request.send();
+    return [request.status, request.status === 200 ? request.responseText : null];
+    """
+
+# Browser pools shared by all factories in this process, keyed by
+# (provider, browser, hostname). See :func:`get_browser_pool`.
+_BROWSER_POOLS = {}
+_BROWSER_POOLS_LOCK = threading.Lock()
+
+
+class _PooledWebdriver:
+    """Bookkeeping record of a single webdriver owned by :class:`BrowserPool`."""
+
+    def __init__(self, webdriver):
+        self.webdriver = webdriver
+        self.created = time.monotonic()
+        self.uses = 0
+
+
+class BrowserPool:
+    """Keeps up to ``size`` warm webdriver instances and hands them out to
+    :class:`SeleniumBrowserFactory` instead of starting a new browser for every
+    session.
+
+    Returned browsers are reset (extra windows closed, cookies and web storage
+    cleared, blank page opened) before they are put back to the pool. Browsers
+    failing the health check, older than ``max_age`` seconds or used more than
+    ``max_uses`` times are quit instead of being reused.
+    """
+
+    def __init__(self, size, max_age=None, max_uses=None):
+        """
+        :param int size: maximum number of idle browsers kept in the pool
+        :param float optional max_age: maximum browser age in seconds
+        :param int optional max_uses: maximum number of sessions served by a
+            single browser
+        """
+        self.size = size
+        self.max_age = max_age
+        self.max_uses = max_uses
+        self._idle = []
+        self._in_use = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._idle)
+
+    def _is_expired(self, entry):
+        if self.max_age is not None and time.monotonic() - entry.created > self.max_age:
+            return True
+        return self.max_uses is not None and entry.uses >= self.max_uses
+
+    @staticmethod
+    def is_healthy(driver):
+        """Check whether the webdriver session is still alive and responsive."""
+        try:
+            driver.execute_script('return document.readyState')
+        except WebDriverException:
+            return False
+        return True
+
+    @staticmethod
+    def reset(driver):
+        """Bring the browser back to a pristine state: close all windows but
+        the first one, clear cookies, local and session storage and open a
+        blank page.
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        if hasattr(driver, 'execute_cdp_cmd'):
+            # chromium based browsers can clear cookies of every domain at once
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        # cookies and web storage are accessible only for the current document
+        driver.delete_all_cookies()
+        # storage is not available for some documents (e.g. error pages)
+        with suppress(WebDriverException):
+            driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+        driver.get('about:blank')
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException as err:
+            LOGGER.warning('Failed to quit pooled browser: %s', err)
+
+    def acquire(self):
+        """Return a healthy warm webdriver from the pool or ``None`` if there
+        is none available.
+        """
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                entry = self._idle.pop()
+            if self._is_expired(entry) or not self.is_healthy(entry.webdriver):
+                LOGGER.debug('Evicting pooled browser %s', entry.webdriver.session_id)
+                self._quit(entry.webdriver)
+                continue
+            entry.uses += 1
+            with self._lock:
+                self._in_use[id(entry.webdriver)] = entry
+            LOGGER.info('Reusing pooled browser %s', entry.webdriver.session_id)
+            return entry.webdriver
+
+    def register(self, driver):
+        """Start tracking freshly started webdriver, so it can be released to
+        the pool later.
+        """
+        entry = _PooledWebdriver(driver)
+        entry.uses = 1
+        with self._lock:
+            self._in_use[id(driver)] = entry
+
+    def release(self, driver):
+        """Reset the webdriver and return it to the pool. The webdriver is quit
+        instead if it is not healthy, expired or the pool is full.
+        """
+        with self._lock:
+            entry = self._in_use.pop(id(driver), None) or _PooledWebdriver(driver)
+        if self._is_expired(entry) or not self.is_healthy(driver):
+            self._quit(driver)
+            return
+        try:
+            self.reset(driver)
+        except WebDriverException as err:
+            LOGGER.warning('Failed to reset pooled browser, quitting it: %s', err)
+            self._quit(driver)
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(entry)
+                return
+        self._quit(driver)
+
+    def clear(self):
+        """Quit all idle webdrivers."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            self._quit(entry.webdriver)
+
+
+def get_browser_pool(provider, browser, hostname):
+    """Return the process-wide :class:`BrowserPool` for given provider, browser
+    and hostname, or ``None`` if pooling is disabled by
+    ``settings.selenium.pool_size``.
+    """
+    size = int(settings.selenium.pool_size or 0)
+    if size <= 0:
+        return None
+    key = (provider, browser, hostname)
+    with _BROWSER_POOLS_LOCK:
+        if key not in _BROWSER_POOLS:
+            max_age = settings.selenium.pool_max_age
+            max_uses = settings.selenium.pool_max_uses
+            _BROWSER_POOLS[key] = BrowserPool(
+                size,
+                max_age=float(max_age) if max_age else None,
+                max_uses=int(max_uses) if max_uses else None,
+            )
+        return _BROWSER_POOLS[key]
+
+
+@atexit.register
+def clear_browser_pools():
+    """Quit all pooled browsers. Called automatically on interpreter exit."""
+    with _BROWSER_POOLS_LOCK:
+        pools = list(_BROWSER_POOLS.values())
+    for pool in pools:
+        pool.clear()
+
 
 class SeleniumBrowserFactory:
     """Factory which creates selenium browser of desired provider (selenium,
@@ -35,6 +228,10 @@ class SeleniumBrowserFactory:
     browser when it's not needed anymore (closes the browser, stops docker
     container, sends test results to saucelabs etc).
 
+    If ``settings.selenium.pool_size`` is set, browsers are taken from and
+    returned to a shared :class:`BrowserPool` instead of being started and quit
+    for every factory.
+
     Usage::
 
         # init factory
@@ -82,6 +279,7 @@ class SeleniumBrowserFactory:
         self._docker = None
         self._webdriver = None
         self._hostname = hostname or settings.satellite.hostname
+        self._pool = get_browser_pool(self.provider, self.browser, self._hostname)
 
     def get_browser(self):
         """Returns selenium webdriver instance of selected ``provider`` and
@@ -90,15 +288,23 @@ class SeleniumBrowserFactory:
         :return: selenium webdriver instance
         :raises: ValueError: If wrong ``provider`` or ``browser`` specified.
         """
-        if self.provider == 'selenium':
-            return self._get_selenium_browser()
-        elif self.provider == 'remote':
-            return self._get_remote_browser()
-        else:
+        if self.provider not in ('selenium', 'remote'):
             raise ValueError(
                 f'"{self.provider}" browser is not supported. '
                 f'Please use one of {("selenium", "remote")}'
             )
+        if self._pool is not None:
+            self._webdriver = self._pool.acquire()
+            if self._webdriver is not None:
+                self._set_session_cookie()
+                return self._webdriver
+        if self.provider == 'selenium':
+            self._get_selenium_browser()
+        else:
+            self._get_remote_browser()
+        if self._pool is not None:
+            self._pool.register(self._webdriver)
+        return self._webdriver
 
     def post_init(self):
         """Perform all required post-init tweaks and workarounds. Should be
@@ -117,18 +323,28 @@ class SeleniumBrowserFactory:
         :return: None
         """
         if self.provider in ('selenium', 'remote'):
-            self._webdriver.quit()
+            if self._pool is not None:
+                self._pool.release(self._webdriver)
+            else:
+                self._webdriver.quit()
             return
 
+    def set_session_id(self, session_id):
+        """Add satellite ``_session_id`` cookie with provided value to the
+        webdriver, so the browser is logged in without going through the login
+        form.
+
+        :param str session_id: value of the ``_session_id`` cookie
+        """
+        # webdriver doesn't allow to add cookies unless we land on the target domain
+        # let's navigate to its invalid page to get it loaded ASAP
+        self._webdriver.get(f'https://{self._hostname}/404')
+        self._webdriver.add_cookie({'name': '_session_id', 'value': session_id})
+
     def _set_session_cookie(self):
         """Add the session cookie (if provided) to the webdriver"""
         if self._session:
-            # webdriver doesn't allow to add cookies unless we land on the target domain
-            # let's navigate to its invalid page to get it loaded ASAP
-            self._webdriver.get(f'https://{self._hostname}/404')
-            self._webdriver.add_cookie(
-                {'name': '_session_id', 'value': self._session.cookies.get_dict()['_session_id']}
-            )
+            self.set_session_id(self._session.cookies.get_dict()['_session_id'])
 
     def _get_selenium_browser(self):
         """Returns selenium webdriver instance of selected ``browser``.
@@ -189,6 +405,17 @@ class AirgunBrowserPlugin(DefaultPlugin):
     JavaScript to make sure page is loaded completely. Checks for absence of
     jQuery, AJAX, Angular requests, absence of spinner indicating loading
     progress and ensures ``document.readyState`` is "complete".
+
+    With ``settings.airgun.ensure_page_safe_mode`` set to ``tracker``, a tracker
+    of pending fetch/XHR requests and DOM mutations is installed into every
+    document, and :meth:`ensure_page_safe` waits in-page (single webdriver
+    call) until the page has been quiet for ``ensure_page_safe_settle``
+    seconds. Polling is used whenever the tracker can't be used.
+
+    With ``settings.airgun.ensure_page_safe_skip_unchanged`` enabled, the tracker
+    is installed in polling mode as well and the readiness checks return right
+    away if no request was made and DOM was not mutated since the page was
+    last confirmed to be safe (e.g. consecutive clicks in a static form).
     """
 
     ENSURE_PAGE_SAFE = """
@@ -240,8 +467,112 @@ class AirgunBrowserPlugin(DefaultPlugin):
         }
         """
 
+    # Installs a tracker of pending fetch/XHR requests and DOM mutations into
+    # the current document (once per document). Every request start/end and
+    # every mutation advances tracker's generation, so "<id>:<generation>"
+    # identifies the state of the page.
+    PAGE_TRACKER = """
+        if (!window.__airgunTracker) {
+          var tracker = {
+            id: Math.random().toString(36).slice(2), generation: 0, pending: 0, last: Date.now()
+          };
+          var touch = function () { tracker.generation++; tracker.last = Date.now(); };
+          var done = function () { tracker.pending--; touch(); };
+          if (window.fetch) {
+            var origFetch = window.fetch;
+            window.fetch = function () {
+              tracker.pending++; touch();
+              try {
+                return origFetch.apply(this, arguments).finally(done);
+              } catch (e) { done(); throw e; }
+            };
+          }
+          var origSend = XMLHttpRequest.prototype.send;
+          XMLHttpRequest.prototype.send = function () {
+            tracker.pending++; touch();
+            this.addEventListener('loadend', done);
+            try {
+              return origSend.apply(this, arguments);
+            } catch (e) { done(); throw e; }
+          };
+          new MutationObserver(touch).observe(
+            document, {childList: true, subtree: true, attributes: true, characterData: true});
+          window.__airgunTracker = tracker;
+        }
+        """
+
+    # Synchronous variant of ENSURE_PAGE_SAFE for polling, which skips the
+    # checks when the page did not change since the last safe state.
+    CHECK_PAGE_SAFE = (
+        """
+        var known = arguments[0], tracker = null;
+        try {
+        """
+        + PAGE_TRACKER
+        + """
+          tracker = window.__airgunTracker;
+        } catch (e) {}
+        var state = tracker ? tracker.id + ':' + tracker.generation : null;
+        if (state !== null && state === known && tracker.pending < 1) {
+          return {state: state, checks: {unchanged: true}};
+        }
+        var checks = (function () {
+        """
+        + ENSURE_PAGE_SAFE
+        + """
+        })();
+        return {state: state, checks: checks};
+        """
+    )
+
+    # Asynchronous script resolving once there are no pending requests, the
+    # DOM has not changed for the settle window and ENSURE_PAGE_SAFE passes.
+    # Resolves immediately when the page did not change since the last safe
+    # state.
+    WAIT_FOR_QUIET_PAGE = (
+        """
+        var settle = arguments[0], timeout = arguments[1], known = arguments[2];
+        var callback = arguments[arguments.length - 1];
+        try {
+        """
+        + PAGE_TRACKER
+        + """
+        } catch (e) {
+          callback({status: 'unsupported'});
+          return;
+        }
+        function pageSafe() {
+        """
+        + ENSURE_PAGE_SAFE
+        + """
+        }
+        var tracker = window.__airgunTracker, start = Date.now();
+        (function poll() {
+          var now = Date.now(), state = tracker.id + ':' + tracker.generation;
+          if (tracker.pending < 1 && (state === known || now - tracker.last >= settle)) {
+            var result = state === known ? {} : pageSafe(), safe = true;
+            for (var key in result) { safe = safe && result[key]; }
+            if (safe) { callback({status: 'safe', state: state}); return; }
+          }
+          if (now - start > timeout) { callback({status: 'timeout'}); return; }
+          setTimeout(poll, 50);
+        })();
+        """
+    )
+
     def __init__(self, *args, **kwargs):
         self._ignore_ensure_page_safe_timeout = False
+        self._safe_state = None
+        # whether the page tracker found the page quiet by the last ensure_page_safe()
+        self.page_settled = False
+        self.script_timeout = None
+        # time spent by AirgunBrowser.wait_for_element() waiting for elements
+        # which did not appear
+        self.absent_wait_time = 0.0
+        self.absent_wait_count = 0
+        self.page_safe_mode = settings.airgun.ensure_page_safe_mode or 'polling'
+        self.page_safe_settle = float(settings.airgun.ensure_page_safe_settle or 0)
+        self.skip_unchanged = to_bool(settings.airgun.ensure_page_safe_skip_unchanged)
         super().__init__(*args, **kwargs)
 
     @property
@@ -259,16 +590,72 @@ class AirgunBrowserPlugin(DefaultPlugin):
         and continues as if the page was safe instead. This can be used to bypass
         some bugs, e.g. https://bugzilla.redhat.com/show_bug.cgi?id=2106022
         """
+        self.page_settled = False
+        with tracing.span('ensure_page_safe', 'wait', timeout=timeout):
+            self._ensure_page_safe(timeout)
+
+    def _ensure_page_safe(self, timeout):
         try:
             if self.ignore_ensure_page_safe_timeout:
                 # set lower timeout, otherwise the page will be stuck in a lot of waiting because
                 # once broken, ensure_page_safe will always timeout until loading a new page
                 timeout = 2
-            super().ensure_page_safe(timeout)
+            if self.page_safe_mode == 'tracker' and self._wait_for_quiet_page(timeout):
+                return
+            if self.skip_unchanged:
+                self._poll_page_safe(timeout)
+            else:
+                super().ensure_page_safe(timeout)
         except TimedOutError:
             if not self.ignore_ensure_page_safe_timeout:
                 raise
 
+    def _poll_page_safe(self, timeout):
+        """Poll :attr:`CHECK_PAGE_SAFE` until the page is safe. The checks are
+        skipped in-page if the page did not change since the last safe state.
+        """
+
+        def _check():
+            result = self.browser.execute_script(
+                self.CHECK_PAGE_SAFE, self._safe_state, silent=True
+            )
+            try:
+                safe = all(result['checks'].values())
+            except (TypeError, KeyError, AttributeError):
+                return True
+            self._safe_state = result['state'] if safe else None
+            return safe
+
+        wait_for(_check, timeout=timeout, delay=0.2, very_quiet=True)
+
+    def _wait_for_quiet_page(self, timeout):
+        """Wait for the page to become quiet using in-page request and DOM
+        mutation tracker within a single webdriver call.
+
+        :return: True if the page is safe, False if the tracker can't be used
+            and polling should be used instead
+        :raises TimedOutError: if the page did not become quiet in time
+        """
+        known_state = self._safe_state if self.skip_unchanged else None
+        try:
+            result = self.browser.execute_async_script(
+                self.WAIT_FOR_QUIET_PAGE,
+                self.page_safe_settle * 1000,
+                timeout * 1000,
+                known_state,
+                timeout=timeout,
+                silent=True,
+            )
+        except WebDriverException as err:
+            # e.g. document was unloaded while waiting, let polling handle the new one
+            self.logger.debug('Page tracker wait failed, falling back to polling: %s', err)
+            return False
+        self._safe_state = result.get('state')
+        if result['status'] == 'timeout':
+            raise TimedOutError(f'Page did not become quiet in {timeout} seconds')
+        self.page_settled = result['status'] == 'safe'
+        return self.page_settled
+
     def before_click(self, element, locator=None):
         """Invoked before clicking on an element. Ensure page is fully loaded
         before clicking.
@@ -308,9 +695,92 @@ class AirgunBrowser(Browser):
         """
         extra_objects = extra_objects or {}
         extra_objects.update({'session': session})
+        instrument(selenium, session.metrics)
         super().__init__(selenium, plugin_class=AirgunBrowserPlugin, extra_objects=extra_objects)
         self.window_handle = selenium.current_window_handle
 
+    def probe(self, locator, parent=None, visible=False):
+        """Check presence (or visibility) of an element right away, with a
+        single ``find_elements`` call. Unlike :meth:`wait_for_element`, there
+        is no waiting and no page safety check, so use it only when the page
+        is known to be settled, see :meth:`is_page_settled`.
+
+        :return: first matching element or ``None`` if there is no such
+            element (or it is not visible, when ``visible`` is set)
+        """
+        try:
+            elements = self.elements(
+                locator, parent=parent, check_visibility=visible, check_safe=False
+            )
+        except NoSuchElementException:
+            # parent does not exist
+            return None
+        return elements[0] if elements else None
+
+    def is_page_settled(self):
+        """Wait for the page to be safe and return whether it is also known to
+        be settled, i.e. there are no pending requests and the DOM stopped
+        changing, so absence of an element can be checked by :meth:`probe`
+        without waiting for it to appear.
+
+        This is only known in ``tracker`` ensure_page_safe mode, see
+        :class:`AirgunBrowserPlugin`.
+        """
+        self.plugin.ensure_page_safe()
+        return self.plugin.page_settled
+
+    def wait_for_element(self, locator, *args, **kwargs):
+        """Wait for presence or visibility of elements, same as
+        :meth:`widgetastic.browser.Browser.wait_for_element`, but account the
+        time spent waiting for elements which did not appear in
+        ``plugin.absent_wait_time``.
+        """
+        # self may be a BrowserParentWrapper, so no super() here
+        start = time.monotonic()
+        try:
+            result = Browser.wait_for_element(self, locator, *args, **kwargs)
+        except NoSuchElementException:
+            self._count_absent_wait(start)
+            raise
+        if result is None:
+            self._count_absent_wait(start)
+        return result
+
+    def _count_absent_wait(self, start):
+        self.plugin.absent_wait_time += time.monotonic() - start
+        self.plugin.absent_wait_count += 1
+
+    def execute_async_script(self, script, *args, timeout=30, silent=False):
+        """Execute asynchronous script, which reports its result by calling
+        the callback passed as the last argument. Widgets passed as arguments
+        are converted to their elements, same as in :meth:`execute_script`.
+
+        :param int optional timeout: number of seconds the script has to
+            report its result in. Webdriver waits a few more seconds, so the
+            timeouts implemented by the script itself fire first.
+        """
+        if not silent:
+            self.logger.debug('execute_async_script: %r', script)
+        if self.plugin.script_timeout != timeout:
+            self.selenium.set_script_timeout(timeout + 5)
+            self.plugin.script_timeout = timeout
+        processed_args = [arg.__element__() if isinstance(arg, Widget) else arg for arg in args]
+        return self.selenium.execute_async_script(dedent(script), *processed_args)
+
+    def api_get(self, path):
+        """Return decoded JSON response of GET request of Satellite API
+        ``path``, e.g. ``/api/status``, made by the logged in session of the
+        browser, without loading any page.
+
+        :raises airgun.exceptions.APIRequestError: if the response status is
+            not 200
+        """
+        self.logger.debug('api_get: %s', path)
+        status, body = self.execute_script(API_GET_SCRIPT, path, silent=True)
+        if status != HTTPStatus.OK:
+            raise APIRequestError(path, status)
+        return json.loads(body)
+
     def get_client_datetime(self):
         """Make Javascript call inside of browser session to get exact current
         date and time. In that way, we will be isolated from any issue that can
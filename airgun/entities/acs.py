@@ -1,7 +1,4 @@
-import time
-
-from wait_for import wait_for
-
+from airgun import waits
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
@@ -15,6 +12,7 @@ from airgun.views.acs import (
     EditUrlAndSubpathsModal,
     RowDrawer,
 )
+from airgun.waits import wait_for
 
 
 class AcsEntity(BaseEntity):
@@ -47,8 +45,9 @@ class AcsEntity(BaseEntity):
         if row_id is not None:
             view.acs_drawer.content_table[row_id][1].widget.click()
         elif acs_name is not None:
+            before = waits.fingerprint(view.acs_drawer.content_table)
             view.acs_drawer.search_bar.fill(f'name = {acs_name}')
-            time.sleep(3)
+            waits.search_results_refreshed(view.acs_drawer.content_table, before)
             if not view.acs_drawer.content_table.is_displayed:
                 raise ValueError(f'ACS {acs_name} not found!')
             # Open ACS details side panel
@@ -200,7 +199,7 @@ class AcsEntity(BaseEntity):
         """Function that closes side panel view"""
 
         view = AlternateContentSourcesView(self.browser)
-        time.sleep(2)
+        waits.search_results_refreshed(view.acs_drawer.content_table)
         view.acs_drawer.content_table[0][1].widget.click()
 
     def edit_acs_details(
@@ -240,8 +239,14 @@ class AcsEntity(BaseEntity):
         if new_description is not None:
             view.description.fill(new_description)
         view.edit_button.click()
-        # Wait for the possible error to pop up
-        time.sleep(1)
+        # Wait for the modal to close, or for the possible error to pop up
+        wait_for(
+            lambda: view.error_message.is_displayed or not view.is_displayed,
+            timeout=10,
+            delay=0.5,
+            handle_exception=True,
+            silent_failure=True,
+        )
         if view.error_message.is_displayed:
             raise ValueError(f'Error while editing: {view.error_message.read()}')
         self.close_details_side_panel()
@@ -705,7 +710,7 @@ class AcsEntity(BaseEntity):
                 raise ValueError(f'ACS with {name} already exists!')
             else:
                 view.acs_drawer.clear_search.click()
-                time.sleep(2)
+                waits.search_results_refreshed(view.acs_drawer)
 
         wait_for(lambda: view.acs_drawer.add_source.is_displayed, timeout=10, delay=1)
         view.acs_drawer.add_source.click()
@@ -815,8 +820,12 @@ class AcsEntity(BaseEntity):
         if view.error_message.is_displayed:
             raise ValueError(f'Error while adding ACS: {view.error_message.read()}')
         # Wait for ACS to be added to the table
-        time.sleep(4)
-        wait_for(lambda: view.acs_drawer.content_table.is_displayed, timeout=10, delay=1)
+        wait_for(
+            lambda: view.acs_drawer.content_table.row(name=name).is_displayed,
+            timeout=10,
+            delay=1,
+            handle_exception=True,
+        )
         # Close the side panel
         view = AlternateContentSourcesView(self.browser)
         view.acs_drawer.content_table[-1][1].widget.click()
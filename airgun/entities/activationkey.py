@@ -1,8 +1,6 @@
-import time
-
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 
+from airgun import waits
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
@@ -12,6 +10,7 @@ from airgun.views.activationkey import (
     ActivationKeysView,
 )
 from airgun.views.host_new import ManageMultiCVEnvModal
+from airgun.waits import wait_for
 
 
 class ActivationKeyEntity(BaseEntity):
@@ -28,7 +27,7 @@ class ActivationKeyEntity(BaseEntity):
             lce_dict = values.get('lce', {})
             cv_name = values.get('content_view')
             view.assign_cv_env_btn.click()
-            time.sleep(3)
+            waits.wizard_step_rendered(ManageMultiCVEnvModal(self.browser))
             self._update_cv_lce_via_modal(lce_dict, cv_name)
         view.submit.click()
 
@@ -1,4 +1,3 @@
-from asyncio import wait_for
 import contextlib
 
 import anytree
@@ -30,6 +29,7 @@ from airgun.views.all_hosts import (
 )
 from airgun.views.host_new import ManageMultiCVEnvModal
 from airgun.views.job_invocation import JobInvocationCreateView
+from airgun.waits import wait_for
 
 
 class AllHostsEntity(BaseEntity):
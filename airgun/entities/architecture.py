@@ -48,7 +48,7 @@ class ArchitectureEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(ArchitectureEntity, 'All')
+@navigator.register(ArchitectureEntity, 'All', url='/architectures')
 class ShowAllArchitectures(NavigateStep):
     """Navigate to All Architectures page"""
 
@@ -59,7 +59,7 @@ class ShowAllArchitectures(NavigateStep):
         self.view.menu.select('Hosts', 'Provisioning Setup', 'Architectures')
 
 
-@navigator.register(ArchitectureEntity, 'New')
+@navigator.register(ArchitectureEntity, 'New', url='/architectures/new')
 class AddNewArchitecture(NavigateStep):
     """Navigate to Create Architecture page"""
 
@@ -13,7 +13,7 @@ class AuditEntity(BaseEntity):
         return view.search(value)
 
 
-@navigator.register(AuditEntity, 'All')
+@navigator.register(AuditEntity, 'All', url='/audits')
 class ShowAllAuditEntries(NavigateStep):
     """Navigate to Audit screen that contains all log entries"""
 
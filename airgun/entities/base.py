@@ -1,5 +1,8 @@
+import inspect
+
 from widgetastic.exceptions import NoSuchElementException
 
+from airgun import tracing
 from airgun.exceptions import DisabledWidgetError
 from airgun.helpers.base import BaseEntityHelper
 from airgun.views.common import BookmarkCreateView
@@ -14,6 +17,10 @@ class BaseEntity:
         self.navigate_to = self.session.navigator.navigate
         self._helper = self.HELPER_CLASS(self)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _trace_public_methods(cls)
+
     @property
     def helper(self):
         return self._helper
@@ -57,3 +64,16 @@ class BaseEntity:
         """
         view = self.navigate_to(self, 'All')
         return view.menu_search.search(query)
+
+
+def _trace_public_methods(cls):
+    """Wrap public methods of entity class by :func:`airgun.tracing.entity_method`,
+    so navigation, waits and sleeps they cause are attributed to them in
+    traces.
+    """
+    for name, attr in list(vars(cls).items()):
+        if not name.startswith('_') and inspect.isfunction(attr):
+            setattr(cls, name, tracing.entity_method(attr))
+
+
+_trace_public_methods(BaseEntity)
@@ -51,7 +51,7 @@ class BookmarkEntity(BaseEntity):
         return result
 
 
-@navigator.register(BookmarkEntity, 'All')
+@navigator.register(BookmarkEntity, 'All', url='/bookmarks')
 class ShowAllBookmarks(NavigateStep):
     """Navigate to All Bookmarks screen."""
 
@@ -1,7 +1,4 @@
-import time
-
-from wait_for import wait_for
-
+from airgun import waits
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStepWithWait as NavigateStep, navigator
 from airgun.views.cloud_insights import (
@@ -13,6 +10,7 @@ from airgun.views.cloud_insights import (
     RemediateSummary,
 )
 from airgun.views.job_invocation import JobInvocationStatusView
+from airgun.waits import wait_for
 
 
 class CloudInsightsEntity(BaseEntity):
@@ -72,8 +70,9 @@ class RecommendationsTabEntity(BaseEntity):
         view.wait_displayed(timeout=10)
         wait_for(lambda: view.clear_button.is_displayed, handle_exception=True, timeout=20)
         view.clear_button.click()
+        before = waits.fingerprint(view.table)
         view.search_field.fill(value)
-        time.sleep(5)
+        waits.search_results_refreshed(view.table, before)
         return view.table.read()
 
     def remediate_affected_system(self, recommendation_name, hostname):
@@ -87,7 +86,7 @@ class RecommendationsTabEntity(BaseEntity):
         # Filter by hostname and apply recommendation
         view.search_field.fill(hostname)
         wait_for(lambda: view.table.row(name=hostname), handle_exception=True, timeout=20)
-        time.sleep(15)
+        waits.search_results_refreshed(view.table)
         view.table[0][0].widget.click()
         view.remediate.click()
         self.browser.plugin.ensure_page_safe(timeout=30)
@@ -106,7 +105,7 @@ class RecommendationsTabEntity(BaseEntity):
         # Use navigator to open the Affected Systems details view
         view = self.navigate_to(self, 'Affected Systems', recommendation_name=recommendation_name)
         wait_for(view.table.row, handle_exception=True, timeout=20)
-        time.sleep(5)
+        waits.search_results_refreshed(view.table)
         view.bulk_select.select_all()
         view.remediate.click()
         self.browser.plugin.ensure_page_safe(timeout=30)
@@ -132,13 +131,14 @@ class RecommendationsTabEntity(BaseEntity):
         wait_for(lambda: view.table.is_displayed, timeout=30, handle_exception=True)
         view.clear_button.click()
         view.menu_toggle.fill(filter_type)
+        before = waits.fingerprint(view.table)
         if is_search:
             view.conditional_filter_dropdown.fill(filter_value)
         else:
             view.menu_filter.fill(filter_value)
         self.browser.plugin.ensure_page_safe(timeout=10)
         wait_for(lambda: view.table.is_displayed, timeout=30, handle_exception=True)
-        time.sleep(5)
+        waits.search_results_refreshed(view.table, before)
         return view.table.read()
 
     def read(self, widget_names=None):
@@ -168,7 +168,7 @@ class RecommendationsTabEntity(BaseEntity):
                 raise ValueError('Hostname is required when system=True')
             view.search_field.fill(hostname)
             wait_for(lambda: view.table.row(name=hostname), handle_exception=True, timeout=20)
-            time.sleep(15)
+            waits.search_results_refreshed(view.table)
             kebab = view.table[0][5].widget
             kebab.item_select('Disable recommendation for system')
         else:
@@ -221,10 +221,11 @@ class NavigateToAffectedSystems(NavigateStep):
     def step(self, *args, **kwargs):
         recommendation_name = kwargs.get('recommendation_name')
         # Filter by recommendation name and open its expanded content
-        time.sleep(5)
+        waits.wizard_step_rendered(self.parent)
         self.parent.clear_button.click()
+        before = waits.fingerprint(self.parent.table)
         self.parent.search_field.fill(recommendation_name)
-        time.sleep(5)
+        waits.search_results_refreshed(self.parent.table, before)
         row, _ = wait_for(lambda: self.parent.table.row(name=recommendation_name), timeout=5)
         row.expand()
         row.content.affected_systems_url.click()
@@ -1,11 +1,10 @@
-import time
-
-from wait_for import wait_for
 from widgetastic.exceptions import NoSuchElementException
 
+from airgun import tracing
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStepWithWait as NavigateStep, navigator
 from airgun.views.cloud_inventory import CloudInventoryListView, IopCloudInventoryListView
+from airgun.waits import wait_for
 
 
 class CloudInventoryEntity(BaseEntity):
@@ -122,7 +121,7 @@ class CloudInventoryEntity(BaseEntity):
         view = self.navigate_to(self, 'All')
         view.inventory_list.toggle(org_name)
         view.inventory_list.download_report.click()
-        time.sleep(3)
+        tracing.sleep(3)
         return self.browser.save_downloaded_file()
 
     def update(self, values):
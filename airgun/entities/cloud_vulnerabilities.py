@@ -1,7 +1,4 @@
-import time
-
-from wait_for import wait_for
-
+from airgun import tracing
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStepWithWait as NavigateStep, navigator
 from airgun.views.cloud_vulnerabilities import (
@@ -10,6 +7,7 @@ from airgun.views.cloud_vulnerabilities import (
     EditVulnerabilitiesModal,
 )
 from airgun.views.host_new import NewHostDetailsView
+from airgun.waits import wait_for
 
 
 class CloudVulnerabilityEntity(BaseEntity):
@@ -445,7 +443,7 @@ class CloudVulnerabilityEntity(BaseEntity):
         }
         view.export_menu.item_select(format_map[export_format])
 
-        time.sleep(5)
+        tracing.sleep(5)
         return self.browser.save_downloaded_file()
 
 
@@ -52,7 +52,7 @@ class ComputeProfileEntity(BaseEntity):
         return view.table.read()
 
 
-@navigator.register(ComputeProfileEntity, 'All')
+@navigator.register(ComputeProfileEntity, 'All', url='/compute_profiles')
 class ShowAllComputeProfiles(NavigateStep):
     """Navigate to All Compute Profiles page"""
 
@@ -63,7 +63,7 @@ class ShowAllComputeProfiles(NavigateStep):
         self.view.menu.select('Infrastructure', 'Compute Profiles')
 
 
-@navigator.register(ComputeProfileEntity, 'New')
+@navigator.register(ComputeProfileEntity, 'New', url='/compute_profiles/new')
 class AddNewComputeProfile(NavigateStep):
     """Navigate to Create Compute Profile page"""
 
@@ -181,7 +181,7 @@ class ComputeResourceEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(ComputeResourceEntity, 'All')
+@navigator.register(ComputeResourceEntity, 'All', url='/compute_resources')
 class ShowAllComputeResources(NavigateStep):
     VIEW = ComputeResourcesView
 
@@ -190,7 +190,7 @@ class ShowAllComputeResources(NavigateStep):
         self.view.menu.select('Infrastructure', 'Compute Resources')
 
 
-@navigator.register(ComputeResourceEntity, 'New')
+@navigator.register(ComputeResourceEntity, 'New', url='/compute_resources/new')
 class AddNewComputeResource(NavigateStep):
     VIEW = ResourceProviderCreateView
 
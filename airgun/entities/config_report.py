@@ -40,7 +40,7 @@ class ConfigReportEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(ConfigReportEntity, 'All')
+@navigator.register(ConfigReportEntity, 'All', url='/config_reports')
 class ShowAllConfigReports(NavigateStep):
     """Navigate to all Config Report screen."""
 
@@ -1,5 +1,3 @@
-from wait_for import wait_for
-
 from airgun.entities.base import BaseEntity
 from airgun.exceptions import DisabledWidgetError
 from airgun.navigation import NavigateStepWithWait as NavigateStep, navigator
@@ -11,6 +9,7 @@ from airgun.views.contentcredential import (
     DeleteContentCredentialModal,
 )
 from airgun.views.product import ProductEditView
+from airgun.waits import wait_for
 
 
 class ContentCredentialEntity(BaseEntity):
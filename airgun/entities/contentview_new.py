@@ -1,10 +1,8 @@
-import time
-
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 from widgetastic.exceptions import NoSuchElementException
 from widgetastic_patternfly4.dropdown import DropdownItemDisabled
 
+from airgun import waits
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
@@ -20,6 +18,7 @@ from airgun.views.contentview_new import (
     CreateFilterView,
     EditFilterView,
 )
+from airgun.waits import wait_for
 
 
 class NewContentViewEntity(BaseEntity):
@@ -123,7 +122,8 @@ class NewContentViewEntity(BaseEntity):
             version=version,
             timeout=60,
         )
-        time.sleep(5)  # 'Loading' widget on page
+        # 'Loading' widget on page
+        waits.wizard_step_rendered(view)
         self.browser.plugin.ensure_page_safe(timeout=10)
         wait_for(lambda: view.repositories.table.is_displayed, timeout=20)
         result = view.version_dropdown.item_select('Delete')
@@ -183,7 +183,7 @@ class NewContentViewEntity(BaseEntity):
             version=version,
             timeout=60,
         )
-        time.sleep(5)
+        waits.wizard_step_rendered(view)
         self.browser.plugin.ensure_page_safe(timeout=5)
         # This allows dynamic access to the proper table
         wait_for(getattr(view, tab_name).table.wait_displayed, timeout=10)
@@ -334,7 +334,7 @@ class NewContentViewEntity(BaseEntity):
     def update(self, entity_name, values):
         """Update existing content view"""
         view = self.navigate_to(self, 'Edit', entity_name=entity_name)
-        time.sleep(3)
+        waits.wizard_step_rendered(view)
         filled_values = view.fill(values)
         view.flash.assert_no_error()
         view.flash.dismiss()
@@ -1,5 +1,4 @@
-import time
-
+from airgun import waits
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
@@ -19,7 +18,7 @@ class DashboardEntity(BaseEntity):
         view = self.navigate_to(self, 'All')
         if widget_name not in view.widget_names:
             raise ValueError('Provide correct widget name to be read')
-        time.sleep(3)
+        waits.wizard_step_rendered(getattr(view, widget_name))
         return getattr(view, widget_name).read()
 
     def read_all(self):
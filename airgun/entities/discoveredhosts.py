@@ -1,5 +1,3 @@
-from wait_for import wait_for
-
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
@@ -14,6 +12,7 @@ from airgun.views.discoveredhosts import (
     DiscoveredHostsRebootDialog,
     DiscoveredHostsView,
 )
+from airgun.waits import wait_for
 
 
 class DiscoveredHostsEntity(BaseEntity):
@@ -78,7 +78,7 @@ class DomainEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(DomainEntity, 'All')
+@navigator.register(DomainEntity, 'All', url='/domains')
 class ShowAllDomains(NavigateStep):
     """Navigate to All Domains page"""
 
@@ -89,7 +89,7 @@ class ShowAllDomains(NavigateStep):
         self.view.menu.select('Infrastructure', 'Domains')
 
 
-@navigator.register(DomainEntity, 'New')
+@navigator.register(DomainEntity, 'New', url='/domains/new')
 class AddNewDomain(NavigateStep):
     """Navigate to Create Domain page"""
 
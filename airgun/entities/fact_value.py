@@ -8,7 +8,7 @@ class FactValueEntity(BaseEntity):
     endpoint_path = '/fact_values'
 
 
-@navigator.register(FactValueEntity, 'All')
+@navigator.register(FactValueEntity, 'All', url='/fact_values')
 class ShowFactValuePage(NavigateStep):
     """Navigate to Fact Values page."""
 
@@ -1,7 +1,6 @@
-from time import sleep
-
 from widgetastic.exceptions import NoSuchElementException
 
+from airgun import waits
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
@@ -162,8 +161,7 @@ class FlatpakRemotesEntity(BaseEntity):
         delete_modal = FlatpakRemoteDeleteModal(self.browser)
         delete_modal.wait_displayed()
         delete_modal.delete_btn.click()
-        sleep(3)
-        self.browser.plugin.ensure_page_safe()
+        waits.page_stable(self.browser, settle=1)
         view = FlatpakRemotesView(self.browser)
         view.wait_displayed(delay=3)
 
@@ -8,7 +8,7 @@ class GlobalParameterEntity(BaseEntity):
     endpoint_path = '/common_parameters'
 
 
-@navigator.register(GlobalParameterEntity, 'All')
+@navigator.register(GlobalParameterEntity, 'All', url='/common_parameters')
 class ShowGlobalParameters(NavigateStep):
     """Navigate to Global Parameters page."""
 
@@ -58,7 +58,7 @@ class HardwareModelEntity(BaseEntity):
             view.flash.dismiss()
 
 
-@navigator.register(HardwareModelEntity, 'All')
+@navigator.register(HardwareModelEntity, 'All', url='/models')
 class ShowAllHardwareModels(NavigateStep):
     """Navigate to All Hardware Model screen."""
 
@@ -69,7 +69,7 @@ class ShowAllHardwareModels(NavigateStep):
         self.view.menu.select('Hosts', 'Provisioning Setup', 'Hardware Models')
 
 
-@navigator.register(HardwareModelEntity, 'New')
+@navigator.register(HardwareModelEntity, 'New', url='/models/new')
 class AddNewHardwareModel(NavigateStep):
     """Navigate to Create new Hardware Model screen."""
 
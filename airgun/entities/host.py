@@ -1,8 +1,6 @@
-from time import sleep
-
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 
+from airgun import waits
 from airgun.entities.all_hosts import AllHostsEntity
 from airgun.entities.base import BaseEntity
 from airgun.exceptions import DisabledWidgetError
@@ -35,6 +33,7 @@ from airgun.views.host import (
     RepositoryListView,
 )
 from airgun.views.host_new import ManageColumnsView, NewHostDetailsView
+from airgun.waits import wait_for
 
 
 class HostEntity(BaseEntity):
@@ -155,6 +154,7 @@ class HostEntity(BaseEntity):
         view.search(entity_name)
         view.get_row_kebab(0).item_select('Delete')
         self.browser.handle_alert()
+        self.session.link_cache.invalidate(entity_name, type(self))
         self.browser.refresh()
         # Workaround for SAT-38950: Flash message may not appear properly
         # wait_for(
@@ -254,8 +254,7 @@ class HostEntity(BaseEntity):
         view = HostsChangeContentSourceView(self.browser)
         view.wait_displayed()
         # Select content source
-        wait_for(lambda: view.content_source_select.is_displayed, timeout=10, delay=1)
-        sleep(2)
+        waits.widget_enabled(view.content_source_select)
         view.content_source_select.fill(content_source)
 
         # Assign multiple CVEnvs
@@ -341,13 +340,12 @@ class HostEntity(BaseEntity):
         """
         view = self._select_action('Schedule Remote Job', entities_list)
         view.fill(values)
-        sleep(2)
+        waits.widget_enabled(view.submit)
         view.submit.click()
         view.flash.assert_no_error()
         view.flash.dismiss()
         status_view = HostsJobInvocationStatusView(self.browser)
-        sleep(2)
-        self.browser.plugin.ensure_page_safe()
+        waits.wizard_step_rendered(status_view)
         status_view.wait_displayed()
         if wait_for_results:
             status_view.wait_for_result(timeout=timeout)
@@ -375,7 +373,7 @@ class HostEntity(BaseEntity):
         using the checkbox from table header
         """
         view = self._select_action('Delete Hosts', entities_list)
-        sleep(1)
+        waits.widget_enabled(view.submit)
         view.submit.click()
         view.flash.assert_no_error()
         view.flash.dismiss()
@@ -1,8 +1,6 @@
-import time
-
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 
+from airgun import waits
 from airgun.entities.all_hosts import AllHostsEntity
 from airgun.entities.host import HostEntity
 from airgun.navigation import NavigateStepWithWait as NavigateStep, navigator
@@ -27,6 +25,7 @@ from airgun.views.host_new import (
 )
 from airgun.views.hostgroup import HostGroupEditView
 from airgun.views.job_invocation import JobInvocationCreateView, JobInvocationStatusView
+from airgun.waits import wait_for
 
 available_param_types = ['string', 'boolean', 'integer', 'real', 'array', 'hash', 'yaml', 'json']
 
@@ -94,6 +93,7 @@ class NewHostEntity(HostEntity):
         view.search(entity_name)
         view.table.row(name=entity_name)[6].widget.item_select('Delete')
         self.browser.handle_alert()
+        self.session.link_cache.invalidate(entity_name, type(self))
         self.browser.refresh()
 
     def run_bootc_job(self, entity_name, job_name, job_options=None):
@@ -272,7 +272,7 @@ class NewHostEntity(HostEntity):
                     self.browser.plugin.ensure_page_safe()
                     if view.host_collection_table.row_count == 0:
                         raise ValueError(f'{host_col} not found in host collections!')
-                    time.sleep(3)
+                    waits.page_stable(self.browser)
                     # Select the host collection via checkbox in the table
                     view.host_collection_table[0][0].widget.click()
             else:
@@ -281,7 +281,7 @@ class NewHostEntity(HostEntity):
                 self.browser.plugin.ensure_page_safe()
                 if view.host_collection_table.row_count == 0:
                     raise ValueError(f'{host_collection_name} not found in host collections!')
-                time.sleep(3)
+                waits.page_stable(self.browser)
                 # Select the host collection via checkbox in the table
                 view.host_collection_table[0][0].widget.click()
         else:
@@ -337,7 +337,7 @@ class NewHostEntity(HostEntity):
                     self.browser.plugin.ensure_page_safe()
                     if not view.host_collection_table.is_displayed:
                         raise ValueError(f"{host_col} not assigned to host, thus can't remove it!")
-                    time.sleep(3)
+                    waits.page_stable(self.browser)
                     # Select the host collection via checkbox in the table
                     view.host_collection_table[0][0].widget.click()
             else:
@@ -348,7 +348,7 @@ class NewHostEntity(HostEntity):
                     raise ValueError(
                         f"{host_collection_name} not assigned to host, thus can't remove it!"
                     )
-                time.sleep(3)
+                waits.page_stable(self.browser)
                 # Select the host collection via checkbox in the table
                 view.host_collection_table[0][0].widget.click()
         else:
@@ -651,9 +651,9 @@ class NewHostEntity(HostEntity):
         """Get all repository sets available for host"""
         view = self.navigate_to(self, 'NewDetails', entity_name=entity_name)
         view.wait_displayed()
+        before = waits.fingerprint(view.content.repository_sets.table)
         view.content.repository_sets.searchbar.fill(search)
-        self.browser.plugin.ensure_page_safe()
-        time.sleep(3)
+        waits.search_results_refreshed(view.content.repository_sets.table, before)
         return view.content.repository_sets.table.read()
 
     def override_repo_sets(self, entity_name, repo_set, action):
@@ -1315,6 +1315,7 @@ class ShowNewHostDetails(NavigateStep):
     """
 
     VIEW = NewHostDetailsView
+    LINK_KEY = ('entity_name',)
 
     def prerequisite(self, *args, **kwargs):
         return self.navigate_to(self.obj, 'NewUIAll')
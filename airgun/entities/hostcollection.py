@@ -1,8 +1,6 @@
-import time
-
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 
+from airgun import waits
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
@@ -20,7 +18,7 @@ from airgun.views.job_invocation import (
     JobInvocationCreateView,
     JobInvocationStatusView,
 )
-from airgun.views.task import TaskDetailsView
+from airgun.waits import wait_for
 
 
 class HostCollectionEntity(BaseEntity):
@@ -114,10 +112,10 @@ class HostCollectionEntity(BaseEntity):
             job_create_view.fill(job_values)
             job_create_view.submit.click()
 
-        # wait for the job deatils to load
-        time.sleep(3)
         # After this step the user is redirected to job status view.
         job_status_view = JobInvocationStatusView(view.browser)
+        # wait for the job details to load
+        waits.wizard_step_rendered(job_status_view)
         wait_for(
             lambda: job_status_view.status.read()['In Progress'] != 1,
             timeout=300,
@@ -239,9 +237,7 @@ class HostCollectionEntity(BaseEntity):
         view.content_view.fill(content_view)
         view.assign.click()
         view.dialog.confirm_dialog.click()
-        task_view = TaskDetailsView(self.browser)
-        task_view.wait_for_result()
-        return task_view.read()
+        return self.session.task.wait_for_task_details().read()
 
 
 @navigator.register(HostCollectionEntity, 'All')
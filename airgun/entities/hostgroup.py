@@ -108,7 +108,7 @@ class HostGroupEntity(BaseEntity):
         return view.ansible_roles.resources.read_assigned_values(values)
 
 
-@navigator.register(HostGroupEntity, 'All')
+@navigator.register(HostGroupEntity, 'All', url='/hostgroups')
 class ShowAllHostGroups(NavigateStep):
     """Navigate to All Host Groups page"""
 
@@ -120,7 +120,7 @@ class ShowAllHostGroups(NavigateStep):
         self.view.wait_displayed()
 
 
-@navigator.register(HostGroupEntity, 'New')
+@navigator.register(HostGroupEntity, 'New', url='/hostgroups/new')
 class AddNewHostGroup(NavigateStep):
     """Navigate to Create Host Group page"""
 
@@ -67,7 +67,7 @@ class HTTPProxyEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(HTTPProxyEntity, 'All')
+@navigator.register(HTTPProxyEntity, 'All', url='/http_proxies')
 class ShowAllHTTPProxy(NavigateStep):
     """Navigate to All http-proxy page"""
 
@@ -78,7 +78,7 @@ class ShowAllHTTPProxy(NavigateStep):
         self.view.menu.select('Infrastructure', 'HTTP proxies')
 
 
-@navigator.register(HTTPProxyEntity, 'New')
+@navigator.register(HTTPProxyEntity, 'New', url='/http_proxies/new')
 class AddNewHTTPProxy(NavigateStep):
     """Navigate to Create HTTP Proxy page"""
 
@@ -1,8 +1,6 @@
-import time
-
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 
+from airgun import waits
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
@@ -12,7 +10,7 @@ from airgun.views.job_invocation import (
     JobInvocationStatusView,
     JobInvocationsView,
 )
-from airgun.views.task import TaskDetailsView
+from airgun.waits import wait_for
 
 
 class JobInvocationEntity(BaseEntity):
@@ -34,31 +32,55 @@ class JobInvocationEntity(BaseEntity):
         view = self.navigate_to(self, 'Job Status', entity_name=entity_name, host_name=host_name)
         return view.read(widget_names=widget_names)
 
-    def wait_job_invocation_state(self, entity_name, host_name, expected_state='succeeded'):
-        """Check job invocation state from table view"""
-        view = self.navigate_to(self, 'All')
-        view.search(f'host = {host_name}')
+    def wait_job_invocation_state(
+        self, entity_name, host_name, expected_state='succeeded', handle=False
+    ):
+        """Check job invocation state from table view
 
+        :param handle: return :class:`airgun.operations.Operation` handle of the
+            wait instead of waiting
+        """
+        view = self.navigate_to(self, 'All')
+        query = f'host = {host_name}'
+        view.search(query)
+
+        def in_expected_state():
+            return view.table.row(description=entity_name)['Status'].read() == expected_state
+
+        if handle:
+
+            def check():
+                # the page is reloaded between the checks, searching again
+                # both restores the filter and reads the current state
+                view.search(query)
+                return in_expected_state()
+
+            return self.session.operations.start(
+                f'job invocation {entity_name} {expected_state}',
+                check,
+                timeout=300,
+                delay=10,
+                handle_exception=True,
+            )
         wait_for(
-            lambda: view.table.row(description=entity_name)['Status'].read() == expected_state,
+            in_expected_state,
             timeout=300,
             delay=10,
             fail_func=view.browser.refresh,
             logger=view.logger,
         )
+        return None
 
     def submit_prefilled_view(self):
         """This entity loads pre filled job invocation view and submits it."""
-        time.sleep(3)
         view = JobInvocationCreateView(self.browser)
-        time.sleep(3)
+        waits.wizard_step_rendered(view)
         view.submit.click()
 
     def get_job_category_and_template(self):
         """Reads selected job category and template for job invocation."""
-        time.sleep(3)
         view = JobInvocationCreateView(self.browser)
-        time.sleep(3)
+        waits.wizard_step_rendered(view.category_and_template)
         read_values = {
             'job_category': view.category_and_template.job_category.read(),
             'job_template': view.category_and_template.job_template_text_input.read(),
@@ -67,13 +89,11 @@ class JobInvocationEntity(BaseEntity):
 
     def get_targeted_hosts(self):
         """Read targeted hosts for job invocation."""
-        time.sleep(3)
         view = JobInvocationCreateView(self.browser)
-        time.sleep(3)
+        waits.wizard_step_rendered(view)
         if view.next_button.is_displayed and view.next_button.is_enabled:
             view.next_button.click()
-            self.browser.plugin.ensure_page_safe()
-            time.sleep(3)
+            waits.wizard_step_rendered(view.target_hosts_and_inputs)
         return view.target_hosts_and_inputs.read()
 
     def read_hostgroups(self):
@@ -93,8 +113,7 @@ class JobInvocationEntity(BaseEntity):
         view = self.navigate_to(self, 'Job Status', entity_name=entity_name, host_name=host_name)
         wait_for(lambda: view.overview.hosts_table.is_displayed, timeout=10)
         view.overview.hosts_table.row(host=host_name)['Actions'].widget.fill('Host task')
-        view = TaskDetailsView(self.browser)
-        view.wait_for_result()
+        view = self.session.task.wait_for_task_details()
         view.task.dynflow_console.click()
         self.browser.switch_to_window(self.browser.window_handles[1])
         console = DynflowConsoleView(self.browser)
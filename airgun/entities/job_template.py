@@ -1,5 +1,4 @@
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
@@ -9,6 +8,7 @@ from airgun.views.job_template import (
     JobTemplateEditView,
     JobTemplatesView,
 )
+from airgun.waits import wait_for
 
 
 class JobTemplateEntity(BaseEntity):
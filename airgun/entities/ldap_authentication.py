@@ -67,7 +67,7 @@ class LDAPAuthenticationEntity(BaseEntity):
             return getattr(view, auth_source_type.lower()).count
 
 
-@navigator.register(LDAPAuthenticationEntity, 'All')
+@navigator.register(LDAPAuthenticationEntity, 'All', url='/auth_sources')
 class ShowAllLDAPSources(NavigateStep):
     """Navigate to All LDAP Authentication sources screen."""
 
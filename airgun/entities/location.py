@@ -50,7 +50,7 @@ class LocationEntity(BaseEntity):
         self.navigate_to(self, 'Context', loc_name=loc_name)
 
 
-@navigator.register(LocationEntity, 'All')
+@navigator.register(LocationEntity, 'All', url='/locations')
 class ShowAllLocations(NavigateStep):
     """Navigate to All Locations page"""
 
@@ -61,7 +61,7 @@ class ShowAllLocations(NavigateStep):
         self.view.menu.select('Administer', 'Locations')
 
 
-@navigator.register(LocationEntity, 'New')
+@navigator.register(LocationEntity, 'New', url='/locations/new')
 class AddNewLocation(NavigateStep):
     """Navigate to Create Location page"""
 
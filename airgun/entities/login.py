@@ -14,7 +14,14 @@ class LoginEntity(BaseEntity):
         view.fill(values)
         view.submit.click()
 
+    def is_logged_in(self):
+        """Return whether the browser holds a valid user session, i.e. it was
+        not redirected to the login form.
+        """
+        return not LoginView(self.browser).username.is_displayed
+
     def logout(self):
+        self.session.forget_cached_login()
         view = BaseLoggedInView(self.browser)
         view.flash.assert_no_error()
         view.flash.dismiss()
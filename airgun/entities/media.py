@@ -42,7 +42,7 @@ class MediaEntity(BaseEntity):
         view.table.row(name=entity_name)['Actions'].widget.click(handle_alert=True)
 
 
-@navigator.register(MediaEntity, 'All')
+@navigator.register(MediaEntity, 'All', url='/media')
 class ShowAllMedium(NavigateStep):
     """Navigate to All Medium screen."""
 
@@ -53,7 +53,7 @@ class ShowAllMedium(NavigateStep):
         self.view.menu.select('Hosts', 'Provisioning Setup', 'Installation Media')
 
 
-@navigator.register(MediaEntity, 'New')
+@navigator.register(MediaEntity, 'New', url='/media/new')
 class AddNewMedia(NavigateStep):
     """Navigate to Create new Media screen."""
 
@@ -1,9 +1,8 @@
-from wait_for import wait_for
-
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
 from airgun.views.modulestream import ModuleStreamsDetailsView, ModuleStreamView
+from airgun.waits import wait_for
 
 
 class ModuleStreamEntity(BaseEntity):
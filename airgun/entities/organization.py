@@ -1,5 +1,4 @@
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
@@ -11,6 +10,7 @@ from airgun.views.organization import (
     OrganizationsView,
     SelectOrganizationContextView,
 )
+from airgun.waits import wait_for
 
 
 class OrganizationEntity(BaseEntity):
@@ -56,7 +56,7 @@ class OrganizationEntity(BaseEntity):
         self.navigate_to(self, 'Context', org_name=org_name)
 
 
-@navigator.register(OrganizationEntity, 'All')
+@navigator.register(OrganizationEntity, 'All', url='/organizations')
 class ShowAllOrganizations(NavigateStep):
     """Navigate to All Organizations page"""
 
@@ -67,7 +67,7 @@ class ShowAllOrganizations(NavigateStep):
         self.view.menu.select('Administer', 'Organizations')
 
 
-@navigator.register(OrganizationEntity, 'New')
+@navigator.register(OrganizationEntity, 'New', url='/organizations/new')
 class AddNewOrganization(NavigateStep):
     """Navigate to Create Organization page"""
 
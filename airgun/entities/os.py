@@ -49,7 +49,7 @@ class OperatingSystemEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(OperatingSystemEntity, 'All')
+@navigator.register(OperatingSystemEntity, 'All', url='/operatingsystems')
 class ShowAllOperatingSystems(NavigateStep):
     """Navigate to All Operating Systems page"""
 
@@ -60,7 +60,7 @@ class ShowAllOperatingSystems(NavigateStep):
         self.view.menu.select('Hosts', 'Provisioning Setup', 'Operating Systems')
 
 
-@navigator.register(OperatingSystemEntity, 'New')
+@navigator.register(OperatingSystemEntity, 'New', url='/operatingsystems/new')
 class AddNewOperatingSystem(NavigateStep):
     """Navigate to Create Operating System page"""
 
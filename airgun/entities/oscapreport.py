@@ -1,5 +1,3 @@
-from wait_for import wait_for
-
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
@@ -8,6 +6,7 @@ from airgun.views.oscapreport import (
     SCAPReportDetailsView,
     SCAPReportView,
 )
+from airgun.waits import wait_for
 
 
 class OSCAPReportEntity(BaseEntity):
@@ -77,7 +77,7 @@ class PartitionTableEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(PartitionTableEntity, 'All')
+@navigator.register(PartitionTableEntity, 'All', url='/templates/ptables')
 class ShowAllPartitionTables(NavigateStep):
     """Navigate to All Partition Tables page"""
 
@@ -88,7 +88,7 @@ class ShowAllPartitionTables(NavigateStep):
         self.view.menu.select('Hosts', 'Templates', 'Partition Tables')
 
 
-@navigator.register(PartitionTableEntity, 'New')
+@navigator.register(PartitionTableEntity, 'New', url='/templates/ptables/new')
 class AddNewPartitionTable(NavigateStep):
     """Navigate to Create Partition Table page"""
 
@@ -14,7 +14,6 @@ from airgun.views.product import (
     ProductTaskDetailsView,
     ProductVerifyContentChecksum,
 )
-from airgun.views.task import TaskDetailsView
 
 
 class ProductEntity(BaseEntity):
@@ -42,6 +41,8 @@ class ProductEntity(BaseEntity):
         view = self.navigate_to(self, 'Edit', entity_name=entity_name)
         view.actions.fill('Remove Product')
         self.browser.handle_alert()
+        # drops links of the product's repositories as well
+        self.session.link_cache.invalidate(entity_name)
         view.flash.assert_no_error()
         view.flash.dismiss()
 
@@ -58,6 +59,8 @@ class ProductEntity(BaseEntity):
     def update(self, entity_name, values):
         """Updates product from UI"""
         view = self.navigate_to(self, 'Edit', entity_name=entity_name)
+        if 'details.name' in values:
+            self.session.link_cache.invalidate(entity_name)
         filled_values = view.fill(values)
         view.flash.assert_no_error()
         view.flash.dismiss()
@@ -121,9 +124,7 @@ class ProductEntity(BaseEntity):
             view.complete.click()
         view.sync.click()
         view.task.click()
-        view = TaskDetailsView(view.browser)
-        view.wait_for_result()
-        return view.read()
+        return self.session.task.wait_for_task_details().read()
 
     def verify_content_checksum(self, entities_list):
         """Verify Content Checksum for product/products
@@ -137,9 +138,7 @@ class ProductEntity(BaseEntity):
             entities_list=entities_list,
         )
         view.task_alert.click()
-        view = TaskDetailsView(view.browser)
-        view.wait_for_result()
-        return view.read()
+        return self.session.task.wait_for_task_details().read()
 
 
 @navigator.register(ProductEntity, 'All')
@@ -174,6 +173,7 @@ class EditProduct(NavigateStep):
     """
 
     VIEW = ProductEditView
+    LINK_KEY = ('entity_name',)
 
     def prerequisite(self, *args, **kwargs):
         return self.navigate_to(self.obj, 'All')
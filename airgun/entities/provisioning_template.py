@@ -97,7 +97,7 @@ class ProvisioningTemplateEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(ProvisioningTemplateEntity, 'All')
+@navigator.register(ProvisioningTemplateEntity, 'All', url='/templates/provisioning_templates')
 class ShowAllProvisioningTemplates(NavigateStep):
     """Navigate to all Provisioning Templates screen."""
 
@@ -108,7 +108,7 @@ class ShowAllProvisioningTemplates(NavigateStep):
         self.view.menu.select('Hosts', 'Templates', 'Provisioning Templates')
 
 
-@navigator.register(ProvisioningTemplateEntity, 'New')
+@navigator.register(ProvisioningTemplateEntity, 'New', url='/templates/provisioning_templates/new')
 class AddNewProvisioningTemplate(NavigateStep):
     """Navigate to Create new Provisioning Template screen."""
 
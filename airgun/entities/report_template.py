@@ -1,5 +1,4 @@
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
@@ -11,6 +10,7 @@ from airgun.views.report_template import (
     ReportTemplateGenerateView,
     ReportTemplatesView,
 )
+from airgun.waits import wait_for
 
 
 class ReportTemplateEntity(BaseEntity):
@@ -77,9 +77,12 @@ class ReportTemplateEntity(BaseEntity):
         view.table.row(name=entity_name)['Actions'].widget.fill('Export')
         return self.browser.save_downloaded_file()
 
-    def generate(self, entity_name, values={}):
+    def generate(self, entity_name, values={}, handle=False):
         """Generate report template
 
+        :param handle: return :class:`airgun.operations.Operation` handle of the
+            generation instead of waiting for it, its result is the path to
+            saved file
         :return str: path to saved file
         """
         view = self.navigate_to(self, 'Generate', entity_name=entity_name)
@@ -88,6 +91,21 @@ class ReportTemplateEntity(BaseEntity):
         view.flash.assert_no_error()
         view = ReportTemplateGeneratedView(self.browser)
         view.wait_displayed()
+        if handle:
+
+            def check():
+                if view.download_button.is_displayed:
+                    return True
+                if not view.is_displayed:
+                    raise RuntimeError(f'Page of generated report {entity_name} was not reopened')
+                return False
+
+            return self.session.operations.start(
+                f'generate {entity_name}',
+                check,
+                finish=self.browser.save_downloaded_file,
+                timeout=300,
+            )
         wait_for(
             lambda: view.download_button.is_displayed,
             timeout=300,
@@ -2,7 +2,6 @@ from contextlib import suppress
 import re
 
 from selenium.common.exceptions import NoSuchElementException
-from wait_for import wait_for
 
 from airgun.entities.base import BaseEntity
 from airgun.entities.product import ProductEntity
@@ -16,6 +15,7 @@ from airgun.views.repository import (
     RepositoryEditView,
     RepositoryPackagesView,
 )
+from airgun.waits import wait_for
 
 
 class RepositoryEntity(BaseEntity):
@@ -63,6 +63,8 @@ class RepositoryEntity(BaseEntity):
         if values.get('repo_content.http_proxy_policy') == 'Global Default':
             values['repo_content.http_proxy_policy'] = self.global_default_http_proxy
         view = self.navigate_to(self, 'Edit', product_name=product_name, entity_name=entity_name)
+        if 'name' in values:
+            self.session.link_cache.invalidate(entity_name, type(self))
         view.fill(values)
         # Wait for all EditableEntry auto-saves to complete and flash messages to stabilize
         # EditableEntry widgets auto-save individually, so we need to wait for UI to settle
@@ -105,6 +107,7 @@ class RepositoryEntity(BaseEntity):
         view.table.row(name=entity_name)[0].fill(True)
         view.delete.click()
         self.browser.handle_alert()
+        self.session.link_cache.invalidate(entity_name, type(self))
         view.flash.assert_no_error()
         view.flash.dismiss()
 
@@ -144,6 +147,7 @@ class ShowAllRepositories(NavigateStep):
     """
 
     VIEW = RepositoriesView
+    LINK_KEY = ('product_name',)
 
     def am_i_here(self, *args, **kwargs):
         product_name = kwargs.get('product_name')
@@ -185,6 +189,7 @@ class EditRepository(NavigateStep):
     """
 
     VIEW = RepositoryEditView
+    LINK_KEY = ('product_name', 'entity_name')
 
     def am_i_here(self, *args, **kwargs):
         prod_name = kwargs.get('product_name')
@@ -1,9 +1,8 @@
-from wait_for import wait_for
-
 from airgun.entities.base import BaseEntity
 from airgun.entities.rhai.base import InsightsNavigateStep
 from airgun.navigation import NavigateStep, navigator
 from airgun.views.rhai import InventoryAllHosts, InventoryHostDetails
+from airgun.waits import wait_for
 
 
 class InventoryHostEntity(BaseEntity):
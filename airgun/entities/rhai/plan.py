@@ -1,11 +1,11 @@
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 
 from airgun.entities.base import BaseEntity
 from airgun.entities.rhai.base import InsightsNavigateStep
 from airgun.navigation import NavigateStep, navigator
 from airgun.views.job_invocation import JobInvocationCreateView, JobInvocationStatusView
 from airgun.views.rhai import AddPlanView, AllPlansView, PlanEditView, PlanModalWindow
+from airgun.waits import wait_for
 
 
 class PlanEntity(BaseEntity):
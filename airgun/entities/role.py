@@ -52,7 +52,7 @@ class RoleEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(RoleEntity, 'All')
+@navigator.register(RoleEntity, 'All', url='/roles')
 class ShowAllRoles(NavigateStep):
     """Navigate to All Roles page"""
 
@@ -63,7 +63,7 @@ class ShowAllRoles(NavigateStep):
         self.view.menu.select('Administer', 'Roles')
 
 
-@navigator.register(RoleEntity, 'New')
+@navigator.register(RoleEntity, 'New', url='/roles/new')
 class AddNewRole(NavigateStep):
     """Navigate to Create New Role page"""
 
@@ -1,10 +1,9 @@
-from wait_for import wait_for
-
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
 from airgun.views.common import BaseLoggedInView
 from airgun.views.settings import SettingsView
+from airgun.waits import wait_for
 
 
 class SettingsEntity(BaseEntity):
@@ -43,7 +42,7 @@ class SettingsEntity(BaseEntity):
         return view.permission_denied.text
 
 
-@navigator.register(SettingsEntity, 'All')
+@navigator.register(SettingsEntity, 'All', url='/settings')
 class ShowAllSettings(NavigateStep):
     """Navigate to All Settings page"""
 
@@ -42,7 +42,7 @@ class SubnetEntity(BaseEntity):
         view.table.row(name=entity_name)['Actions'].widget.click(handle_alert=True)
 
 
-@navigator.register(SubnetEntity, 'All')
+@navigator.register(SubnetEntity, 'All', url='/subnets')
 class ShowAllSubnets(NavigateStep):
     """Navigate to All Subnets screen."""
 
@@ -53,7 +53,7 @@ class ShowAllSubnets(NavigateStep):
         self.view.menu.select('Infrastructure', 'Subnets')
 
 
-@navigator.register(SubnetEntity, 'New')
+@navigator.register(SubnetEntity, 'New', url='/subnets/new')
 class AddNewSubnet(NavigateStep):
     """Navigate to Create new Subnet screen."""
 
@@ -1,7 +1,11 @@
+from urllib.parse import urlencode
+
 from navmazing import NavigateToSibling
-from wait_for import TimedOutError, wait_for
+from wait_for import TimedOutError
 
 from airgun.entities.base import BaseEntity
+from airgun.exceptions import APIRequestError
+from airgun.link_cache import current_org
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
 from airgun.views.subscription import (
@@ -12,13 +16,14 @@ from airgun.views.subscription import (
     SubscriptionListView,
     SubscriptionManageColumnsView,
 )
+from airgun.waits import wait_for
 
 
 class SubscriptionEntity(BaseEntity):
     endpoint_path = '/subscriptions'
 
     def _wait_for_process_to_finish(
-        self, has_manifest=False, timeout=600, ignore_error_messages=None
+        self, has_manifest=False, timeout=600, ignore_error_messages=None, handle=False
     ):
         """Helper ensuring that task (upload / delete manifest / subscription)
         has finished. Run after action invoking task to leave Satellite
@@ -28,22 +33,37 @@ class SubscriptionEntity(BaseEntity):
         :param has_manifest: Should manifest exist after task ended?
         :param timeout: Waiting timeout
         :param ignore_error_messages: A List of strings representing the error messages to ignore.
+        :param handle: Return :class:`airgun.operations.Operation` handle of the
+            task instead of waiting for it.
         """
         view = SubscriptionListView(self.browser, logger=self.browser.logger)
+
+        def finish():
+            view.flash.dismiss()
+            view.flash.assert_no_error(ignore_messages=ignore_error_messages)
+            wait_for(
+                lambda: self._manifest_present() == has_manifest,
+                handle_exception=True,
+                timeout=60,
+                logger=view.logger,
+            )
+
+        if handle:
+            return self.session.operations.start(
+                'subscription task',
+                lambda: not view.progressbar.is_displayed,
+                finish=finish,
+                timeout=timeout,
+                handle_exception=True,
+            )
         wait_for(
             lambda: not view.progressbar.is_displayed,
             handle_exception=True,
             timeout=timeout,
             logger=view.progressbar.logger,
         )
-        view.flash.dismiss()
-        view.flash.assert_no_error(ignore_messages=ignore_error_messages)
-        wait_for(
-            lambda: self.has_manifest == has_manifest,
-            handle_exception=True,
-            timeout=60,
-            logger=view.logger,
-        )
+        finish()
+        return None
 
     @property
     def has_manifest(self):
@@ -63,32 +83,72 @@ class SubscriptionEntity(BaseEntity):
         except TimedOutError:
             return None
 
-    def add_manifest(self, manifest_file, ignore_error_messages=None):
+    def manifest_state(self):
+        """Is there manifest present in current organization, according to the
+        organization API? Unlike :attr:`has_manifest`, no page or modal is
+        opened, the API is requested by the logged in session of the browser.
+
+        :return: boolean value indicating whether manifest is present, None if
+            the organization API can't tell (e.g. due to missing permissions)
+        """
+        org = current_org(self.browser)
+        if org is None:
+            return None
+        query = {'search': f'name = "{org}"', 'per_page': 1}
+        try:
+            orgs = self.browser.api_get(f'/katello/api/organizations?{urlencode(query)}')
+            if not orgs.get('results'):
+                return None
+            org = self.browser.api_get(f'/katello/api/organizations/{orgs["results"][0]["id"]}')
+        except APIRequestError:
+            return None
+        # the manifest is imported if the Candlepin owner of the organization
+        # has an upstream consumer
+        owner = org.get('owner_details')
+        return bool(owner.get('upstreamConsumer')) if owner else None
+
+    def _manifest_present(self):
+        """Return :meth:`manifest_state`, or :attr:`has_manifest` if the API
+        can't tell.
+        """
+        state = self.manifest_state()
+        return self.has_manifest if state is None else state
+
+    def add_manifest(self, manifest_file, ignore_error_messages=None, handle=False):
         """Upload manifest file
         :param manifest_file: Path to manifest file
         :param ignore_error_messages: List of error messages to ignore
+        :param handle: Return :class:`airgun.operations.Operation` handle of the
+            upload instead of waiting for it
         """
         view = self.navigate_to(self, 'Manage Manifest')
         view.wait_animation_end()
         view.manifest.manifest_file.fill(manifest_file)
-        self._wait_for_process_to_finish(
-            has_manifest=True, ignore_error_messages=ignore_error_messages
+        return self._wait_for_process_to_finish(
+            has_manifest=True, ignore_error_messages=ignore_error_messages, handle=handle
         )
 
-    def refresh_manifest(self):
-        """Refresh manifest"""
+    def refresh_manifest(self, handle=False):
+        """Refresh manifest
+        :param handle: Return :class:`airgun.operations.Operation` handle of the
+            refresh instead of waiting for it
+        """
         view = self.navigate_to(self, 'Manage Manifest')
         view.wait_animation_end()
         view.manifest.refresh_button.click()
-        self._wait_for_process_to_finish(has_manifest=True, timeout=1200)
+        return self._wait_for_process_to_finish(has_manifest=True, timeout=1200, handle=handle)
 
-    def delete_manifest(self, ignore_error_messages=None):
-        """Delete manifest from current organization"""
+    def delete_manifest(self, ignore_error_messages=None, handle=False):
+        """Delete manifest from current organization
+        :param ignore_error_messages: List of error messages to ignore
+        :param handle: Return :class:`airgun.operations.Operation` handle of the
+            deletion instead of waiting for it
+        """
         view = self.navigate_to(self, 'Delete Manifest Confirmation')
         view.wait_animation_end()
         view.delete_button.click()
-        self._wait_for_process_to_finish(
-            has_manifest=False, ignore_error_messages=ignore_error_messages
+        return self._wait_for_process_to_finish(
+            has_manifest=False, ignore_error_messages=ignore_error_messages, handle=handle
         )
 
     def read_delete_manifest_message(self):
@@ -1,8 +1,11 @@
-from wait_for import wait_for
+import time
+
+from wait_for import TimedOutError
 
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStepWithWait as NavigateStep, navigator
 from airgun.views.sync_status import SyncStatusView
+from airgun.waits import scale_timeout, wait_for
 
 
 class SyncStatusEntity(BaseEntity):
@@ -14,7 +17,9 @@ class SyncStatusEntity(BaseEntity):
         view.show_syncing_only.fill(show_syncing_only)
         return view.read(widget_names=widget_names)
 
-    def synchronize(self, repository_paths, synchronous=True, timeout=3600):
+    def synchronize(
+        self, repository_paths, synchronous=True, timeout=3600, on_complete=None, handle=False
+    ):
         """Synchronize repositories
 
         :param repository_paths: A list of repositories to synchronize
@@ -22,6 +27,12 @@ class SyncStatusEntity(BaseEntity):
             by a list or tuple.
         :param synchronous: bool if to wait for all repos sync, defaults to True.
         :param timeout: time to wait for all repositories to be synchronized.
+        :param on_complete: optional callable, called with path and result of
+            every repository as soon as its synchronization finishes (when
+            ``synchronous`` or ``handle``).
+        :param handle: return :class:`airgun.operations.Operation` handle of the
+            synchronization instead of waiting for it, its result are the
+            results text in Progress / Result columns
 
         Usage::
 
@@ -33,28 +44,140 @@ class SyncStatusEntity(BaseEntity):
 
         :return: the results text in Progress / Result columns
         """
+        view, initial = self._start_synchronization(repository_paths)
+        if handle:
+            return self._synchronization_operation(
+                view, repository_paths, initial, timeout, on_complete
+            )
+        if synchronous:
+            for repository_path, result in self._wait_for_synchronization(
+                view, repository_paths, initial, timeout
+            ):
+                if on_complete is not None:
+                    on_complete(repository_path, result)
+        return [result for _, result in view.table.progress(repository_paths)]
+
+    def iter_synchronize(self, repository_paths, timeout=3600):
+        """Synchronize repositories and yield path and result of every
+        repository as soon as its synchronization finishes, e.g. to publish a
+        content view once its repositories are synchronized, without waiting
+        for the rest.
+
+        :param repository_paths: paths to repositories, same as in
+            :meth:`synchronize`
+        :param timeout: time to wait for all repositories to be synchronized.
+        :return: generator of ``(repository path, result)``
+        """
+        view, initial = self._start_synchronization(repository_paths)
+        yield from self._wait_for_synchronization(view, repository_paths, initial, timeout)
+
+    def _start_synchronization(self, repository_paths):
+        """Select repositories and start synchronization.
+
+        :return: the view and progress of the repositories before the start
+        """
         view = self.navigate_to(self, 'All')
-        repo_rows = [view.table.get_node_from_path(repo_path) for repo_path in repository_paths]
-        for repo_row in repo_rows:
-            repo_row.select(True)
+        view.table.select_nodes(repository_paths)
+        initial = view.table.progress(repository_paths)
         view.synchronize.click()
-        if synchronous:
-            # Wait for sync to start (progress bars appear)
-            wait_for(
-                lambda: any(row.has_progress for row in repo_rows),
-                timeout=60,
-                delay=1,
-                logger=view.logger,
-            )
-            # Wait for sync to finish (progress bars disappear)
-            wait_for(
-                lambda: all(not row.has_progress for row in repo_rows),
-                timeout=timeout,
+        return view, initial
+
+    def _wait_for_synchronization(self, view, repository_paths, initial, timeout):
+        """Poll progress of all repositories by a single call and yield path
+        and result of every repository once it is finished, see
+        :class:`_SynchronizationWatch`.
+        """
+        watch = _SynchronizationWatch(view.table, repository_paths, initial)
+        ready = []
+
+        def started():
+            ready.extend(watch.finished())
+            return watch.started
+
+        # Wait for sync to start (progress bars appear)
+        wait_for(started, timeout=60, delay=1, logger=view.logger)
+        yield from ready
+        deadline = time.monotonic() + scale_timeout(timeout)
+        while not watch.done:
+            # wait_for scales the timeout again
+            remaining = (deadline - time.monotonic()) / scale_timeout(1)
+            # no repository finished since the last poll is not success
+            done, _ = wait_for(
+                watch.finished,
+                timeout=max(remaining, 0),
                 delay=5,
+                fail_condition=[],
                 logger=view.logger,
             )
+            yield from done
+
+    def _synchronization_operation(self, view, repository_paths, initial, timeout, on_complete):
+        """Return handle of started synchronization, polled by the session
+        operations poller.
+        """
+        watch = _SynchronizationWatch(view.table, repository_paths, initial)
+        start_deadline = time.monotonic() + scale_timeout(60)
+
+        def check():
+            for repository_path, result in watch.finished():
+                if on_complete is not None:
+                    on_complete(repository_path, result)
+            if not watch.started and time.monotonic() > start_deadline:
+                raise TimedOutError('Synchronization of repositories did not start')
+            return watch.done
+
+        return self.session.operations.start(
+            'synchronize',
+            check,
+            finish=lambda: [result for _, result in view.table.progress(repository_paths)],
+            timeout=timeout,
+            delay=5,
+        )
 
-        return [row.result for row in repo_rows]
+
+class _SynchronizationWatch:
+    """Progress of synchronization of repositories, polled by a single call.
+    A repository is finished once it has no progress bar and either had one,
+    its result changed or none of the repositories is in progress. No
+    repository is finished before the synchronization started, i.e. any
+    progress bar appeared.
+    """
+
+    def __init__(self, table, repository_paths, initial):
+        self.table = table
+        self.repository_paths = repository_paths
+        self.initial = initial
+        self.seen_progress = [False] * len(repository_paths)
+        self.pending = set(range(len(repository_paths)))
+
+    @property
+    def started(self):
+        return any(self.seen_progress)
+
+    @property
+    def done(self):
+        return not self.pending
+
+    def finished(self):
+        """Poll the progress and return path and result of every repository
+        which finished since the last poll.
+        """
+        progress = self.table.progress(self.repository_paths)
+        for index, (has_progress, _) in enumerate(progress):
+            self.seen_progress[index] = self.seen_progress[index] or has_progress
+        if not self.started:
+            return []
+        quiet = not any(has_progress for has_progress, _ in progress)
+        done = [
+            (index, result)
+            for index, (has_progress, result) in enumerate(progress)
+            if index in self.pending
+            and not has_progress
+            and (self.seen_progress[index] or result != self.initial[index][1] or quiet)
+        ]
+        for index, _ in done:
+            self.pending.discard(index)
+        return [(self.repository_paths[index], result) for index, result in done]
 
 
 @navigator.register(SyncStatusEntity, 'All')
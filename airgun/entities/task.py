@@ -1,13 +1,33 @@
-import time
+from http import HTTPStatus
+import re
+from urllib.parse import urlencode, urlparse
 
+from airgun import waits
 from airgun.entities.base import BaseEntity
+from airgun.exceptions import APIRequestError
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
 from airgun.views.task import TaskDetailsView, TasksView
 
+TASK_ID = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
+# Fields of a task from the tasks API returned by TaskEntity.status()
+TASK_STATUS_FIELDS = (
+    'id',
+    'label',
+    'action',
+    'state',
+    'result',
+    'progress',
+    'pending',
+    'started_at',
+    'ended_at',
+)
+
 
 class TaskEntity(BaseEntity):
     endpoint_path = '/foreman_tasks/tasks'
+    api_path = '/foreman_tasks/api/tasks'
 
     def search(self, value):
         """Search for specific task"""
@@ -24,9 +44,102 @@ class TaskEntity(BaseEntity):
     def read(self, entity_name, widget_names=None):
         """Read specific task values from details page"""
         view = self.navigate_to(self, 'Details', entity_name=entity_name)
-        time.sleep(3)
+        waits.wizard_step_rendered(view)
         return view.read(widget_names=widget_names)
 
+    def status(self, task=None):
+        """Return status of a task from the tasks API, without loading any page.
+
+        :param str optional task: id of the task or search query, e.g.
+            ``label = Actions::Katello::Repository::Sync``, the most recently
+            started matching task is returned. The task displayed by the task
+            details page by default.
+        :return: dict with ``id``, ``label``, ``action``, ``state``, ``result``,
+            ``progress`` (0 to 1), ``pending``, ``started_at`` and ``ended_at``
+            of the task, ``None`` if there is no such task (yet)
+        :raises airgun.exceptions.APIRequestError: if the tasks API request
+            failed
+        """
+        if task is None:
+            task = self.displayed_task_id()
+            if task is None:
+                return None
+        if TASK_ID.fullmatch(task):
+            path = f'{self.api_path}/{task}'
+        else:
+            query = {'search': task, 'per_page': 1, 'sort_by': 'started_at', 'sort_order': 'DESC'}
+            path = f'{self.api_path}?{urlencode(query)}'
+        try:
+            data = self.browser.api_get(path)
+        except APIRequestError as err:
+            if err.status == HTTPStatus.NOT_FOUND:
+                return None
+            raise
+        if 'results' in data:
+            data = data['results'][0] if data['results'] else None
+        if data is None:
+            return None
+        return {field: data.get(field) for field in TASK_STATUS_FIELDS}
+
+    def displayed_task_id(self):
+        """Return id of the task displayed by the task details page, ``None`` if
+        the browser is not on one.
+        """
+        path = urlparse(self.browser.url).path
+        match = TASK_ID.search(path) if path.startswith(self.endpoint_path) else None
+        return match.group() if match else None
+
+    def wait_for_task(self, task=None, timeout=60, delay=1, result='success'):
+        """Wait for a task to finish (stop or pause) by polling the tasks API
+        with backoff, see :meth:`status`. The task details page is not
+        rendered while waiting, read it afterwards only if its details are
+        needed. Failed requests of the tasks API are retried until the timeout.
+
+        :param str optional task: id of the task or search query, the task
+            displayed by the task details page by default
+        :param int timeout: max number of seconds to wait
+        :param int delay: number of seconds between polls (before backoff)
+        :param str optional result: expected result of the task, ``None`` to
+            accept any result
+        :return: status of the finished task
+        """
+        status, _ = waits.wait_for(
+            lambda: self._finished_task(task),
+            timeout=timeout,
+            delay=delay,
+            logger=self.browser.logger,
+        )
+        if result is not None and status['result'] != result:
+            raise AssertionError(
+                f'Task {status["id"]} finished with result {status["result"]}, expected {result}'
+            )
+        return status
+
+    def _finished_task(self, task):
+        try:
+            status = self.status(task)
+        except APIRequestError as err:
+            # e.g. a proxy error while Satellite is busy, try again until the
+            # timeout
+            self.browser.logger.warning('Failed to read status of task %s: %s', task, err)
+            return False
+        if status is not None and status['state'] in ('stopped', 'paused'):
+            return status
+        return False
+
+    def wait_for_task_details(self, timeout=60, result='success'):
+        """Wait for the task displayed by the task details page to finish, see
+        :meth:`wait_for_task`, and return the details page rendered again
+        once it is finished, so it is read only once.
+
+        :return: :class:`airgun.views.task.TaskDetailsView`
+        """
+        self.wait_for_task(timeout=timeout, result=result)
+        self.browser.refresh()
+        view = TaskDetailsView(self.browser)
+        view.wait_displayed()
+        return view
+
     def set_chart_filter(self, chart_name, index=None):
         """Remove filter from searchbox and set filter from specific chart
 
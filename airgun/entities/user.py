@@ -1,10 +1,10 @@
 from navmazing import NavigateToSibling
-from wait_for import wait_for
 
 from airgun.entities.base import BaseEntity
 from airgun.navigation import NavigateStep, navigator
 from airgun.utils import retry_navigation
 from airgun.views.user import UserCreateView, UserDetailsView, UsersView
+from airgun.waits import wait_for
 
 
 class UserEntity(BaseEntity):
@@ -61,7 +61,7 @@ class UserEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(UserEntity, 'All')
+@navigator.register(UserEntity, 'All', url='/users')
 class ShowAllUsers(NavigateStep):
     """Navigate to All Users page"""
 
@@ -72,7 +72,7 @@ class ShowAllUsers(NavigateStep):
         self.view.menu.select('Administer', 'Users')
 
 
-@navigator.register(UserEntity, 'New')
+@navigator.register(UserEntity, 'New', url='/users/new')
 class AddNewUser(NavigateStep):
     """Navigate to Create User page"""
 
@@ -56,7 +56,7 @@ class UserGroupEntity(BaseEntity):
         view.flash.dismiss()
 
 
-@navigator.register(UserGroupEntity, 'All')
+@navigator.register(UserGroupEntity, 'All', url='/usergroups')
 class ShowAllUserGroups(NavigateStep):
     """Navigate to All User Groups page"""
 
@@ -67,7 +67,7 @@ class ShowAllUserGroups(NavigateStep):
         self.view.menu.select('Administer', 'User Groups')
 
 
-@navigator.register(UserGroupEntity, 'New')
+@navigator.register(UserGroupEntity, 'New', url='/usergroups/new')
 class AddNewUserGroup(NavigateStep):
     """Navigate to Create User Group page"""
 
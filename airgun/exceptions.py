@@ -16,4 +16,13 @@ class DestinationNotReachedError(Exception):
     """Raised when navigation destination view was not reached (not dispayed)."""
 
 
+class APIRequestError(Exception):
+    """Raised when a request to Satellite API made by the browser failed."""
+
+    def __init__(self, path, status):
+        super().__init__(f'GET {path} failed with HTTP status {status}')
+        self.path = path
+        self.status = status
+
+
 __all__ = ['InvalidElementStateException']
@@ -0,0 +1,94 @@
+"""Per-session cache of links to entity pages.
+
+Navigating to details of an entity usually means opening the list page,
+searching for the entity and clicking its row. Navigate steps with
+:attr:`airgun.navigation.NavigateStep.LINK_KEY` remember the URL such a click
+led to, once ``am_i_here`` confirmed the navigation got there, and later
+navigations to the same entity open it directly. Links merely seen in table
+rows are not cached, a table does not know which entity and destination its
+links lead to.
+
+Links are cached per (entity class, entity names, current organization) in a
+least recently used cache of ``settings.airgun.link_cache_size`` entries (``0``
+disables it). A cached link which does not lead to the entity any more is
+dropped and the regular navigation is used, entity methods which delete or
+rename an entity drop its links by :meth:`LinkCache.invalidate`.
+"""
+
+from collections import OrderedDict
+
+from airgun import settings
+
+# Name of current organization, from the context selector
+CURRENT_ORG_SCRIPT = """
+    var el = document.querySelector(
+        "[data-ouia-component-id='taxonomy-context-selector-organization']");
+    return el ? el.textContent.trim() : null;
+    """
+
+
+def current_org(browser):
+    """Return name of organization selected in the context selector, ``None``
+    if there is no context selector on the page.
+    """
+    return browser.execute_script(CURRENT_ORG_SCRIPT, silent=True) or None
+
+
+class LinkCache:
+    """Least recently used cache of URLs of entity pages."""
+
+    def __init__(self, size):
+        """
+        :param int size: max number of cached links, ``0`` disables caching
+        """
+        self.size = size
+        self._links = OrderedDict()
+
+    def __len__(self):
+        return len(self._links)
+
+    def get(self, key):
+        """Return link cached for ``key`` or ``None``."""
+        link = self._links.get(key)
+        if link is not None:
+            self._links.move_to_end(key)
+        return link
+
+    def store(self, key, link):
+        """Cache ``link`` for ``key``, dropping the least recently used link
+        if the cache is full.
+        """
+        if not self.size:
+            return
+        self._links[key] = link
+        self._links.move_to_end(key)
+        while len(self._links) > self.size:
+            self._links.popitem(last=False)
+
+    def discard(self, key):
+        """Drop link cached for ``key``, if any."""
+        self._links.pop(key, None)
+
+    def invalidate(self, name, entity_class=None):
+        """Drop links of entities identified by ``name`` (e.g. a deleted
+        product, which also drops links of its repositories).
+
+        :param str name: entity name
+        :param type optional entity_class: drop only links of this entity
+            class, its subclasses and base classes
+        """
+        for key in list(self._links):
+            key_class, names, _ = key
+            if name not in names:
+                continue
+            if (
+                entity_class is None
+                or issubclass(key_class, entity_class)
+                or issubclass(entity_class, key_class)
+            ):
+                del self._links[key]
+
+
+def get_link_cache():
+    """Return :class:`LinkCache` configured by airgun settings."""
+    return LinkCache(int(settings.airgun.link_cache_size or 0))
@@ -0,0 +1,153 @@
+"""On-disk cache of satellite UI login cookies.
+
+Every :class:`airgun.session.Session` without a ``session_cookie`` logs in
+through the login form. When ``settings.airgun.login_cache_dir`` is set, the
+``_session_id`` cookie obtained by a successful login is stored there per
+(hostname, user, pytest-xdist worker) and reused by later sessions until it
+expires.
+
+Satellite keeps some state in the user session (e.g. current organization and
+location) and logging out ends it, so a cookie is never used by two live
+sessions at once: entries are kept per pytest-xdist worker
+(``PYTEST_XDIST_WORKER``) and a cookie claimed by a live session of the
+process is not handed to another one until it is released.
+
+Several processes may use the same directory. Entries are written atomically,
+so readers never see a partially written file, and an entry is removed only if
+it still holds the cookie that was found to be stale.
+"""
+
+from contextlib import suppress
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from airgun import settings
+
+LOGGER = logging.getLogger(__name__)
+
+# cookies used by live sessions of this process
+_claimed = set()
+
+
+def _worker():
+    """Return name of the pytest-xdist worker running this process."""
+    return os.environ.get('PYTEST_XDIST_WORKER', 'main')
+
+
+class LoginCookieCache:
+    """Stores satellite ``_session_id`` cookies in ``path`` directory, one
+    JSON file per (hostname, user, pytest-xdist worker).
+    """
+
+    def __init__(self, path, ttl):
+        """
+        :param str path: directory to store cookies in, created if missing
+        :param float ttl: number of seconds after which the cookie is
+            considered expired
+        """
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+
+    def _entry_path(self, hostname, user):
+        key = hashlib.sha256(f'{hostname}\0{user}\0{_worker()}'.encode()).hexdigest()
+        return os.path.join(self.path, f'{key}.json')
+
+    def _read(self, hostname, user):
+        try:
+            with open(self._entry_path(hostname, user)) as entry_file:
+                return json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, hostname, user):
+        """Return cached ``_session_id`` of the user and claim it for the
+        caller, ``None`` if there is no valid entry or its cookie is claimed by
+        another live session, see :meth:`release`.
+        """
+        entry = self._read(hostname, user)
+        if entry is None:
+            return None
+        session_id = entry.get('session_id')
+        if entry.get('expires', 0) < time.time():
+            LOGGER.debug('Cached login of user %r at %r has expired', user, hostname)
+            self.invalidate(hostname, user, session_id)
+            return None
+        if session_id in _claimed:
+            LOGGER.debug('Cached login of user %r at %r is used by another session', user, hostname)
+            return None
+        _claimed.add(session_id)
+        return session_id
+
+    def release(self, session_id):
+        """Release ``_session_id`` claimed by :meth:`get` or :meth:`store` once
+        the session using it is closed.
+        """
+        _claimed.discard(session_id)
+
+    def store(self, hostname, user, session_id):
+        """Store ``_session_id`` of the user, replacing existing entry, and
+        claim it for the caller.
+        """
+        _claimed.add(session_id)
+        entry = {
+            'hostname': hostname,
+            'user': user,
+            'session_id': session_id,
+            'expires': time.time() + self.ttl,
+        }
+        # write to a unique temporary file and move it over the entry, so
+        # concurrent readers and writers never see a partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(entry, tmp_file)
+            os.replace(tmp_path, self._entry_path(hostname, user))
+        except OSError:
+            LOGGER.exception('Failed to store login cookie of user %r', user)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def invalidate(self, hostname, user, session_id=None):
+        """Remove entry of the user. If ``session_id`` is passed, the entry is
+        removed only if it still holds that cookie, so a fresh cookie stored
+        by a different process in the meantime is kept.
+        """
+        if session_id is not None:
+            _claimed.discard(session_id)
+        entry_path = self._entry_path(hostname, user)
+        if session_id is None:
+            with suppress(FileNotFoundError):
+                os.remove(entry_path)
+            return
+        # move the entry away first, so a fresh entry stored between reading
+        # and removing it is not removed instead
+        tmp_path = f'{entry_path}.{os.getpid()}.{time.monotonic_ns()}.tmp'
+        try:
+            os.rename(entry_path, tmp_path)
+        except FileNotFoundError:
+            return
+        try:
+            with open(tmp_path) as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            entry = None
+        if entry is not None and entry.get('session_id') != session_id:
+            # a fresh entry, put it back unless an even fresher one was
+            # stored in the meantime
+            with suppress(FileExistsError):
+                os.link(tmp_path, entry_path)
+        os.remove(tmp_path)
+
+
+def get_login_cache():
+    """Return :class:`LoginCookieCache` configured by airgun settings, or
+    ``None`` if login caching is disabled.
+    """
+    if not settings.airgun.login_cache_dir:
+        return None
+    return LoginCookieCache(settings.airgun.login_cache_dir, float(settings.airgun.login_cache_ttl))
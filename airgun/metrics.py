@@ -0,0 +1,130 @@
+"""WebDriver command metrics of UI sessions.
+
+Every airgun call costs a number of webdriver round trips. Each
+:class:`airgun.session.Session` counts the webdriver commands its browser
+executes (``findElement``, ``executeScript``, ``getElementText`` etc.) and
+their latency, per command and per public entity method and navigate step
+which executed them. The metrics are available as ``session.metrics``::
+
+    with Session() as session:
+        session.architecture.read('x86_64')
+        session.metrics.dump('metrics.json')
+"""
+
+import json
+import time
+
+from airgun import tracing
+
+# Upper bounds of latency histogram buckets, in milliseconds
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class CommandStats:
+    """Count, total and max duration and latency histogram of commands."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, duration):
+        """Record a command which took ``duration`` seconds."""
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        milliseconds = duration * 1000
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if milliseconds <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def to_dict(self):
+        labels = [f'<={bound}ms' for bound in LATENCY_BUCKETS] + [f'>{LATENCY_BUCKETS[-1]}ms']
+        return {
+            'count': self.count,
+            'total_ms': round(self.total * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+            'histogram': dict(zip(labels, self.histogram, strict=True)),
+        }
+
+
+class CommandMetrics:
+    """WebDriver commands executed by a session, by command and by the entity
+    method and navigate step which executed them.
+    """
+
+    def __init__(self):
+        self.commands = {}
+        self.entity_methods = {}
+        self.navigate_steps = {}
+
+    def __len__(self):
+        return sum(stats.count for stats in self.commands.values())
+
+    def record(self, command, duration):
+        """Record ``command`` which took ``duration`` seconds."""
+        self.commands.setdefault(command, CommandStats()).add(duration)
+        for context, name in (
+            (self.entity_methods, tracing.current_entity_method()),
+            (self.navigate_steps, tracing.current_navigate_step()),
+        ):
+            if name is not None:
+                context.setdefault(name, {}).setdefault(command, CommandStats()).add(duration)
+
+    def reset(self):
+        """Forget all recorded commands, e.g. before measuring a single call."""
+        self.commands.clear()
+        self.entity_methods.clear()
+        self.navigate_steps.clear()
+
+    def to_dict(self):
+        """Return the metrics as a dictionary, serializable to JSON."""
+
+        def by_command(commands):
+            return {command: stats.to_dict() for command, stats in sorted(commands.items())}
+
+        return {
+            'commands': by_command(self.commands),
+            'entity_methods': {
+                name: by_command(commands) for name, commands in self.entity_methods.items()
+            },
+            'navigate_steps': {
+                name: by_command(commands) for name, commands in self.navigate_steps.items()
+            },
+        }
+
+    def dump(self, path):
+        """Write the metrics to ``path`` as JSON."""
+        with open(path, 'w') as metrics_file:
+            json.dump(self.to_dict(), metrics_file, indent=2)
+
+
+def instrument(selenium, metrics):
+    """Record all commands executed by ``selenium`` webdriver to ``metrics``.
+    A webdriver reused by several sessions is instrumented only once and
+    records to the metrics of the last one.
+
+    :param selenium: :class:`selenium.webdriver.remote.webdriver.WebDriver`
+    :param CommandMetrics metrics: metrics to record to
+    """
+    selenium.airgun_metrics = metrics
+    if getattr(selenium, 'airgun_instrumented', False):
+        return
+    execute = selenium.execute
+
+    def timed_execute(driver_command, params=None):
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            if selenium.airgun_metrics is not None:
+                selenium.airgun_metrics.record(driver_command, time.perf_counter() - start)
+
+    # the instance attribute takes precedence over WebDriver.execute, which is
+    # also used by WebElement methods
+    selenium.execute = timed_execute
+    selenium.airgun_instrumented = True
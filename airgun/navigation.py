@@ -1,11 +1,19 @@
 """AirGun's implementation of base navigation and navigate steps."""
 
+import re
+from string import Formatter
+from urllib.parse import quote, urlparse
+
 from cached_property import cached_property
 import navmazing
 from selenium.common.exceptions import NoSuchElementException
-from wait_for import wait_for
 from widgetastic_patternfly4.navigation import NavSelectionNotFound
 
+from airgun import settings, tracing
+from airgun.link_cache import current_org
+from airgun.utils import to_bool
+from airgun.waits import wait_for
+
 NAV_EXCEPTIONS = NavSelectionNotFound
 
 
@@ -13,9 +21,28 @@ class NavigateStep(navmazing.NavigateStep):
     """AirGun's version of :class:`navmazing.NavigateStep` with custom
     implementations of `navmazing.NavigateStep.am_i_here` and `navmazing.NavigateStep.go`
     and ability to work with views.
+
+    Destinations with a stable URL may define it by ``URL`` class attribute (or
+    ``url`` argument of :meth:`Navigate.register`), e.g. ``'/hosts/new'``. It
+    is a template formatted with navigation keyword arguments and ``entity``,
+    e.g. ``'/foreman_tasks/tasks/{task_id}'``. Navigation then opens the URL
+    directly instead of going through the prerequisite and clicking the menu.
+    If ``am_i_here`` fails afterwards, or ``settings.airgun.navigation_force_menu``
+    is set, the prerequisite and :meth:`step` are used as usual.
+
+    Destinations showing a single entity found by its name (e.g. details page
+    opened by clicking the entity in a table) may set ``LINK_KEY`` to names of
+    the navigation keyword arguments identifying the entity, e.g.
+    ``('product_name', 'entity_name')``. The URL the navigation led to is then
+    cached in the session link cache (see :mod:`airgun.link_cache`) and opened
+    directly the next time.
     """
 
     VIEW = None
+    URL = None
+    LINK_KEY = None
+    # exceptions of am_i_here meaning navigation is not at the destination
+    AM_I_HERE_EXCEPTIONS = Exception
 
     def __init__(self, obj, navigate_obj, logger=None):
         """Adding shortcut for navigate object to make easier calls to its
@@ -23,6 +50,7 @@ class NavigateStep(navmazing.NavigateStep):
         """
         super().__init__(obj, navigate_obj, logger=logger)
         self.navigate_to = self.navigate_obj.navigate
+        self._link_key = None
 
     @cached_property
     def view(self):
@@ -80,14 +108,171 @@ class NavigateStep(navmazing.NavigateStep):
         except (AttributeError, NoSuchElementException):
             return False
 
+    @property
+    def link_cache(self):
+        """:class:`airgun.link_cache.LinkCache` of the session."""
+        return self.navigate_obj.browser.extra_objects['session'].link_cache
+
+    def link_key(self, *args, **kwargs):
+        """Return key of the entity in the session link cache, or ``None`` if
+        the destination has no ``LINK_KEY``, the arguments identifying the
+        entity were not passed or current organization is not known.
+        """
+        if self.LINK_KEY is None:
+            return None
+        names = tuple(kwargs.get(name) for name in self.LINK_KEY)
+        if None in names:
+            return None
+        org = current_org(self.navigate_obj.browser)
+        if org is None:
+            return None
+        entity_class = self.obj if isinstance(self.obj, type) else type(self.obj)
+        return entity_class, names, org
+
+    def url(self, *args, **kwargs):
+        """Return absolute URL of the destination, or ``None`` if the
+        destination has no URL (nor a cached link), the URL template needs
+        arguments which were not passed or navigation through the menu is
+        forced by settings.
+        """
+        if to_bool(settings.airgun.navigation_force_menu):
+            return None
+        if self.URL is not None:
+            try:
+                path = self.URL.format(
+                    entity=self.obj, **{key: quote(str(value)) for key, value in kwargs.items()}
+                )
+            except (KeyError, IndexError, AttributeError):
+                return None
+        else:
+            self._link_key = self.link_key(*args, **kwargs)
+            path = self.link_cache.get(self._link_key) if self._link_key else None
+            if path is None:
+                return None
+        current_url = urlparse(self.navigate_obj.browser.url)
+        return f'{current_url.scheme}://{current_url.netloc}{path}'
+
+    def remember_link(self):
+        """Cache current URL as the link to the entity, if the destination
+        has ``LINK_KEY``.
+        """
+        if self._link_key is None:
+            return
+        current_url = urlparse(self.navigate_obj.browser.url)
+        link = current_url._replace(scheme='', netloc='').geturl()
+        self.link_cache.store(self._link_key, link)
+
+    def url_matches(self, url):
+        """Return whether ``url`` may be URL of the destination. Always true
+        for destinations without ``URL``.
+        """
+        if self.URL is None:
+            return True
+        pattern = ''.join(
+            re.escape(literal) + ('.+' if field is not None else '')
+            for literal, field, _, _ in Formatter().parse(self.URL)
+        )
+        return re.fullmatch(pattern.rstrip('/'), urlparse(url).path.rstrip('/')) is not None
+
+    def _here(self, *args, **kwargs):
+        """Return result of :meth:`am_i_here`, ``False`` if it fails. Within
+        :meth:`Navigate.navigate`, the result is reused until the page changes
+        and ``am_i_here`` is not called at all if current URL cannot be URL of
+        the destination.
+        """
+        plan = self.navigate_obj.plan
+        if plan is None:
+            return self._check_here(*args, **kwargs)
+        key = (type(self), id(self.obj), repr(args), repr(sorted(kwargs.items())))
+        if key not in plan.here:
+            if self.url_matches(plan.url):
+                plan.here[key] = self._check_here(*args, **kwargs)
+            else:
+                self.logger.info(f'NAVIGATE: Not at {self._name} according to {plan.url}.')
+                plan.here[key] = False
+        return plan.here[key]
+
+    def _check_here(self, *args, **kwargs):
+        try:
+            return self.am_i_here(*args, **kwargs)
+        except self.AM_I_HERE_EXCEPTIONS as e:
+            self.logger.error(f'NAVIGATE: Exception while checking if already at {self._name}: {e}')
+            return False
+
+    def page_changed(self):
+        """Forget the page state known to the navigation after the step
+        changed the page.
+        """
+        if self.navigate_obj.plan is not None:
+            self.navigate_obj.plan.page_changed()
+
+    def go_by_url(self, url, *args, **kwargs):
+        """Open URL of the destination and check the navigation got there. A
+        cached link which did not lead to the destination is dropped.
+
+        :param str url: URL returned by :meth:`url`
+        :return: whether navigation is at the destination
+        """
+        self.logger.info(f'NAVIGATE: Opening {url} for {self._name}.')
+        with tracing.span(f'{self._name} url', 'navigation.url', url=url):
+            self.navigate_obj.browser.url = url
+        self.page_changed()
+        self.navigate_obj.browser.plugin.ensure_page_safe()
+        if self._wait_for_here(*args, **kwargs):
+            return True
+        self.logger.warning(f'NAVIGATE: {url} did not lead to {self._name}, using the menu.')
+        if self._link_key is not None:
+            self.link_cache.discard(self._link_key)
+        return False
+
+    def _wait_for_here(self, *args, **kwargs):
+        """Check the navigation is at the destination after :meth:`go_by_url`."""
+        return self._here(*args, **kwargs)
+
+    def do_nav(self, _tries, *args, **kwargs):
+        """Override of :meth:`navmazing.NavigateStep.do_nav`, which lets the
+        navigation know the page changed.
+        """
+        try:
+            with tracing.span(f'{self._name} step', 'navigation.step'):
+                self.step(*args, **kwargs)
+        except Exception as e:  # noqa: BLE001 - navmazing retries on any error
+            self.logger.error(f'NAVIGATE: Got an error {e}')
+            self.page_changed()
+            self.go(_tries, *args, **kwargs)
+        else:
+            self.page_changed()
+
     def go(self, _tries=0, *args, **kwargs):
-        """Override of :meth:`navmazing.NavigateStep.go`, which returns
-        instance of view after successful navigation.
+        """Override of :meth:`navmazing.NavigateStep.go`, which opens URL of
+        the destination (if known) instead of going through the prerequisite
+        and returns instance of view after successful navigation.
 
         :return: view instance if class attribute ``VIEW`` is set or ``None``
             otherwise
         """
-        super().go(*args, _tries=_tries, **kwargs)
+        _tries += 1
+        self.pre_navigate(_tries, *args, **kwargs)
+        self.logger.info(f'NAVIGATE: Checking if already at {self._name}')
+        if self._here(*args, **kwargs):
+            self.logger.info(f'NAVIGATE: Already at {self._name}')
+        else:
+            url = self.url(*args, **kwargs)
+            if url is None or not self.go_by_url(url, *args, **kwargs):
+                self.logger.info(f"NAVIGATE: I'm not at {self._name}")
+                with tracing.span(f'{self._name} prerequisite', 'navigation.prerequisite'):
+                    self.parent = self.prerequisite(*args, **kwargs)
+                self.logger.info(f'NAVIGATE: Heading to destination {self._name}')
+                self.do_nav(_tries, *args, **kwargs)
+                # steps do not wait for the destination, a link (if the
+                # destination has one) is cached only if the navigation got
+                # there, not to cache e.g. the list page
+                if self._link_key is not None:
+                    self.navigate_obj.browser.plugin.ensure_page_safe()
+                    if self._check_here(*args, **kwargs):
+                        self.remember_link()
+        self.resetter(*args, **kwargs)
+        self.post_navigate(_tries, *args, **kwargs)
         self.navigate_obj.browser.plugin.ensure_page_safe()
         view = self.view if self.VIEW is not None else None
         return view
@@ -98,6 +283,7 @@ class NavigateStepWithWait(NavigateStep):
 
     DEFAULT_TRIES = 1
     WAIT_TIMEOUT = 20
+    AM_I_HERE_EXCEPTIONS = NAV_EXCEPTIONS
 
     def pre_navigate(self, *args, **kwargs):
         """Override navmazing's retry behavior"""
@@ -115,24 +301,24 @@ class NavigateStepWithWait(NavigateStep):
             self.logger.info(
                 f'NAVIGATE: Checking if already at {self._name} for {type(self).__name__}.'
             )
-            here = False
-            try:
-                here = self.am_i_here(*args, **kwargs)
-            except NAV_EXCEPTIONS as e:
-                self.logger.error(
-                    f'NAVIGATE: Exception while checking if already at {self._name}: {e}. Continuing with navigation.'
-                )
+            here = self._here(*args, **kwargs)
+            url = None if here else self.url(*args, **kwargs)
             if here:
                 self.logger.info(f'NAVIGATE: Already at {self._name}.')
+            elif url is not None and self.go_by_url(url, *args, **kwargs):
+                here = True
             else:
                 # Perform the navigation steps and wait for the final destination to be ready
                 self.logger.info(f'NAVIGATE: Not at {self._name}. Heading to prerequisite.')
-                self.parent = self.prerequisite(*args, **kwargs)
+                with tracing.span(f'{self._name} prerequisite', 'navigation.prerequisite'):
+                    self.parent = self.prerequisite(*args, **kwargs)
 
                 self.logger.info(
                     f'NAVIGATE: Prerequisite complete. Heading to destination {self._name}.'
                 )
-                self.step(*args, **kwargs)
+                with tracing.span(f'{self._name} step', 'navigation.step'):
+                    self.step(*args, **kwargs)
+                self.page_changed()
 
                 here, _ = wait_for(
                     self.am_i_here,
@@ -143,7 +329,9 @@ class NavigateStepWithWait(NavigateStep):
                     handle_exception=True,
                     silent_failure=True,
                 )
-                if not here:
+                if here:
+                    self.remember_link()
+                else:
                     self.logger.error('NAVIGATE: Timed out waiting for am_i_here.')
 
             # Return view if successful, otherwise go on to the next try
@@ -155,6 +343,47 @@ class NavigateStepWithWait(NavigateStep):
         # Ran out of tries: raise an exception.
         raise navmazing.NavigationTriesExceeded(self._name)
 
+    def _wait_for_here(self, *args, **kwargs):
+        here, _ = wait_for(
+            self.am_i_here,
+            func_args=args,
+            func_kwargs=kwargs,
+            timeout=self.WAIT_TIMEOUT,
+            message=f'NAVIGATE: Waiting for am_i_here of {type(self).__name__}',
+            handle_exception=True,
+            silent_failure=True,
+        )
+        return here
+
+
+class NavigationPlan:
+    """State of the page shared by all steps of a single navigation, including
+    the steps of its prerequisites.
+
+    Navigation from a destination to its prerequisites goes down the chain
+    until it finds a step it is already at (or has URL of), then steps back up.
+    The plan keeps results of ``am_i_here`` checks and current URL until a step
+    changes the page, so no check is repeated and steps whose URL does not
+    match current URL are not checked at all.
+    """
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.here = {}
+        self._url = None
+
+    @property
+    def url(self):
+        """Current URL, read once per page."""
+        if self._url is None:
+            self._url = self.browser.url
+        return self._url
+
+    def page_changed(self):
+        """Forget everything known about the page."""
+        self.here.clear()
+        self._url = None
+
 
 class Navigate(navmazing.Navigate):
     """Wrapper around :class:`navmazing.Navigate` which adds airgun browser as
@@ -173,13 +402,42 @@ class Navigate(navmazing.Navigate):
         """
         super().__init__()
         self.browser = browser
+        self.plan = None
+
+    def register(self, cls, name=None, url=None):
+        """Register decorated navigate step as destination ``name`` of
+        ``cls``.
+
+        :param str optional url: URL (template) of the destination, see
+            :attr:`NavigateStep.URL`
+        """
+        register = super().register(cls, name)
+
+        def decorator(step):
+            if url is not None:
+                step.URL = url
+            return register(step)
+
+        return decorator
 
     def navigate(self, cls_or_obj, name, *args, **kwargs):
         """Perform the navigation"""
         __tracebackhide__ = True
 
         nav = self.get_class(cls_or_obj, name)
-        return nav(cls_or_obj, self, self.logger).go(0, *args, **kwargs)
+        entity_name = getattr(cls_or_obj, '__name__', type(cls_or_obj).__name__)
+        with (
+            tracing.navigate_step(nav.__name__),
+            tracing.span(f'navigate {entity_name} {name}', 'navigation', step=nav.__name__),
+        ):
+            if self.plan is not None:
+                # navigation to a prerequisite of the destination
+                return nav(cls_or_obj, self, self.logger).go(0, *args, **kwargs)
+            self.plan = NavigationPlan(self.browser)
+            try:
+                return nav(cls_or_obj, self, self.logger).go(0, *args, **kwargs)
+            finally:
+                self.plan = None
 
 
 # Navigator instance to be used in other modules. Please note that you should
@@ -0,0 +1,878 @@
+"""Offline webdriver serving saved HTML snapshots of Satellite pages.
+
+:class:`OfflineWebDriver` evaluates XPath, CSS and link text locators, element
+text, attributes and properties, clicks and typing against a static DOM parsed
+by lxml, and a subset of ``execute_script``: the selenium atoms, the scripts of
+widgetastic and the scripts airgun widgets, waits and plugin run (see
+:func:`script_handler`). It is a stand-in for a real browser in widget tests
+and benchmarks, which can run locally, without Satellite::
+
+    browser = offline_browser('snapshots/subscriptions.html.gz')
+    table = SatTable('.//table', browser=browser)
+    table.read()
+    print(len(browser.extra_objects['session'].metrics))
+
+Every webdriver command goes through :meth:`OfflineWebDriver.execute`, same as
+with selenium, so :class:`airgun.metrics.CommandMetrics` count the round trips
+the operation would make in a real browser.
+
+Requires ``lxml`` and ``cssselect`` packages.
+"""
+
+import gzip
+import re
+from textwrap import dedent
+
+from cssselect import HTMLTranslator, SelectorError
+from lxml import etree, html
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoAlertPresentException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.file_detector import UselessFileDetector
+from selenium.webdriver.remote.switch_to import SwitchTo
+from selenium.webdriver.remote.webelement import WebElement
+from widgetastic.browser import EXTRACT_ATTRIBUTES_OF_ELEMENT, EXTRACT_CLASSES_OF_ELEMENT
+from widgetastic.widget import Select
+
+from airgun.browser import AirgunBrowser, AirgunBrowserPlugin
+from airgun.link_cache import CURRENT_ORG_SCRIPT, get_link_cache
+from airgun.metrics import CommandMetrics
+from airgun.navigation import Navigate, navigator
+from airgun.views.sync_status import SyncStatusTreeTable
+from airgun.waits import FINGERPRINT_SCRIPT
+from airgun.widgets import RowQueryTableMixin, SatTable
+
+# Elements which are never rendered
+HIDDEN_TAGS = {'head', 'script', 'style', 'template', 'noscript', 'title', 'meta', 'link'}
+
+# Elements whose text starts on a new line
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'details', 'dialog', 'div',
+    'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+    'table', 'tbody', 'tfoot', 'thead', 'tr', 'ul',
+}  # fmt: skip
+
+# Attributes the getAttribute atom reports as "true" or None
+BOOLEAN_ATTRIBUTES = {
+    'async', 'autofocus', 'autoplay', 'checked', 'compact', 'complete', 'controls',
+    'declare', 'default', 'defaultchecked', 'defaultselected', 'defer', 'disabled',
+    'ended', 'formnovalidate', 'hidden', 'indeterminate', 'iscontenteditable', 'ismap',
+    'itemscope', 'loop', 'multiple', 'muted', 'nohref', 'noresize', 'noshade',
+    'novalidate', 'nowrap', 'open', 'paused', 'pubdate', 'readonly', 'required',
+    'reversed', 'scoped', 'seamless', 'seeking', 'selected', 'truespeed', 'willvalidate',
+}  # fmt: skip
+
+# Form controls which can be disabled
+FORM_CONTROL_TAGS = {'button', 'fieldset', 'input', 'optgroup', 'option', 'select', 'textarea'}
+
+# Keys of selenium.webdriver.common.keys.Keys are in Unicode private use area
+SPECIAL_KEYS = re.compile('[\ue000-\uf8ff]')
+
+# Script handlers, by dedented script, see script_handler()
+SCRIPT_HANDLERS = {}
+# Script handlers, by marker the script starts with (selenium atoms)
+SCRIPT_PREFIX_HANDLERS = {}
+
+css_translator = HTMLTranslator()
+
+
+def script_handler(*scripts, prefix=False):
+    """Register decorated function as the implementation of ``scripts`` in
+    :class:`OfflineWebDriver`. The function gets the driver and the script
+    arguments (elements as lxml nodes) and returns the script result. Async
+    scripts get no callback, they return the value they would pass to it.
+
+    :param bool optional prefix: ``scripts`` are markers the handled scripts
+        start with, e.g. ``/* isDisplayed */``
+    """
+
+    def decorator(handler):
+        for script in scripts:
+            if prefix:
+                SCRIPT_PREFIX_HANDLERS[script] = handler
+            else:
+                SCRIPT_HANDLERS[_normalize_script(script)] = handler
+        return handler
+
+    return decorator
+
+
+def _normalize_script(script):
+    return dedent(script).strip()
+
+
+def load_snapshot(path):
+    """Return HTML of a snapshot saved to ``path``, gzip compressed if the
+    file name ends with ``.gz``.
+    """
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as snapshot:
+        return snapshot.read()
+
+
+def is_hidden(node):
+    """Whether ``node`` would not be rendered, judging by its own and its
+    ancestors' tags, ``hidden`` attribute and inline style.
+    """
+    for element in (node, *node.iterancestors()):
+        if not isinstance(element.tag, str) or element.tag in HIDDEN_TAGS:
+            return True
+        if element.get('hidden') is not None:
+            return True
+        if element.tag == 'input' and (element.get('type') or '').lower() == 'hidden':
+            return True
+        style = (element.get('style') or '').replace(' ', '').lower()
+        if 'display:none' in style or 'visibility:hidden' in style:
+            return True
+    return False
+
+
+def visible_text(node):
+    """Return text of ``node`` as rendered (``innerText``), with whitespace
+    collapsed and hidden descendants skipped, or ``''`` if ``node`` is hidden.
+    """
+    if is_hidden(node):
+        return ''
+    chunks = []
+
+    def walk(element):
+        if not isinstance(element.tag, str) or element.tag in HIDDEN_TAGS:
+            return
+        style = (element.get('style') or '').replace(' ', '').lower()
+        hidden = element.get('hidden') is not None or 'display:none' in style
+        if not hidden:
+            block = element.tag in BLOCK_TAGS
+            if block:
+                chunks.append('\n')
+            elif element.tag in ('td', 'th'):
+                chunks.append(' ')
+            if element.tag == 'br':
+                chunks.append('\n')
+            chunks.append(element.text or '')
+            for child in element:
+                walk(child)
+            if block:
+                chunks.append('\n')
+        chunks.append(element.tail or '')
+
+    chunks.append(node.text or '')
+    for child in node:
+        walk(child)
+    lines = (' '.join(line.split()) for line in ''.join(chunks).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def text_content(node):
+    """Return ``textContent`` of ``node``."""
+    return ''.join(node.itertext())
+
+
+class OfflineWebDriver:
+    """A webdriver serving a static HTML snapshot, see module documentation.
+
+    All other pages are served from ``pages``, by URL, when opened by
+    :meth:`get` (the current document is kept for unknown URLs). Scripts which
+    are not implemented return ``None`` and are recorded in
+    ``unhandled_scripts``. What the page scripts would do on a click (e.g.
+    showing the next page of a table) can be emulated by :meth:`on_click`.
+    """
+
+    _is_remote = False
+
+    def __init__(self, page_source, url='https://satellite.example.com/', pages=None):
+        """
+        :param str page_source: HTML of the page
+        :param str optional url: URL of the page
+        :param dict optional pages: HTML of other pages, by URL
+        """
+        self.pages = dict(pages or {})
+        self.unhandled_scripts = []
+        self.click_handlers = []
+        self.file_detector = UselessFileDetector()
+        self.capabilities = {
+            'browserName': 'offline',
+            'browserVersion': '0',
+            'handlesAlerts': False,
+        }
+        self.current_window_handle = 'offline'
+        self.window_handles = [self.current_window_handle]
+        self.switch_to = SwitchTo(self)
+        self.script_timeout = None
+        self.load(page_source, url)
+        self._handlers = {
+            Command.FIND_ELEMENT: self._find_element,
+            Command.FIND_ELEMENTS: self._find_elements,
+            Command.FIND_CHILD_ELEMENT: self._find_element,
+            Command.FIND_CHILD_ELEMENTS: self._find_elements,
+            Command.W3C_EXECUTE_SCRIPT: self._execute_script,
+            Command.W3C_EXECUTE_SCRIPT_ASYNC: self._execute_script,
+            Command.GET: self._get,
+            Command.GET_CURRENT_URL: lambda params: self.url,
+            Command.GET_TITLE: self._get_title,
+            Command.GET_PAGE_SOURCE: lambda params: self.page_source_html,
+            Command.REFRESH: lambda params: self.load(self.page_source_html, self.url),
+            Command.GET_ELEMENT_TEXT: lambda params: visible_text(self._node(params)),
+            Command.GET_ELEMENT_TAG_NAME: lambda params: self._node(params).tag,
+            Command.GET_ELEMENT_RECT: self._get_rect,
+            Command.IS_ELEMENT_ENABLED: lambda params: self.is_enabled(self._node(params)),
+            Command.IS_ELEMENT_SELECTED: self._is_selected,
+            Command.GET_ELEMENT_PROPERTY: lambda params: self.get_property(
+                self._node(params), params['name']
+            ),
+            Command.GET_ELEMENT_ATTRIBUTE: lambda params: self._node(params).get(params['name']),
+            Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY: self._get_css_value,
+            Command.CLICK_ELEMENT: self._click,
+            Command.CLEAR_ELEMENT: lambda params: self.set_value(self._node(params), ''),
+            Command.SEND_KEYS_TO_ELEMENT: self._send_keys,
+            Command.SWITCH_TO_FRAME: lambda params: None,
+            Command.SWITCH_TO_PARENT_FRAME: lambda params: None,
+            Command.SWITCH_TO_WINDOW: lambda params: None,
+            Command.W3C_GET_ALERT_TEXT: self._get_alert_text,
+            Command.W3C_ACTIONS: self._perform_actions,
+            Command.W3C_CLEAR_ACTIONS: lambda params: None,
+            Command.SET_TIMEOUTS: self._set_timeouts,
+            Command.GET_ALL_COOKIES: lambda params: [],
+            Command.W3C_GET_WINDOW_HANDLES: lambda params: self.window_handles,
+            Command.W3C_GET_CURRENT_WINDOW_HANDLE: lambda params: self.current_window_handle,
+            Command.SCREENSHOT: lambda params: '',
+        }
+
+    @classmethod
+    def from_file(cls, path, url=None, **kwargs):
+        """Create the driver serving snapshot saved to ``path``, see
+        :func:`load_snapshot`.
+        """
+        if url is not None:
+            kwargs['url'] = url
+        return cls(load_snapshot(path), **kwargs)
+
+    def on_click(self, xpath, handler):
+        """Call ``handler(node)`` after an element matching ``xpath`` (or a
+        descendant of it) is clicked, e.g. to :meth:`load` the page the click
+        would lead to.
+        """
+        self.click_handlers.append((xpath, handler))
+
+    def load(self, page_source, url=None):
+        """Replace the current document by ``page_source``. Elements of the
+        previous document become stale.
+        """
+        self.page_source_html = page_source
+        if url is not None:
+            self.url = url
+        self.document = html.document_fromstring(page_source)
+        self._nodes = {}
+        self._ids = {}
+        # element the mouse was moved to, see _perform_actions()
+        self._pointer = None
+
+    def execute(self, driver_command, params=None):
+        """Execute webdriver command, same as
+        :meth:`selenium.webdriver.remote.webdriver.WebDriver.execute`.
+        """
+        params = params or {}
+        try:
+            handler = self._handlers[driver_command]
+        except KeyError:
+            raise NotImplementedError(
+                f'Command {driver_command!r} is not supported offline'
+            ) from None
+        return {'value': handler(params)}
+
+    # Webdriver API used by widgetastic and airgun
+
+    @property
+    def current_url(self):
+        return self.execute(Command.GET_CURRENT_URL)['value']
+
+    @property
+    def title(self):
+        return self.execute(Command.GET_TITLE)['value']
+
+    @property
+    def page_source(self):
+        return self.execute(Command.GET_PAGE_SOURCE)['value']
+
+    def get(self, url):
+        self.execute(Command.GET, {'url': url})
+
+    def refresh(self):
+        self.execute(Command.REFRESH)
+
+    def back(self):
+        pass
+
+    def forward(self):
+        pass
+
+    def find_element(self, by=By.ID, value=None):
+        return self.execute(Command.FIND_ELEMENT, {'using': by, 'value': value})['value']
+
+    def find_elements(self, by=By.ID, value=None):
+        return self.execute(Command.FIND_ELEMENTS, {'using': by, 'value': value})['value']
+
+    def execute_script(self, script, *args):
+        return self.execute(Command.W3C_EXECUTE_SCRIPT, {'script': script, 'args': list(args)})[
+            'value'
+        ]
+
+    def execute_async_script(self, script, *args):
+        return self.execute(
+            Command.W3C_EXECUTE_SCRIPT_ASYNC, {'script': script, 'args': list(args)}
+        )['value']
+
+    def set_script_timeout(self, time_to_wait):
+        self.execute(Command.SET_TIMEOUTS, {'script': int(float(time_to_wait) * 1000)})
+
+    def get_cookies(self):
+        return self.execute(Command.GET_ALL_COOKIES)['value']
+
+    def get_cookie(self, name):
+        return None
+
+    def save_screenshot(self, filename):
+        return False
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+    # Elements
+
+    def element(self, node):
+        """Return :class:`WebElement` of lxml ``node``, the same one for the
+        same node.
+        """
+        element_id = self._ids.get(node)
+        if element_id is None:
+            element_id = f'offline-{len(self._ids)}'
+            self._ids[node] = element_id
+            self._nodes[element_id] = node
+        return WebElement(self, element_id)
+
+    def node(self, element):
+        """Return lxml node of ``element``.
+
+        :raises StaleElementReferenceException: if the element is not from the
+            current document
+        """
+        try:
+            return self._nodes[element.id]
+        except KeyError:
+            raise StaleElementReferenceException(
+                f'Element {element.id} is not attached to the page document'
+            ) from None
+
+    def _node(self, params):
+        return self.node(WebElement(self, params['id']))
+
+    def query(self, by, value, context=None):
+        """Return lxml nodes matching locator, within ``context`` node or the
+        whole document.
+        """
+        root = self.document if context is None else context
+        if by == By.XPATH:
+            try:
+                found = root.xpath(value)
+            except etree.XPathError as err:
+                raise InvalidSelectorException(f'Invalid XPath {value!r}: {err}') from None
+            if not isinstance(found, list):
+                raise InvalidSelectorException(f'XPath {value!r} does not select elements')
+            return [node for node in found if isinstance(node, etree.ElementBase)]
+        if by == By.CSS_SELECTOR:
+            prefix = 'descendant-or-self::' if context is None else 'descendant::'
+            try:
+                xpath = css_translator.css_to_xpath(value, prefix=prefix)
+            except SelectorError as err:
+                raise InvalidSelectorException(f'Invalid CSS selector {value!r}: {err}') from None
+            return root.xpath(xpath)
+        if by == By.TAG_NAME:
+            return list(root.iter(value)) if context is None else list(root.iterdescendants(value))
+        if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            links = root.iter('a') if context is None else root.iterdescendants('a')
+            if by == By.LINK_TEXT:
+                return [link for link in links if visible_text(link) == value]
+            return [link for link in links if value in visible_text(link)]
+        raise InvalidSelectorException(f'Locator strategy {by!r} is not supported offline')
+
+    def _find_elements(self, params):
+        context = self._node(params) if 'id' in params else None
+        return [
+            self.element(node) for node in self.query(params['using'], params['value'], context)
+        ]
+
+    def _find_element(self, params):
+        elements = self._find_elements(params)
+        if not elements:
+            raise NoSuchElementException(
+                f'Unable to locate element: {{"method":"{params["using"]}",'
+                f'"selector":"{params["value"]}"}}'
+            )
+        return elements[0]
+
+    # DOM state
+
+    def get_property(self, node, name):  # noqa: PLR0911 - one return per property
+        """Return DOM property ``name`` of ``node``."""
+        if name == 'value':
+            return self.get_value(node)
+        if name in ('checked', 'selected'):
+            return node.get(name) is not None
+        if name == 'disabled':
+            return not self.is_enabled(node)
+        if name == 'textContent':
+            return text_content(node)
+        if name == 'innerText':
+            return visible_text(node)
+        if name == 'innerHTML':
+            return (node.text or '') + ''.join(
+                html.tostring(child, encoding='unicode') for child in node
+            )
+        if name == 'outerHTML':
+            return html.tostring(node, encoding='unicode', with_tail=False)
+        if name == 'tagName':
+            return node.tag.upper()
+        if name == 'className':
+            return node.get('class', '')
+        if name == 'isConnected':
+            return True
+        return node.get(name)
+
+    def get_value(self, node):
+        """Return ``value`` property of form control ``node``."""
+        if node.tag == 'textarea':
+            return node.get('value', text_content(node))
+        if node.tag == 'select':
+            selected = self.selected_options(node)
+            return self.get_value(selected[0]) if selected else ''
+        if node.tag == 'option':
+            value = node.get('value')
+            return ' '.join(text_content(node).split()) if value is None else value
+        return node.get('value', '')
+
+    def selected_options(self, select):
+        """Return options selected in ``select`` node."""
+        options = list(select.iter('option'))
+        selected = [option for option in options if option.get('selected') is not None]
+        if not selected and select.get('multiple') is None:
+            return options[:1]
+        return selected
+
+    def set_value(self, node, value):
+        """Set ``value`` property of form control ``node``."""
+        node.set('value', value)
+
+    def is_enabled(self, node):
+        """Whether form control ``node`` is not disabled, by itself or by its
+        fieldset, select or option group.
+        """
+        if node.tag not in FORM_CONTROL_TAGS:
+            return True
+        return not any(
+            element.tag in FORM_CONTROL_TAGS and element.get('disabled') is not None
+            for element in (node, *node.iterancestors())
+        )
+
+    def _is_selected(self, params):
+        node = self._node(params)
+        return node.get('checked') is not None or node.get('selected') is not None
+
+    def _get_rect(self, params):
+        self._node(params)
+        return {'x': 0, 'y': 0, 'width': 100, 'height': 20}
+
+    def _get_css_value(self, params):
+        node = self._node(params)
+        for declaration in (node.get('style') or '').split(';'):
+            name, _, value = declaration.partition(':')
+            if name.strip().lower() == params['propertyName']:
+                return value.strip()
+        if params['propertyName'] == 'display':
+            return 'none' if is_hidden(node) else 'block'
+        return ''
+
+    def _click(self, params):
+        node = self._node(params)
+        if not self.is_enabled(node):
+            return
+        if node.tag == 'input' and node.get('type') == 'checkbox':
+            if node.get('checked') is None:
+                node.set('checked', '')
+            else:
+                del node.attrib['checked']
+        elif node.tag == 'input' and node.get('type') == 'radio':
+            for radio in self.document.xpath(
+                '//input[@type="radio" and @name=$name]', name=node.get('name', '')
+            ):
+                radio.attrib.pop('checked', None)
+            node.set('checked', '')
+        elif node.tag == 'option':
+            select = next(node.iterancestors('select'), None)
+            if select is not None and select.get('multiple') is None:
+                for option in select.iter('option'):
+                    option.attrib.pop('selected', None)
+            node.set('selected', '')
+        for xpath, handler in self.click_handlers:
+            matching = set(self.document.xpath(xpath))
+            target = next(
+                (element for element in (node, *node.iterancestors()) if element in matching),
+                None,
+            )
+            if target is not None:
+                handler(target)
+                break
+
+    def _perform_actions(self, params):
+        """Click on the element the mouse was moved to, keyboard actions are
+        ignored.
+        """
+        for source in params['actions']:
+            if source['type'] != 'pointer':
+                continue
+            for action in source['actions']:
+                if action['type'] == 'pointerMove' and isinstance(action.get('origin'), dict):
+                    (element_id,) = action['origin'].values()
+                    self._pointer = element_id
+                elif action['type'] == 'pointerUp' and self._pointer is not None:
+                    self._click({'id': self._pointer})
+
+    def _send_keys(self, params):
+        node = self._node(params)
+        value = self.get_value(node)
+        for char in params['text']:
+            if char == Keys.DELETE:
+                # the whole value was selected before, see Browser.clear()
+                value = ''
+            elif char == Keys.BACK_SPACE:
+                value = value[:-1]
+            elif not SPECIAL_KEYS.match(char):
+                value += char
+        self.set_value(node, value)
+
+    # Navigation
+
+    def _get(self, params):
+        url = params['url']
+        if url in self.pages:
+            self.load(self.pages[url], url)
+        else:
+            self.url = url
+
+    def _get_title(self, params):
+        titles = self.document.xpath('//title')
+        return ' '.join(text_content(titles[0]).split()) if titles else ''
+
+    def _get_alert_text(self, params):
+        raise NoAlertPresentException('Snapshots have no alerts')
+
+    def _set_timeouts(self, params):
+        self.script_timeout = params.get('script')
+
+    # Scripts
+
+    def _execute_script(self, params):
+        script = params['script']
+        args = [self.node(arg) if isinstance(arg, WebElement) else arg for arg in params['args']]
+        handler = SCRIPT_HANDLERS.get(_normalize_script(script))
+        if handler is None:
+            handler = next(
+                (
+                    handler
+                    for marker, handler in SCRIPT_PREFIX_HANDLERS.items()
+                    if script.startswith(marker)
+                ),
+                None,
+            )
+        if handler is None:
+            self.unhandled_scripts.append(script)
+            return None
+        result = handler(self, *args)
+        return self._wrap(result)
+
+    def _wrap(self, value):
+        """Convert lxml nodes in script result to elements."""
+        if isinstance(value, etree.ElementBase):
+            return self.element(value)
+        if isinstance(value, list):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return value
+
+
+@script_handler('/* isDisplayed */', prefix=True)
+def _is_displayed(driver, node):
+    return not is_hidden(node)
+
+
+@script_handler('/* getAttribute */', prefix=True)
+def _get_attribute(driver, node, name):
+    name = name.lower() if name.lower() in BOOLEAN_ATTRIBUTES else name
+    if name in BOOLEAN_ATTRIBUTES:
+        if name in ('checked', 'selected', 'disabled'):
+            present = driver.get_property(node, name)
+        else:
+            present = node.get(name) is not None
+        return 'true' if present else None
+    if name in ('value', 'textContent', 'innerText', 'innerHTML', 'outerHTML'):
+        return driver.get_property(node, name)
+    if name == 'class':
+        return node.get('class')
+    return node.get(name)
+
+
+@script_handler(EXTRACT_CLASSES_OF_ELEMENT)
+def _classes(driver, node):
+    return (node.get('class') or '').split()
+
+
+@script_handler(EXTRACT_ATTRIBUTES_OF_ELEMENT)
+def _attributes(driver, node):
+    return dict(node.attrib)
+
+
+@script_handler('return arguments[0].textContent || arguments[0].innerText;')
+def _text_content(driver, node):
+    return text_content(node) or visible_text(node)
+
+
+@script_handler('arguments[0].setAttribute(arguments[1], arguments[2]);')
+def _set_attribute(driver, node, name, value):
+    node.set(name, str(value))
+
+
+@script_handler("arguments[0].value = '';")
+def _clear_value(driver, node):
+    driver.set_value(node, '')
+
+
+@script_handler(
+    "arguments[0].scrollIntoView({block: 'center'});",
+    'arguments[0].scrollIntoView();',
+    'return document.readyState',
+)
+def _page_loaded(driver, *args):
+    return 'complete'
+
+
+@script_handler(AirgunBrowserPlugin.ENSURE_PAGE_SAFE)
+def _ensure_page_safe(driver):
+    # a snapshot has no pending requests
+    return {'document': True}
+
+
+@script_handler(AirgunBrowserPlugin.CHECK_PAGE_SAFE)
+def _check_page_safe(driver, state):
+    return {'state': None, 'checks': _ensure_page_safe(driver)}
+
+
+@script_handler(AirgunBrowserPlugin.WAIT_FOR_QUIET_PAGE)
+def _quiet_page(driver, *args):
+    return {'status': 'safe', 'state': None}
+
+
+@script_handler(FINGERPRINT_SCRIPT)
+def _fingerprint(driver, node=None):
+    if node is None:
+        node = driver.document.find('body')
+        if node is None:
+            return None
+    text = visible_text(node)
+    # 32-bit signed arithmetics of the script, over UTF-16 code units
+    encoded = text.encode('utf-16-le')
+    units = [int.from_bytes(encoded[i : i + 2], 'little') for i in range(0, len(encoded), 2)]
+    text_hash = 0
+    for unit in units:
+        text_hash = (text_hash * 31 + unit) & 0xFFFFFFFF
+    if text_hash & 0x80000000:
+        text_hash -= 0x100000000
+    return f'{sum(1 for _ in node.iterdescendants("*"))}:{len(units)}:{text_hash}'
+
+
+@script_handler(Select.ALL_OPTIONS)
+def _select_options(driver, select):
+    return [
+        [driver.get_property(option, 'innerHTML'), option.get('value')]
+        for option in select.iter('option')
+    ]
+
+
+@script_handler(Select.SELECTED_OPTIONS)
+def _selected_options(driver, select):
+    return driver.selected_options(select)
+
+
+@script_handler(Select.SELECTED_OPTIONS_TEXT)
+def _selected_options_text(driver, select):
+    return [driver.get_property(option, 'innerHTML') for option in driver.selected_options(select)]
+
+
+@script_handler(Select.SELECTED_OPTIONS_VALUE)
+def _selected_options_value(driver, select):
+    return [option.get('value') for option in driver.selected_options(select)]
+
+
+@script_handler(CURRENT_ORG_SCRIPT)
+def _current_org(driver):
+    found = driver.query(
+        By.CSS_SELECTOR, "[data-ouia-component-id='taxonomy-context-selector-organization']"
+    )
+    return text_content(found[0]).strip() if found else None
+
+
+@script_handler(RowQueryTableMixin.ROW_QUERY_SCRIPT)
+def _row_query(driver, table, query, limit, depth):
+    matches = driver.query(By.XPATH, query, table)
+    if limit is not None:
+        matches = matches[:limit]
+    positions = []
+    for match in matches:
+        element = match
+        for _ in range(depth):
+            element = element.getparent()
+        tag = element.tag if depth else None
+        positions.append(
+            sum(1 for sibling in element.itersiblings(preceding=True) if tag in (None, sibling.tag))
+        )
+    return positions
+
+
+@script_handler(SatTable.BULK_READ_SCRIPT)
+def _bulk_read(driver, table, rows_xpath, cell_xpath, positions, top, bottom, limit):  # noqa: PLR0917 - arguments of the script
+    rows = driver.query(By.XPATH, rows_xpath, table)
+    stop = len(rows) - bottom
+    if limit is not None:
+        stop = min(stop, top + limit)
+    result = []
+    for index in range(top, stop):
+        cells = []
+        for position in positions:
+            found = driver.query(By.XPATH, cell_xpath.replace('{0}', str(position)), rows[index])
+            cells.append((visible_text(found[0]) or text_content(found[0])) if found else None)
+        result.append({'index': index, 'cells': cells})
+    return result
+
+
+@script_handler(SatTable.PAGE_CHANGE_SCRIPT)
+def _page_change(driver, root, expected, timeout):
+    # nothing changes in a snapshot, the expected page is either shown or not
+    found = driver.query(By.CSS_SELECTOR, "input[aria-label='Current page']", root)
+    if found and driver.get_value(found[0]) == str(expected):
+        return 'changed'
+    return 'timeout'
+
+
+def _tree_rows(table):
+    tbody = next(table.iterchildren('tbody'), None)
+    return [] if tbody is None else list(tbody.iterchildren('tr'))
+
+
+@script_handler(SyncStatusTreeTable.TREE_INDEX_SCRIPT)
+def _tree_index(driver, table, known):
+    if next(table.iterchildren('tbody'), None) is None:
+        return None
+    rows = _tree_rows(table)
+    hidden = sum(1 for row in rows if row.get('hidden') is not None)
+    # the document changes only when another page is loaded
+    token = str(id(driver.document))
+    if known == token:
+        return {'token': token, 'hidden': hidden, 'rows': None}
+    index = []
+    for row in rows:
+        names = row.cssselect("div.pf-v5-c-table__tree-view-text span[role='button']")
+        index.append(
+            [
+                int(row.get('aria-level') or 0) or 1,
+                int(row.get('aria-setsize') or 0),
+                text_content(names[0]).strip() if names else None,
+            ]
+        )
+    return {'token': token, 'hidden': hidden, 'rows': index}
+
+
+@script_handler(SyncStatusTreeTable.ROW_CELLS_SCRIPT)
+def _row_cells(driver, table, positions, column):
+    rows = _tree_rows(table)
+    if positions is None:
+        positions = range(len(rows))
+    result = []
+    for position in positions:
+        cells = list(rows[position].iterchildren('td'))
+        index = column
+        if next(rows[position].iterchildren('th'), None) is not None:
+            index = max(column - 1, 0)
+        result.append(visible_text(cells[index]) if index < len(cells) else None)
+    return result
+
+
+@script_handler(SyncStatusTreeTable.PROGRESS_SCRIPT)
+def _progress(driver, table, positions, column):
+    rows = _tree_rows(table)
+    results = _row_cells(driver, table, positions, column)
+    return [
+        [bool(rows[position].cssselect("div[class*='pf-v5-c-progress']")), result]
+        for position, result in zip(positions, results, strict=True)
+    ]
+
+
+@script_handler(SyncStatusTreeTable.CHECKED_ROWS_SCRIPT)
+def _checked_rows(driver, table, positions):
+    rows = _tree_rows(table)
+    return [
+        position
+        for position in positions
+        if any(
+            checkbox.get('checked') is not None
+            for checkbox in rows[position].xpath(".//input[@type='checkbox']")
+        )
+    ]
+
+
+class OfflineSession:
+    """Minimal stand-in of :class:`airgun.session.Session` for
+    :func:`offline_browser`, with the attributes browsers, views and
+    navigation use.
+    """
+
+    def __init__(self, name='offline'):
+        self.name = name
+        self.metrics = CommandMetrics()
+        self.link_cache = get_link_cache()
+        self.browser = None
+        self.navigator = None
+
+
+def offline_browser(snapshot, url=None, pages=None, session=None):
+    """Return :class:`airgun.browser.AirgunBrowser` of
+    :class:`OfflineWebDriver` serving ``snapshot``.
+
+    :param str snapshot: HTML of the page or path to a saved snapshot
+    :param str optional url: URL of the page
+    :param dict optional pages: HTML of other pages, by URL
+    :param optional session: session of the browser, :class:`OfflineSession`
+        by default. Its ``metrics`` count webdriver commands of the browser.
+    """
+    kwargs = {'pages': pages}
+    if url is not None:
+        kwargs['url'] = url
+    if snapshot.lstrip().startswith('<'):
+        driver = OfflineWebDriver(snapshot, **kwargs)
+    else:
+        driver = OfflineWebDriver.from_file(snapshot, **kwargs)
+    session = session or OfflineSession()
+    browser = AirgunBrowser(driver, session)
+    if session.browser is None:
+        session.browser = browser
+    if session.navigator is None:
+        session.navigator = Navigate(browser)
+        session.navigator.dest_dict = navigator.dest_dict.copy()
+    return browser
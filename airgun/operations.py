@@ -0,0 +1,206 @@
+"""Handles of long-running Satellite operations.
+
+Entity methods starting an operation which takes long to finish (repository
+synchronization, manifest upload, report generation etc.) return an
+:class:`Operation` handle when called with ``handle=True``, instead of blocking
+until it is finished. Several operations can then run at once::
+
+    with Session() as session:
+        refresh = session.subscription.refresh_manifest(handle=True)
+        sync = session.sync_status.synchronize([('product', 'repo')], handle=True)
+        report = session.reporttemplate.generate('Host - Statuses', handle=True)
+        session.operations.wait()
+        path = report.result()
+
+All operations of a session are driven by its :class:`OperationPoller`,
+``session.operations``, in a single polling loop. Every operation is checked on
+its own page, operations on the same page are checked together after a single
+navigation. Operations are polled only while the caller waits for them (or asks
+whether they are done), so the browser is never used by two threads at once.
+"""
+
+import time
+
+from wait_for import TimedOutError
+
+from airgun import tracing
+from airgun.waits import get_polling_profile, scale_timeout
+
+
+class Operation:
+    """Handle of a running operation.
+
+    :param OperationPoller poller: poller driving the operation
+    :param str name: name of the operation, e.g. for logging
+    :param callable check: returns whether the operation is finished, called
+        on the page ``url``
+    :param callable optional finish: returns the result of the operation, called
+        once it is finished, on the page ``url``
+    :param str optional url: URL of the page to check the operation on,
+        current page if not passed
+    :param float timeout: number of seconds the operation may take, scaled by
+        :func:`airgun.waits.scale_timeout`
+    :param float delay: requested number of seconds between the checks
+    :param bool handle_exception: whether an exception raised by ``check``
+        means the operation is not finished yet, like in
+        :func:`airgun.waits.wait_for`, instead of failing the operation
+    """
+
+    def __init__(
+        self,
+        poller,
+        name,
+        check,
+        *,
+        finish=None,
+        url=None,
+        timeout=600,
+        delay=1,
+        handle_exception=False,
+    ):
+        self.poller = poller
+        self.name = name
+        self.check = check
+        self.finish = finish
+        self.url = url
+        self.delay = delay
+        self.handle_exception = handle_exception
+        self.deadline = time.monotonic() + scale_timeout(timeout)
+        self._done = False
+        self._result = None
+        self._error = None
+
+    def __repr__(self):
+        state = 'done' if self._done else 'running'
+        return f'<{type(self).__name__} {self.name} {state}>'
+
+    def poll(self):
+        """Check the operation (on its page) and finish it if it is done."""
+        if self._done:
+            return
+        try:
+            if self._check():
+                self._result = self.finish() if self.finish is not None else None
+                self._done = True
+            elif time.monotonic() > self.deadline:
+                raise TimedOutError(f'Operation {self.name} did not finish in time')
+        except Exception as err:  # noqa: BLE001 - the error is raised by result()
+            self._error = err
+            self._done = True
+
+    def _check(self):
+        try:
+            return self.check()
+        except Exception:
+            if not self.handle_exception:
+                raise
+            return False
+
+    def done(self):
+        """Poll all running operations once and return whether this one is
+        finished (successfully or not).
+        """
+        if not self._done:
+            self.poller.poll()
+        return self._done
+
+    def wait(self, timeout=None):
+        """Wait until the operation is finished, driving all the other running
+        operations of the session meanwhile.
+
+        :param float optional timeout: max number of seconds to wait, until
+            the operation times out by default
+        :return: whether the operation is finished
+        """
+        self.poller.wait([self], timeout=timeout)
+        return self._done
+
+    def result(self, timeout=None):
+        """Wait until the operation is finished and return its result.
+
+        :raises TimedOutError: if it did not finish within ``timeout``
+        :raises Exception: the error the operation failed with
+        """
+        if not self.wait(timeout):
+            raise TimedOutError(f'Operation {self.name} did not finish in {timeout} seconds')
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class OperationPoller:
+    """Drives all running operations of a session, see module documentation."""
+
+    def __init__(self, session):
+        self.session = session
+        self.operations = []
+
+    def __len__(self):
+        return len(self.pending)
+
+    @property
+    def pending(self):
+        """Operations which are not finished yet."""
+        return [operation for operation in self.operations if not operation._done]
+
+    def start(self, name, check, url=None, **kwargs):
+        """Return handle of an operation started on the current page (or
+        ``url``), see :class:`Operation` for the arguments.
+        """
+        if url is None:
+            url = self.session.browser.url
+        operation = Operation(self, name, check, url=url, **kwargs)
+        self.operations.append(operation)
+        return operation
+
+    def poll(self):
+        """Check every pending operation once. Operations on the current page
+        are checked first, then each other page is opened for all its
+        operations (and opened again if one of them left it).
+        """
+        with tracing.using(getattr(self.session, 'tracer', None)):
+            self._poll()
+
+    def _poll(self):
+        browser = self.session.browser
+        by_url = {}
+        for operation in self.pending:
+            by_url.setdefault(operation.url, []).append(operation)
+        current = browser.url
+        for url in sorted(by_url, key=lambda url: url != current):
+            for operation in by_url[url]:
+                # a check or finish may navigate away, e.g. to read the page
+                # of an entity, so the page is checked before every operation
+                if browser.url != url:
+                    with tracing.span(f'operations {url}', 'navigation.url', url=url):
+                        browser.url = url
+                    browser.plugin.ensure_page_safe()
+                with tracing.span(f'operation {operation.name}', 'wait'):
+                    operation.poll()
+        self.operations = self.pending
+
+    def wait(self, operations=None, timeout=None):
+        """Poll until ``operations`` (all pending by default) are finished or
+        ``timeout`` expires. Finished operations are not errors, their
+        ``result()`` raises the error they failed with.
+
+        :param float optional timeout: max number of seconds to wait, scaled
+            by :func:`airgun.waits.scale_timeout`
+        :return: whether all the operations are finished
+        """
+        operations = self.pending if operations is None else list(operations)
+        running = [operation for operation in operations if not operation._done]
+        if not running:
+            return True
+        deadline = None if timeout is None else time.monotonic() + scale_timeout(timeout)
+        delays = get_polling_profile().delays(min(operation.delay for operation in running))
+        while True:
+            self.poll()
+            if all(operation._done for operation in operations):
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            delay = next(delays)
+            if deadline is not None:
+                delay = min(delay, max(deadline - time.monotonic(), 0))
+            tracing.sleep(delay)
@@ -1,104 +1,144 @@
 """Session controller which manages UI session"""
 
 from datetime import datetime
+import importlib
 import logging
 import os
 import sys
 
-from cached_property import cached_property
 from fauxfactory import gen_string
 
-from airgun import settings
+from airgun import settings, snapshots, tracing
 from airgun.browser import AirgunBrowser, SeleniumBrowserFactory
-from airgun.entities.about import AboutEntity
-from airgun.entities.acs import AcsEntity
-from airgun.entities.activationkey import ActivationKeyEntity
-from airgun.entities.all_hosts import AllHostsEntity
-from airgun.entities.ansible_role import AnsibleRolesEntity
-from airgun.entities.ansible_variable import AnsibleVariablesEntity
-from airgun.entities.architecture import ArchitectureEntity
-from airgun.entities.audit import AuditEntity
-from airgun.entities.bookmark import BookmarkEntity
-from airgun.entities.bootc import BootcEntity
-from airgun.entities.capsule import CapsuleEntity
-from airgun.entities.cloud_insights import CloudInsightsEntity, RecommendationsTabEntity
-from airgun.entities.cloud_inventory import CloudInventoryEntity, IopCloudInventoryEntity
-from airgun.entities.cloud_vulnerabilities import CloudVulnerabilityEntity
-from airgun.entities.computeprofile import ComputeProfileEntity
-from airgun.entities.computeresource import ComputeResourceEntity
-from airgun.entities.config_report import ConfigReportEntity
-from airgun.entities.configgroup import ConfigGroupEntity
-from airgun.entities.containerimages import ContainerImagesEntity
-from airgun.entities.containerimagetag import ContainerImageTagEntity
-from airgun.entities.contentcredential import ContentCredentialEntity
-from airgun.entities.contentview import ContentViewEntity
-from airgun.entities.contentview_new import NewContentViewEntity
-from airgun.entities.contentviewfilter import ContentViewFilterEntity
-from airgun.entities.dashboard import DashboardEntity
-from airgun.entities.discoveredhosts import DiscoveredHostsEntity
-from airgun.entities.discoveryrule import DiscoveryRuleEntity
-from airgun.entities.domain import DomainEntity
-from airgun.entities.eol_banner import EOLBannerEntity
-from airgun.entities.errata import ErrataEntity
-from airgun.entities.fact_value import FactValueEntity
-from airgun.entities.file import FilesEntity
-from airgun.entities.filter import FilterEntity
-from airgun.entities.flatpak import FlatpakRemotesEntity
-from airgun.entities.global_parameter import GlobalParameterEntity
-from airgun.entities.hardware_model import HardwareModelEntity
-from airgun.entities.host import HostEntity
-from airgun.entities.host_new import NewHostEntity
-from airgun.entities.hostcollection import HostCollectionEntity
-from airgun.entities.hostgroup import HostGroupEntity
-from airgun.entities.http_proxy import HTTPProxyEntity
-from airgun.entities.job_invocation import JobInvocationEntity
-from airgun.entities.job_template import JobTemplateEntity
-from airgun.entities.ldap_authentication import LDAPAuthenticationEntity
-from airgun.entities.lifecycleenvironment import LCEEntity
-from airgun.entities.location import LocationEntity
-from airgun.entities.login import LoginEntity
-from airgun.entities.media import MediaEntity
-from airgun.entities.modulestream import ModuleStreamEntity
-from airgun.entities.organization import OrganizationEntity
-from airgun.entities.os import OperatingSystemEntity
-from airgun.entities.oscapcontent import OSCAPContentEntity
-from airgun.entities.oscappolicy import OSCAPPolicyEntity
-from airgun.entities.oscapreport import OSCAPReportEntity
-from airgun.entities.oscaptailoringfile import OSCAPTailoringFileEntity
-from airgun.entities.package import PackageEntity
-from airgun.entities.partitiontable import PartitionTableEntity
-from airgun.entities.product import ProductEntity
-from airgun.entities.provisioning_template import ProvisioningTemplateEntity
-from airgun.entities.puppet_class import PuppetClassEntity
-from airgun.entities.puppet_environment import PuppetEnvironmentEntity
-from airgun.entities.redhat_repository import RedHatRepositoryEntity
-from airgun.entities.report_template import ReportTemplateEntity
-from airgun.entities.repository import RepositoryEntity
-from airgun.entities.rhai.action import ActionEntity
-from airgun.entities.rhai.inventory import InventoryHostEntity
-from airgun.entities.rhai.manage import ManageEntity
-from airgun.entities.rhai.overview import OverviewEntity
-from airgun.entities.rhai.plan import PlanEntity
-from airgun.entities.rhai.rule import RuleEntity
-from airgun.entities.rhsso_login import RHSSOLoginEntity
-from airgun.entities.role import RoleEntity
-from airgun.entities.settings import SettingsEntity
-from airgun.entities.smart_class_parameter import SmartClassParameterEntity
-from airgun.entities.subnet import SubnetEntity
-from airgun.entities.subscription import SubscriptionEntity
-from airgun.entities.sync_status import SyncStatusEntity
-from airgun.entities.sync_templates import SyncTemplatesEntity
-from airgun.entities.syncplan import SyncPlanEntity
-from airgun.entities.task import TaskEntity
-from airgun.entities.upgrade import UpgradeEntity
-from airgun.entities.user import UserEntity
-from airgun.entities.usergroup import UserGroupEntity
-from airgun.entities.virtwho_configure import VirtwhoConfigureEntity
-from airgun.entities.webhook import WebhookEntity
+from airgun.link_cache import get_link_cache
+from airgun.login_cache import get_login_cache
+from airgun.metrics import CommandMetrics
 from airgun.navigation import Navigate, navigator
+from airgun.operations import OperationPoller
 
 LOGGER = logging.getLogger(__name__)
 
+# Entities available as :class:`Session` attributes, mapped to the module and
+# class implementing them. Entity modules (and their views) are imported only
+# when the attribute is accessed for the first time, see :class:`LazyEntity`.
+ENTITIES = {
+    'acs': ('airgun.entities.acs', 'AcsEntity'),
+    'about': ('airgun.entities.about', 'AboutEntity'),
+    'activationkey': ('airgun.entities.activationkey', 'ActivationKeyEntity'),
+    'all_hosts': ('airgun.entities.all_hosts', 'AllHostsEntity'),
+    'ansibleroles': ('airgun.entities.ansible_role', 'AnsibleRolesEntity'),
+    'ansiblevariables': ('airgun.entities.ansible_variable', 'AnsibleVariablesEntity'),
+    'architecture': ('airgun.entities.architecture', 'ArchitectureEntity'),
+    'audit': ('airgun.entities.audit', 'AuditEntity'),
+    'bookmark': ('airgun.entities.bookmark', 'BookmarkEntity'),
+    'bootc': ('airgun.entities.bootc', 'BootcEntity'),
+    'capsule': ('airgun.entities.capsule', 'CapsuleEntity'),
+    'eol_banner': ('airgun.entities.eol_banner', 'EOLBannerEntity'),
+    'cloudinventory': ('airgun.entities.cloud_inventory', 'CloudInventoryEntity'),
+    'iopcloudinventory': ('airgun.entities.cloud_inventory', 'IopCloudInventoryEntity'),
+    'recommendationstab': ('airgun.entities.cloud_insights', 'RecommendationsTabEntity'),
+    'cloudinsights': ('airgun.entities.cloud_insights', 'CloudInsightsEntity'),
+    'cloudvulnerability': ('airgun.entities.cloud_vulnerabilities', 'CloudVulnerabilityEntity'),
+    'computeprofile': ('airgun.entities.computeprofile', 'ComputeProfileEntity'),
+    'configgroup': ('airgun.entities.configgroup', 'ConfigGroupEntity'),
+    'configreport': ('airgun.entities.config_report', 'ConfigReportEntity'),
+    'containerimages': ('airgun.entities.containerimages', 'ContainerImagesEntity'),
+    'containerimagetag': ('airgun.entities.containerimagetag', 'ContainerImageTagEntity'),
+    'contentcredential': ('airgun.entities.contentcredential', 'ContentCredentialEntity'),
+    'computeresource': ('airgun.entities.computeresource', 'ComputeResourceEntity'),
+    'contentview': ('airgun.entities.contentview', 'ContentViewEntity'),
+    'contentview_new': ('airgun.entities.contentview_new', 'NewContentViewEntity'),
+    'contentviewfilter': ('airgun.entities.contentviewfilter', 'ContentViewFilterEntity'),
+    'dashboard': ('airgun.entities.dashboard', 'DashboardEntity'),
+    'discoveredhosts': ('airgun.entities.discoveredhosts', 'DiscoveredHostsEntity'),
+    'discoveryrule': ('airgun.entities.discoveryrule', 'DiscoveryRuleEntity'),
+    'domain': ('airgun.entities.domain', 'DomainEntity'),
+    'errata': ('airgun.entities.errata', 'ErrataEntity'),
+    'factvalue': ('airgun.entities.fact_value', 'FactValueEntity'),
+    'flatpak_remotes': ('airgun.entities.flatpak', 'FlatpakRemotesEntity'),
+    'filter': ('airgun.entities.filter', 'FilterEntity'),
+    'file': ('airgun.entities.file', 'FilesEntity'),
+    'global_parameter': ('airgun.entities.global_parameter', 'GlobalParameterEntity'),
+    'hardwaremodel': ('airgun.entities.hardware_model', 'HardwareModelEntity'),
+    'host': ('airgun.entities.host', 'HostEntity'),
+    'host_new': ('airgun.entities.host_new', 'NewHostEntity'),
+    'hostcollection': ('airgun.entities.hostcollection', 'HostCollectionEntity'),
+    'hostgroup': ('airgun.entities.hostgroup', 'HostGroupEntity'),
+    'http_proxy': ('airgun.entities.http_proxy', 'HTTPProxyEntity'),
+    'insightsaction': ('airgun.entities.rhai.action', 'ActionEntity'),
+    'insightsinventory': ('airgun.entities.rhai.inventory', 'InventoryHostEntity'),
+    'insightsoverview': ('airgun.entities.rhai.overview', 'OverviewEntity'),
+    'insightsplan': ('airgun.entities.rhai.plan', 'PlanEntity'),
+    'insightsrule': ('airgun.entities.rhai.rule', 'RuleEntity'),
+    'jobinvocation': ('airgun.entities.job_invocation', 'JobInvocationEntity'),
+    'insightsmanage': ('airgun.entities.rhai.manage', 'ManageEntity'),
+    'jobtemplate': ('airgun.entities.job_template', 'JobTemplateEntity'),
+    'ldapauthentication': ('airgun.entities.ldap_authentication', 'LDAPAuthenticationEntity'),
+    'lifecycleenvironment': ('airgun.entities.lifecycleenvironment', 'LCEEntity'),
+    'location': ('airgun.entities.location', 'LocationEntity'),
+    'login': ('airgun.entities.login', 'LoginEntity'),
+    'operatingsystem': ('airgun.entities.os', 'OperatingSystemEntity'),
+    'organization': ('airgun.entities.organization', 'OrganizationEntity'),
+    'oscapcontent': ('airgun.entities.oscapcontent', 'OSCAPContentEntity'),
+    'oscappolicy': ('airgun.entities.oscappolicy', 'OSCAPPolicyEntity'),
+    'oscapreport': ('airgun.entities.oscapreport', 'OSCAPReportEntity'),
+    'oscaptailoringfile': ('airgun.entities.oscaptailoringfile', 'OSCAPTailoringFileEntity'),
+    'package': ('airgun.entities.package', 'PackageEntity'),
+    'media': ('airgun.entities.media', 'MediaEntity'),
+    'modulestream': ('airgun.entities.modulestream', 'ModuleStreamEntity'),
+    'partitiontable': ('airgun.entities.partitiontable', 'PartitionTableEntity'),
+    'puppetclass': ('airgun.entities.puppet_class', 'PuppetClassEntity'),
+    'puppetenvironment': ('airgun.entities.puppet_environment', 'PuppetEnvironmentEntity'),
+    'product': ('airgun.entities.product', 'ProductEntity'),
+    'provisioningtemplate': ('airgun.entities.provisioning_template', 'ProvisioningTemplateEntity'),
+    'reporttemplate': ('airgun.entities.report_template', 'ReportTemplateEntity'),
+    'redhatrepository': ('airgun.entities.redhat_repository', 'RedHatRepositoryEntity'),
+    'repository': ('airgun.entities.repository', 'RepositoryEntity'),
+    'role': ('airgun.entities.role', 'RoleEntity'),
+    'rhsso_login': ('airgun.entities.rhsso_login', 'RHSSOLoginEntity'),
+    'settings': ('airgun.entities.settings', 'SettingsEntity'),
+    'sc_parameter': ('airgun.entities.smart_class_parameter', 'SmartClassParameterEntity'),
+    'subnet': ('airgun.entities.subnet', 'SubnetEntity'),
+    'subscription': ('airgun.entities.subscription', 'SubscriptionEntity'),
+    'syncplan': ('airgun.entities.syncplan', 'SyncPlanEntity'),
+    'sync_status': ('airgun.entities.sync_status', 'SyncStatusEntity'),
+    'sync_template': ('airgun.entities.sync_templates', 'SyncTemplatesEntity'),
+    'task': ('airgun.entities.task', 'TaskEntity'),
+    'upgrade': ('airgun.entities.upgrade', 'UpgradeEntity'),
+    'user': ('airgun.entities.user', 'UserEntity'),
+    'usergroup': ('airgun.entities.usergroup', 'UserGroupEntity'),
+    'virtwho_configure': ('airgun.entities.virtwho_configure', 'VirtwhoConfigureEntity'),
+    'webhook': ('airgun.entities.webhook', 'WebhookEntity'),
+}
+
+
+class LazyEntity:
+    """Descriptor which provides an entity instance as :class:`Session`
+    attribute. Entity module is imported on first access, the instance is then
+    cached on the session the same way :class:`cached_property` would do.
+    """
+
+    def __init__(self, name, module_name, class_name):
+        self.name = name
+        self.module_name = module_name
+        self.class_name = class_name
+        self.__doc__ = f'Instance of {class_name}.'
+
+    def load(self):
+        """Import entity module and return entity class."""
+        module = importlib.import_module(self.module_name)
+        return getattr(module, self.class_name)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        entity_class = self.load()
+        # navigation steps of newly imported modules have to be available for
+        # already started session too
+        instance._sync_navigator()
+        entity = instance.__dict__[self.name] = instance._open(entity_class)
+        return entity
+
 
 class Session:
     """A session context manager which is a key controller in airgun.
@@ -207,6 +247,12 @@ class Session:
         self.navigator = None
         self.browser = None
         self.ui_session_id = None
+        self.login_cache = None
+        self.link_cache = get_link_cache()
+        self.tracer = None
+        self.metrics = CommandMetrics()
+        self.operations = OperationPoller(self)
+        self._cached_session_id = None
 
     def __call__(self, user=None, password=None, session_cookie=None, url=None, login=None):
         """Stores provided values. This allows tests to provide additional
@@ -240,10 +286,21 @@ class Session:
         NOTE: exceptions during logout or saving screenshot are just logged and
             not risen not to shadow real session result.
         """
+        if self.login_cache is not None and self._cached_session_id:
+            # the cookie may be reused by another session from now on
+            self.login_cache.release(self._cached_session_id)
         if self.browser is None:
-            # browser hasn't been started or was already closed, don't do anything
+            # browser hasn't been started or was already closed, only stop
+            # tracing (if it was started)
+            self._save_trace()
             return
         LOGGER.info('Stopping UI session %r for user %r', self.name, self._user)
+        LOGGER.debug(
+            'UI session %r waited %.1f seconds for %d absent elements',
+            self.name,
+            self.browser.plugin.absent_wait_time,
+            self.browser.plugin.absent_wait_count,
+        )
         passed = True if exc_type is None else False
         try:
             if not passed:
@@ -252,6 +309,7 @@ class Session:
             LOGGER.exception(err)
         finally:
             self.browser = self._factory.finalize(passed)
+            self._save_trace()
 
     def _open(self, entity):
         """Initializes requested entity. If this is first time session
@@ -282,8 +340,18 @@ class Session:
         self._factory = SeleniumBrowserFactory(
             test_name=self.name, session_cookie=self._session_cookie, hostname=self._hostname
         )
+        if self._session_cookie is None and self._login:
+            self.login_cache = get_login_cache()
+        if self.login_cache is not None:
+            self._cached_session_id = self.login_cache.get(self._hostname, self._user)
         try:
+            self.tracer = tracing.get_tracer(self.name)
+            if self.tracer is not None:
+                tracing.activate(self.tracer)
             selenium_browser = self._factory.get_browser()
+            if self._cached_session_id:
+                LOGGER.info('Reusing cached login of user %r', self._user)
+                self._factory.set_session_id(self._cached_session_id)
             self.browser = AirgunBrowser(selenium_browser, self)
             LOGGER.info(f'Session Id For {self.name}: {selenium_browser.session_id}')
             LOGGER.info(f'Setting initial URL to {url}')
@@ -297,11 +365,84 @@ class Session:
             self.navigator = Navigate(self.browser)
             self.navigator.dest_dict = navigator.dest_dict.copy()
             if self._session_cookie is None and self._login:
-                self.login.login({'username': self._user, 'password': self._password})
+                self._log_in()
         except Exception as exception:
             self.__exit__(*sys.exc_info())
             raise exception
 
+    def _log_in(self):
+        """Log in through the login form, unless the browser was given a
+        cached login cookie which is still valid. Successful login is stored in
+        the login cache (if enabled).
+        """
+        if self._cached_session_id:
+            if self.login.is_logged_in():
+                return
+            LOGGER.info('Cached login of user %r is stale, logging in', self._user)
+            self.forget_cached_login()
+        self.login.login({'username': self._user, 'password': self._password})
+        if self.login_cache is not None and self.login.is_logged_in():
+            cookie = self.browser.selenium.get_cookie('_session_id')
+            if cookie:
+                self._cached_session_id = cookie['value']
+                self.login_cache.store(self._hostname, self._user, self._cached_session_id)
+
+    def forget_cached_login(self):
+        """Remove login cookie used by this session from the login cache, e.g.
+        after logging out.
+        """
+        if self.login_cache is not None and self._cached_session_id:
+            self.login_cache.invalidate(self._hostname, self._user, self._cached_session_id)
+        self._cached_session_id = None
+
+    def _sync_navigator(self):
+        """Register navigation steps which were added to the global
+        :data:`airgun.navigation.navigator` after this session's navigator was
+        initialized (e.g. by lazily imported entity modules).
+        """
+        if self.navigator is None:
+            return
+        for destination, step in navigator.dest_dict.items():
+            self.navigator.dest_dict.setdefault(destination, step)
+
+    def _save_trace(self):
+        """Save the trace of the session (if tracing is enabled) as
+        f'{self.name}-YYYY-mm-dd_HH_MM_SS.trace.json' in
+        ``settings.airgun.trace_dir``, see :mod:`airgun.tracing`.
+        """
+        if self.tracer is None:
+            return
+        tracing.deactivate(self.tracer)
+        path = os.path.join(
+            settings.airgun.trace_dir,
+            f'{self.name}-{datetime.now().strftime("%Y-%m-%d_%H_%M_%S")}.trace.json',
+        )
+        try:
+            os.makedirs(settings.airgun.trace_dir, exist_ok=True)
+            self.tracer.dump(path)
+        except OSError:
+            LOGGER.exception('Failed to save trace of UI session %r', self.name)
+        else:
+            LOGGER.info('Trace of UI session %r saved to %s', self.name, path)
+        self.tracer = None
+
+    def capture_snapshots(self, entities, corpus_dir=None, destinations=None, version=None):
+        """Navigate to every destination of ``entities`` and save the pages
+        to the snapshot corpus, see :func:`airgun.snapshots.capture`.
+
+        :param list entities: names of entities, e.g. ``['architecture']``
+        :param str optional corpus_dir: directory of the corpus,
+            ``settings.airgun.snapshot_dir`` by default
+        :param dict optional destinations: navigation keyword arguments by
+            entity name and destination
+        :param str optional version: Satellite version, detected by default
+        :return: :class:`airgun.snapshots.SnapshotCorpus`
+        """
+        with tracing.using(self.tracer):
+            return snapshots.capture(
+                self, entities, root=corpus_dir, destinations=destinations, version=version
+            )
+
     def take_screenshot(self):
         """Take screen shot from the current browser window.
 
@@ -330,436 +471,6 @@ class Session:
         if not self.browser.selenium.save_screenshot(path):
             LOGGER.error('Failed to save screenshot %s', path)
 
-    @cached_property
-    def acs(self):
-        """Instance of Alternate Content Sources entity."""
-        return self._open(AcsEntity)
-
-    @cached_property
-    def about(self):
-        """Instance of About entity."""
-        return self._open(AboutEntity)
-
-    @cached_property
-    def activationkey(self):
-        """Instance of Activation Key entity."""
-        return self._open(ActivationKeyEntity)
-
-    @cached_property
-    def all_hosts(self):
-        """Instance of All Hosts entity."""
-        return self._open(AllHostsEntity)
-
-    @cached_property
-    def ansibleroles(self):
-        """Instance of Ansible Roles entity."""
-        return self._open(AnsibleRolesEntity)
-
-    @cached_property
-    def ansiblevariables(self):
-        """Instance of Ansible Variables entity."""
-        return self._open(AnsibleVariablesEntity)
-
-    @cached_property
-    def architecture(self):
-        """Instance of Architecture entity."""
-        return self._open(ArchitectureEntity)
-
-    @cached_property
-    def audit(self):
-        """Instance of Audit entity."""
-        return self._open(AuditEntity)
-
-    @cached_property
-    def bookmark(self):
-        """Instance of Bookmark entity."""
-        return self._open(BookmarkEntity)
-
-    @cached_property
-    def bootc(self):
-        """Instance of Bootc entity."""
-        return self._open(BootcEntity)
-
-    @cached_property
-    def capsule(self):
-        """Instance of Capsule entity."""
-        return self._open(CapsuleEntity)
-
-    @cached_property
-    def eol_banner(self):
-        """Instance of Bookmark entity."""
-        return self._open(EOLBannerEntity)
-
-    @cached_property
-    def cloudinventory(self):
-        """Instance of Insights Inventory Upload entity."""
-        return self._open(CloudInventoryEntity)
-
-    @cached_property
-    def iopcloudinventory(self):
-        """Instance of Insights Inventory Upload entity in IoP scenario."""
-        return self._open(IopCloudInventoryEntity)
-
-    @cached_property
-    def recommendationstab(self):
-        """Instance of Recommendations entity."""
-        return self._open(RecommendationsTabEntity)
-
-    @cached_property
-    def cloudinsights(self):
-        """Instance of Insights entity."""
-        return self._open(CloudInsightsEntity)
-
-    @cached_property
-    def cloudvulnerability(self):
-        """Instance of Insights entity."""
-        return self._open(CloudVulnerabilityEntity)
-
-    @cached_property
-    def computeprofile(self):
-        """Instance of Compute Profile entity."""
-        return self._open(ComputeProfileEntity)
-
-    @cached_property
-    def configgroup(self):
-        """Instance of Config Group entity."""
-        return self._open(ConfigGroupEntity)
-
-    @cached_property
-    def configreport(self):
-        """Instance of Config Report entity."""
-        return self._open(ConfigReportEntity)
-
-    @cached_property
-    def containerimages(self):
-        """Instance of Container Images entity."""
-        return self._open(ContainerImagesEntity)
-
-    @cached_property
-    def containerimagetag(self):
-        """Instance of Container Image Tags entity."""
-        return self._open(ContainerImageTagEntity)
-
-    @cached_property
-    def contentcredential(self):
-        """Instance of Content Credential entity."""
-        return self._open(ContentCredentialEntity)
-
-    @cached_property
-    def computeresource(self):
-        """Instance of ComputeResource entity."""
-        return self._open(ComputeResourceEntity)
-
-    @cached_property
-    def contentview(self):
-        """Instance of Content View entity."""
-        return self._open(ContentViewEntity)
-
-    @cached_property
-    def contentview_new(self):
-        """Instance of the New Content View entity."""
-        return self._open(NewContentViewEntity)
-
-    @cached_property
-    def contentviewfilter(self):
-        """Instance of Content View Filter entity."""
-        return self._open(ContentViewFilterEntity)
-
-    @cached_property
-    def dashboard(self):
-        """Instance of Dashboard entity."""
-        return self._open(DashboardEntity)
-
-    @cached_property
-    def discoveredhosts(self):
-        return self._open(DiscoveredHostsEntity)
-
-    @cached_property
-    def discoveryrule(self):
-        """Instance of Discovery Rule entity."""
-        return self._open(DiscoveryRuleEntity)
-
-    @cached_property
-    def domain(self):
-        """Instance of domain entity."""
-        return self._open(DomainEntity)
-
-    @cached_property
-    def errata(self):
-        """Instance of Errata entity."""
-        return self._open(ErrataEntity)
-
-    @cached_property
-    def factvalue(self):
-        """Instance of Fact Value entity."""
-        return self._open(FactValueEntity)
-
-    @cached_property
-    def flatpak_remotes(self):
-        """Instance of Flatpak Remotes entity."""
-        return self._open(FlatpakRemotesEntity)
-
-    @cached_property
-    def filter(self):
-        """Instance of Filter entity."""
-        return self._open(FilterEntity)
-
-    @cached_property
-    def file(self):
-        """Instance of Files entity."""
-        return self._open(FilesEntity)
-
-    @cached_property
-    def global_parameter(self):
-        """Instance of Global Parameters entity."""
-        return self._open(GlobalParameterEntity)
-
-    @cached_property
-    def hardwaremodel(self):
-        """Instance of Hardware Model entity."""
-        return self._open(HardwareModelEntity)
-
-    @cached_property
-    def host(self):
-        """Instance of Host entity."""
-        return self._open(HostEntity)
-
-    @cached_property
-    def host_new(self):
-        """Instance of Host entity."""
-        return self._open(NewHostEntity)
-
-    @cached_property
-    def hostcollection(self):
-        """Instance of Host Collection entity."""
-        return self._open(HostCollectionEntity)
-
-    @cached_property
-    def hostgroup(self):
-        """Instance of Host Group entity."""
-        return self._open(HostGroupEntity)
-
-    @cached_property
-    def http_proxy(self):
-        """Instance of HTTP Proxy entity."""
-        return self._open(HTTPProxyEntity)
-
-    @cached_property
-    def insightsaction(self):
-        """Instance of RHAI Action entity."""
-        return self._open(ActionEntity)
-
-    @cached_property
-    def insightsinventory(self):
-        """Instance of RHAI Inventory entity."""
-        return self._open(InventoryHostEntity)
-
-    @cached_property
-    def insightsoverview(self):
-        """Instance of RHAI Overview entity."""
-        return self._open(OverviewEntity)
-
-    @cached_property
-    def insightsplan(self):
-        """Instance of RHAI Plan entity."""
-        return self._open(PlanEntity)
-
-    @cached_property
-    def insightsrule(self):
-        """Instance of RHAI Rule entity."""
-        return self._open(RuleEntity)
-
-    @cached_property
-    def jobinvocation(self):
-        """Instance of Job Invocation entity."""
-        return self._open(JobInvocationEntity)
-
-    @cached_property
-    def insightsmanage(self):
-        """Instance of RHAI Manage entity."""
-        return self._open(ManageEntity)
-
-    @cached_property
-    def jobtemplate(self):
-        """Instance of Job Template entity."""
-        return self._open(JobTemplateEntity)
-
-    @cached_property
-    def ldapauthentication(self):
-        """Instance of LDAP Authentication entity."""
-        return self._open(LDAPAuthenticationEntity)
-
-    @cached_property
-    def lifecycleenvironment(self):
-        """Instance of LCE entity."""
-        return self._open(LCEEntity)
-
-    @cached_property
-    def location(self):
-        """Instance of Location entity."""
-        return self._open(LocationEntity)
-
-    @cached_property
-    def login(self):
-        """Instance of Login entity."""
-        return self._open(LoginEntity)
-
-    @cached_property
-    def operatingsystem(self):
-        """Instance of Operating System entity."""
-        return self._open(OperatingSystemEntity)
-
-    @cached_property
-    def organization(self):
-        """Instance of Organization entity."""
-        return self._open(OrganizationEntity)
-
-    @cached_property
-    def oscapcontent(self):
-        """Instance of OSCAP Content entity."""
-        return self._open(OSCAPContentEntity)
-
-    @cached_property
-    def oscappolicy(self):
-        """Instance of OSCAP Policy entity."""
-        return self._open(OSCAPPolicyEntity)
-
-    @cached_property
-    def oscapreport(self):
-        """Instance of OSCAP Report entity."""
-        return self._open(OSCAPReportEntity)
-
-    @cached_property
-    def oscaptailoringfile(self):
-        """Instance of OSCAP Tailoring File entity."""
-        return self._open(OSCAPTailoringFileEntity)
-
-    @cached_property
-    def package(self):
-        """Instance of Packge entity."""
-        return self._open(PackageEntity)
-
-    @cached_property
-    def media(self):
-        """Instance of Media entity."""
-        return self._open(MediaEntity)
-
-    @cached_property
-    def modulestream(self):
-        """Instance of Module Stream entity."""
-        return self._open(ModuleStreamEntity)
-
-    @cached_property
-    def partitiontable(self):
-        """Instance of Partition Table entity."""
-        return self._open(PartitionTableEntity)
-
-    @cached_property
-    def puppetclass(self):
-        """Instance of Puppet Class entity."""
-        return self._open(PuppetClassEntity)
-
-    @cached_property
-    def puppetenvironment(self):
-        """Instance of Puppet Environment entity."""
-        return self._open(PuppetEnvironmentEntity)
-
-    @cached_property
-    def product(self):
-        """Instance of Product entity."""
-        return self._open(ProductEntity)
-
-    @cached_property
-    def provisioningtemplate(self):
-        """Instance of Provisioning Template entity."""
-        return self._open(ProvisioningTemplateEntity)
-
-    @cached_property
-    def reporttemplate(self):
-        """Instance of Report Template entity."""
-        return self._open(ReportTemplateEntity)
-
-    @cached_property
-    def redhatrepository(self):
-        """Instance of Red Hat Repository entity."""
-        return self._open(RedHatRepositoryEntity)
-
-    @cached_property
-    def repository(self):
-        """Instance of Repository entity."""
-        return self._open(RepositoryEntity)
-
-    @cached_property
-    def role(self):
-        """Instance of Role entity."""
-        return self._open(RoleEntity)
-
-    @cached_property
-    def rhsso_login(self):
-        """Instance of RHSSOLoginEntity entity."""
-        return self._open(RHSSOLoginEntity)
-
-    @cached_property
-    def settings(self):
-        """Instance of Settings entity."""
-        return self._open(SettingsEntity)
-
-    @cached_property
-    def sc_parameter(self):
-        """Instance of Smart Class Parameter entity."""
-        return self._open(SmartClassParameterEntity)
-
-    @cached_property
-    def subnet(self):
-        """Instance of Subnet entity."""
-        return self._open(SubnetEntity)
-
-    @cached_property
-    def subscription(self):
-        """Instance of Subscription entity."""
-        return self._open(SubscriptionEntity)
-
-    @cached_property
-    def syncplan(self):
-        """Instance of Sync Plan entity."""
-        return self._open(SyncPlanEntity)
-
-    @cached_property
-    def sync_status(self):
-        """Instance of Sync Status entity"""
-        return self._open(SyncStatusEntity)
-
-    @cached_property
-    def sync_template(self):
-        """Instance of Sync Templates entity"""
-        return self._open(SyncTemplatesEntity)
-
-    @cached_property
-    def task(self):
-        """Instance of Task entity."""
-        return self._open(TaskEntity)
-
-    @cached_property
-    def upgrade(self):
-        """Instance of Upgrade entity."""
-        return self._open(UpgradeEntity)
-
-    @cached_property
-    def user(self):
-        """Instance of User entity."""
-        return self._open(UserEntity)
-
-    @cached_property
-    def usergroup(self):
-        """Instance of User Group entity."""
-        return self._open(UserGroupEntity)
-
-    @cached_property
-    def virtwho_configure(self):
-        """Instance of Virtwho Configure entity."""
-        return self._open(VirtwhoConfigureEntity)
-
-    @cached_property
-    def webhook(self):
-        """Instance of Webhook entity."""
-        return self._open(WebhookEntity)
+
+for _name, (_module_name, _class_name) in ENTITIES.items():
+    setattr(Session, _name, LazyEntity(_name, _module_name, _class_name))
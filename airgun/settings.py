@@ -23,6 +23,23 @@ class AirgunSettings:
     def __init__(self):
         self.verbosity = None
         self.tmp_dir = None
+        self.login_cache_dir = None
+        self.login_cache_ttl = 1800
+        self.ensure_page_safe_mode = 'polling'
+        self.ensure_page_safe_settle = 0.3
+        self.ensure_page_safe_skip_unchanged = False
+        self.table_per_page = None
+        self.table_restore_per_page = False
+        self.polling_profile = 'adaptive'
+        self.polling_initial_delay = 0.1
+        self.polling_factor = 2
+        self.polling_max_delay = 10
+        self.polling_jitter = 0.1
+        self.timeout_scale = 1
+        self.navigation_force_menu = False
+        self.link_cache_size = 256
+        self.trace_dir = None
+        self.snapshot_dir = None
 
 
 class SatelliteSettings:
@@ -39,6 +56,15 @@ class SeleniumSettings:
         self.webdriver = None
         self.webdriver_binary = None
         self.browseroptions = None
+        self.pool_size = 0
+        self.pool_max_age = None
+        self.pool_max_uses = None
+
+
+class WaitsSettings:
+    """Timeouts and poll intervals of named waits, as ``<name>_timeout`` and
+    ``<name>_delay`` options. Defaults are defined by :mod:`airgun.waits`.
+    """
 
 
 class WebKaifukuSettings:
@@ -52,6 +78,7 @@ class Settings:
         self.airgun = AirgunSettings()
         self.satellite = SatelliteSettings()
         self.selenium = SeleniumSettings()
+        self.waits = WaitsSettings()
         self.webkaifuku = WebKaifukuSettings()
 
     def _configure_logging(self):
@@ -0,0 +1,172 @@
+"""Corpus of HTML snapshots of Satellite pages.
+
+:meth:`airgun.session.Session.capture_snapshots` navigates to every
+destination registered for given entities and saves the page, so locator and
+performance tests can run against real Satellite pages offline, see
+:mod:`airgun.offline`::
+
+    with Session('snapshots') as session:
+        session.capture_snapshots(
+            ['architecture', 'product'],
+            destinations={'product': {'Edit': {'entity_name': 'Custom product'}}},
+        )
+
+The corpus is stored in ``settings.airgun.snapshot_dir`` (unless another
+directory is passed), with a directory per Satellite version::
+
+    <snapshot_dir>/<satellite version>/index.json
+    <snapshot_dir>/<satellite version>/<entity>/<destination>.html.gz
+
+``index.json`` describes every snapshot by ``<entity>/<destination>`` key:
+URL of the page, whether ``am_i_here`` of the destination confirmed the
+navigation got there, capture time and file of the snapshot. Destinations
+which could not be navigated to (e.g. those needing navigation arguments which
+were not passed) have ``error`` instead of the file.
+"""
+
+from datetime import datetime
+import gzip
+import json
+import logging
+import os
+
+from airgun import settings, waits
+from airgun.exceptions import APIRequestError
+
+LOGGER = logging.getLogger(__name__)
+
+# Version of the corpus layout, stored in index.json
+CORPUS_FORMAT = 1
+
+
+def satellite_version(browser):
+    """Return version of Satellite the browser is logged in to, ``None`` if it
+    is not known.
+    """
+    try:
+        return browser.api_get('/api/status').get('version') or None
+    except APIRequestError:
+        return None
+
+
+class SnapshotCorpus:
+    """Snapshots of pages of a single Satellite version."""
+
+    def __init__(self, root, version):
+        """
+        :param str root: directory of the corpus
+        :param str version: Satellite version
+        """
+        self.version = version
+        self.path = os.path.join(root, version)
+        self.index_path = os.path.join(self.path, 'index.json')
+        self.index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path) as index_file:
+                index = json.load(index_file)
+        except FileNotFoundError:
+            return {}
+        if index.get('format') != CORPUS_FORMAT:
+            raise ValueError(
+                f'Snapshot corpus {self.path} has format {index.get("format")}, '
+                f'expected {CORPUS_FORMAT}'
+            )
+        return index['snapshots']
+
+    def save_index(self):
+        """Write the index of the snapshots."""
+        os.makedirs(self.path, exist_ok=True)
+        with open(self.index_path, 'w') as index_file:
+            json.dump(
+                {'format': CORPUS_FORMAT, 'version': self.version, 'snapshots': self.index},
+                index_file,
+                indent=2,
+                sort_keys=True,
+            )
+
+    def snapshot_path(self, entity, destination):
+        """Return path of the snapshot of ``destination`` of ``entity``."""
+        return os.path.join(self.path, entity, f'{destination}.html.gz')
+
+    def add(self, entity, destination, page_source, url, am_i_here):
+        """Save the snapshot of ``destination`` of ``entity`` (replacing any
+        previous one) and record it in the index.
+        """
+        path = self.snapshot_path(entity, destination)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(path, 'wt', encoding='utf-8') as snapshot:
+            snapshot.write(page_source)
+        self.index[f'{entity}/{destination}'] = {
+            'url': url,
+            'am_i_here': am_i_here,
+            'file': os.path.relpath(path, self.path),
+            'captured': datetime.now().isoformat(timespec='seconds'),
+        }
+
+    def add_error(self, entity, destination, error):
+        """Record that ``destination`` of ``entity`` could not be captured."""
+        self.index[f'{entity}/{destination}'] = {
+            'error': error,
+            'captured': datetime.now().isoformat(timespec='seconds'),
+        }
+
+
+def capture(session, entities, root=None, destinations=None, version=None):
+    """Navigate to every destination of ``entities`` and save the settled page
+    to the snapshot corpus, see module documentation.
+
+    :param airgun.session.Session session: logged in session
+    :param list entities: names of entities (session attributes), e.g.
+        ``['architecture', 'product']``
+    :param str optional root: directory of the corpus,
+        ``settings.airgun.snapshot_dir`` by default
+    :param dict optional destinations: navigation keyword arguments by entity
+        name and destination, e.g. ``{'product': {'Edit': {'entity_name':
+        'foo'}}}``
+    :param str optional version: Satellite version, read from the status API
+        by default
+    :return: the corpus
+    :rtype: SnapshotCorpus
+    """
+    root = root or settings.airgun.snapshot_dir
+    if not root:
+        raise ValueError('Snapshot corpus directory is not set')
+    destinations = destinations or {}
+    corpus = None
+    for entity_name in entities:
+        # instantiating the entity starts the browser and registers its
+        # navigation steps
+        entity = getattr(session, entity_name)
+        if corpus is None:
+            version = version or satellite_version(session.browser) or 'unknown'
+            corpus = SnapshotCorpus(root, version)
+        for destination in sorted(session.navigator.list_destinations(entity)):
+            kwargs = destinations.get(entity_name, {}).get(destination, {})
+            _capture_destination(
+                session,
+                corpus,
+                entity_name=entity_name,
+                entity=entity,
+                destination=destination,
+                kwargs=kwargs,
+            )
+        corpus.save_index()
+    return corpus
+
+
+def _capture_destination(session, corpus, *, entity_name, entity, destination, kwargs):
+    navigator = session.navigator
+    browser = session.browser
+    LOGGER.info('Capturing snapshot of %s %s', entity_name, destination)
+    try:
+        navigator.navigate(entity, destination, **kwargs)
+    except Exception as err:  # noqa: BLE001 - any destination may fail, capture the rest
+        LOGGER.warning('Failed to navigate to %s %s: %s', entity_name, destination, err)
+        corpus.add_error(entity_name, destination, f'{type(err).__name__}: {err}')
+        return
+    waits.page_stable(browser, silent_failure=True)
+    step = navigator.get_class(entity, destination)(entity, navigator, navigator.logger)
+    am_i_here = bool(step._check_here(**kwargs))
+    corpus.add(entity_name, destination, browser.selenium.page_source, browser.url, am_i_here)
@@ -0,0 +1,186 @@
+"""Timing trace of UI sessions.
+
+When ``settings.airgun.trace_dir`` is set, every :class:`airgun.session.Session`
+records for how long it navigated, waited for the page to be safe, waited for
+conditions and slept, together with the entity method which did it. The trace
+is written to ``<trace_dir>/<session name>-<timestamp>.trace.json`` when the
+session exits, in Chrome trace event format, which can be opened in Perfetto
+(https://ui.perfetto.dev) or ``about://tracing`` in Chrome.
+"""
+
+from contextlib import contextmanager, nullcontext
+import functools
+import json
+import os
+import threading
+import time
+
+from airgun import settings
+
+_local = threading.local()
+
+
+class Tracer:
+    """Records spans of time as Chrome trace events."""
+
+    def __init__(self, name):
+        """
+        :param str name: name of the trace, e.g. session name
+        """
+        self.name = name
+        self.events = []
+        self.pid = os.getpid()
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def span(self, name, category, **args):
+        """Record duration of the ``with`` block.
+
+        :param str name: name of the span
+        :param str category: category of the span, e.g. ``wait``
+        :param args: any additional values to store with the span
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            entity_method = current_entity_method()
+            if entity_method is not None:
+                args.setdefault('entity_method', entity_method)
+            self.events.append(
+                {
+                    'name': name,
+                    'cat': category,
+                    'ph': 'X',
+                    'ts': round((start - self._start) * 1e6),
+                    'dur': round((end - start) * 1e6),
+                    'pid': self.pid,
+                    'tid': threading.get_ident(),
+                    'args': args,
+                }
+            )
+
+    def to_dict(self):
+        """Return the trace in Chrome trace event format."""
+        metadata = {
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': self.pid,
+            'args': {'name': self.name},
+        }
+        return {'traceEvents': [metadata, *self.events], 'displayTimeUnit': 'ms'}
+
+    def dump(self, path):
+        """Write the trace to ``path``."""
+        with open(path, 'w') as trace_file:
+            json.dump(self.to_dict(), trace_file)
+
+
+def get_tracer(name):
+    """Return :class:`Tracer` if tracing is enabled by airgun settings, or
+    ``None``.
+    """
+    if not settings.airgun.trace_dir:
+        return None
+    return Tracer(name)
+
+
+def activate(tracer):
+    """Make ``tracer`` record all spans of the current thread until
+    :func:`deactivate` is called, unless a block run by :func:`using` another
+    tracer records them.
+    """
+    _stack('tracers').append(tracer)
+
+
+def deactivate(tracer):
+    """Stop recording spans by ``tracer``."""
+    tracers = _stack('tracers')
+    if tracer in tracers:
+        tracers.remove(tracer)
+
+
+@contextmanager
+def using(tracer):
+    """Record spans of the ``with`` block by ``tracer``, e.g. the tracer of the
+    session an entity method belongs to, or none if ``tracer`` is ``None``.
+    """
+    tracers = _stack('tracers')
+    tracers.append(tracer)
+    try:
+        yield
+    finally:
+        tracers.pop()
+
+
+def _stack(name):
+    if not hasattr(_local, name):
+        setattr(_local, name, [])
+    return getattr(_local, name)
+
+
+def current_entity_method():
+    """Return qualified name of the innermost entity method being called,
+    ``None`` outside of entity methods.
+    """
+    entity_methods = _stack('entity_methods')
+    return entity_methods[-1] if entity_methods else None
+
+
+def current_navigate_step():
+    """Return name of the innermost navigate step being navigated to, ``None``
+    outside of navigation.
+    """
+    navigate_steps = _stack('navigate_steps')
+    return navigate_steps[-1] if navigate_steps else None
+
+
+@contextmanager
+def navigate_step(name):
+    """Mark the ``with`` block as navigation to navigate step ``name``."""
+    navigate_steps = _stack('navigate_steps')
+    navigate_steps.append(name)
+    try:
+        yield
+    finally:
+        navigate_steps.pop()
+
+
+def span(name, category, **args):
+    """Record the ``with`` block by the active tracer, if any, see
+    :meth:`Tracer.span`.
+    """
+    tracers = _stack('tracers')
+    if not tracers or tracers[-1] is None:
+        return nullcontext()
+    return tracers[-1].span(name, category, **args)
+
+
+def entity_method(method):
+    """Decorate entity method, so spans recorded while it is running are
+    attributed to it and recorded by the tracer of the session of the entity,
+    even if another session is active in the thread.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        entity_methods = _stack('entity_methods')
+        entity_methods.append(method.__qualname__)
+        session = getattr(self, 'session', None)
+        tracer_context = (
+            using(getattr(session, 'tracer', None)) if session is not None else nullcontext()
+        )
+        try:
+            with tracer_context, span(method.__qualname__, 'entity'):
+                return method(self, *args, **kwargs)
+        finally:
+            entity_methods.pop()
+
+    return wrapper
+
+
+def sleep(seconds):
+    """Sleep for ``seconds``, recorded as a span of ``sleep`` category."""
+    with span(f'sleep {seconds}s', 'sleep'):
+        time.sleep(seconds)
@@ -1,8 +1,18 @@
 import functools
-import time
 
 from wait_for import TimedOutError
 
+from airgun import tracing
+
+
+def to_bool(value):
+    """Convert a setting value, which is a string when read from settings file,
+    to boolean.
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', '1', 'yes', 'on')
+    return bool(value)
+
 
 def merge_dict(values, new_values):
     """Update dict values with new values from new_values dict
@@ -89,7 +99,7 @@ def retry_navigation(method):
             except TimedOutError:
                 if i < attempts - 1:
                     args[0].view.parent.browser.refresh()
-                    time.sleep(0.5)
+                    tracing.sleep(0.5)
                 else:
                     raise
 
@@ -1,4 +1,3 @@
-from wait_for import wait_for
 from widgetastic.utils import ParametrizedLocator
 from widgetastic.widget import Text, View
 from widgetastic_patternfly import Tab
@@ -8,6 +7,7 @@ from widgetastic_patternfly5.ouia import Text as PF5OUIAText
 
 from airgun.exceptions import ReadOnlyWidgetError
 from airgun.views.common import BaseLoggedInView
+from airgun.waits import wait_for
 from airgun.widgets import Accordion
 
 
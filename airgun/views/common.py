@@ -126,6 +126,9 @@ class PF5ModalViewMixin(WTMixin):
 
     @property
     def is_displayed(self):
+        if self.browser.is_page_settled():
+            # nothing is going to change, no need to wait for the modal to appear
+            return self.browser.probe(self.ROOT, visible=True) is not None
         return (
             self.browser.wait_for_element(self.ROOT, visible=True, timeout=10, exception=False)
             is not None
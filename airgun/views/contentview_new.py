@@ -1,4 +1,3 @@
-from wait_for import wait_for
 from widgetastic.utils import ParametrizedLocator
 from widgetastic.widget import Checkbox, ParametrizedView, Text, TextInput, View
 from widgetastic_patternfly import BreadCrumb, Tab
@@ -22,6 +21,7 @@ from airgun.views.common import (
     SearchableViewMixinPF4,
     TableRowKebabMenu,
 )
+from airgun.waits import wait_for
 from airgun.widgets import (
     ConfirmationDialog,
     EditableEntry,
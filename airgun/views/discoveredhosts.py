@@ -1,9 +1,9 @@
-from wait_for import wait_for
 from widgetastic.widget import Checkbox, Select, TableColumn, TableRow, Text
 from widgetastic_patternfly import BreadCrumb, Button
 
 from airgun.views.common import BaseLoggedInView, SearchableViewMixin
 from airgun.views.host import HostCreateView
+from airgun.waits import wait_for
 from airgun.widgets import (
     ActionsDropdown,
     FilteredDropdown,
@@ -1,7 +1,5 @@
 import re
-import time
 
-from wait_for import wait_for
 from widgetastic.utils import ParametrizedLocator
 from widgetastic.widget import (
     Checkbox,
@@ -31,11 +29,13 @@ from widgetastic_patternfly5.ouia import (
     TextInput as PF5OUIATextInput,
 )
 
+from airgun import waits
 from airgun.views.all_hosts import CVESelect
 from airgun.views.common import BaseLoggedInView, SatTab, SearchableViewMixinPF4
 from airgun.views.host_new import MenuToggleButtonMenu, NewCVEnvAssignmentSection
 from airgun.views.job_invocation import JobInvocationCreateView, JobInvocationStatusView
 from airgun.views.task import TaskDetailsView
+from airgun.waits import wait_for
 from airgun.widgets import (
     ActionsDropdown,
     BaseMultiSelect,
@@ -657,7 +657,7 @@ class HostRegisterView(BaseLoggedInView):
                     logger=self.logger,
                 )
                 self.general.__getattribute__(field).fill(field_value)
-                time.sleep(1)
+                waits.page_stable(self.browser)
 
 
 class RepositoryListView(View):
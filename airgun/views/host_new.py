@@ -1,8 +1,5 @@
-import time
-
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
-from wait_for import wait_for
 from widgetastic.utils import ParametrizedLocator
 from widgetastic.widget import (
     Checkbox,
@@ -46,8 +43,10 @@ from widgetastic_patternfly5.ouia import (
     Text as PF5OUIAText,
 )
 
+from airgun import waits
 from airgun.views.cloud_insights import BulkSelectMenuToggle
 from airgun.views.common import BaseLoggedInView, PF5LCESelectorGroup, SearchableViewMixinPF4
+from airgun.waits import wait_for
 from airgun.widgets import (
     Accordion,
     ActionsDropdown,
@@ -184,7 +183,8 @@ class CVESelect(Select):
         display (e.g. 47 chars + "..."), so we search by prefix instead.
         """
         self.open()
-        time.sleep(1)  # Wait for dropdown to fully render
+        # Wait for dropdown to fully render
+        waits.element_displayed(self.browser, self.ITEMS_LOCATOR, silent_failure=True)
 
         # For long CV names, search by truncated prefix (first 45 chars)
         # For short CV names, the full name will be contained in "NAME Version 1.0"
@@ -200,7 +200,13 @@ class CVESelect(Select):
         try:
             elem = self.browser.element(locator)
             self.browser.click(elem)
-            time.sleep(0.5)
+            wait_for(
+                lambda: not self.is_open,
+                timeout=5,
+                delay=0.2,
+                handle_exception=True,
+                silent_failure=True,
+            )
         except NoSuchElementException:
             # If prefix match fails, try parent's method
             self.close()
@@ -303,15 +309,16 @@ class BreadcrumbSwitcher(Widget):
         self.search_input.fill(hostname)
 
         # Wait for search to filter the results
-        time.sleep(1)
+        menu_item_locator = self.MENU_ITEM_LOCATOR.format(hostname=hostname)
+        waits.element_displayed(self.browser, menu_item_locator)
 
         # Click on the menu item for the desired host
-        menu_item_locator = self.MENU_ITEM_LOCATOR.format(hostname=hostname)
         menu_item = self.browser.element(menu_item_locator)
         self.browser.click(menu_item)
 
-        # Wait for page to update after navigation
-        time.sleep(3)
+        # Wait for page of the host to load
+        wait_for(lambda: f'/new/hosts/{hostname}' in self.browser.url, timeout=10, delay=0.5)
+        self.browser.plugin.ensure_page_safe()
 
 
 class NewHostDetailsView(BaseLoggedInView):
@@ -1334,11 +1341,11 @@ class ManageColumnsView(BaseLoggedInView):
 
     def submit(self):
         """Submit the dialog and wait for the page to reload."""
+        mark = waits.mark_page(self.browser)
         self.confirm_dialog.click()
         # the submit and page reload does not kick in immediately
         # so ensure_page_safe() does not catches it
-        time.sleep(2)
-        self.browser.plugin.ensure_page_safe()
+        waits.page_reloaded(self.browser, mark)
 
 
 class NewCVEnvAssignmentSection(PF5LCESelectorGroup):
@@ -1,7 +1,5 @@
-from time import sleep
-
 from selenium.common.exceptions import NoSuchElementException
-from wait_for import TimedOutError, wait_for
+from wait_for import TimedOutError
 from widgetastic.widget import Checkbox, Text, TextInput, View
 from widgetastic_patternfly import BreadCrumb
 from widgetastic_patternfly5 import (
@@ -19,12 +17,14 @@ from widgetastic_patternfly5.ouia import (
     TextInput as PF5OUIATextInput,
 )
 
+from airgun import waits
 from airgun.views.common import (
     BaseLoggedInView,
     PF5WizardStepView,
     SatTable,
     SearchableViewMixin,
 )
+from airgun.waits import wait_for
 from airgun.widgets import PF5DataList, PF5LabeledExpandableSection
 
 
@@ -214,8 +214,7 @@ class JobInvocationCreateView(BaseLoggedInView):
         def click_next_if_available():
             if self.next_button.is_displayed and self.next_button.is_enabled:
                 self.next_button.click()
-                self.browser.plugin.ensure_page_safe()
-                sleep(1)
+                waits.wizard_step_rendered(self)
 
         def extract_step_values(prefix):
             """Extract values with a specific prefix and strip the prefix from keys."""
@@ -1,4 +1,3 @@
-from wait_for import wait_for
 from widgetastic.widget import (
     Checkbox,
     ConditionalSwitchableView,
@@ -17,6 +16,7 @@ from airgun.views.common import (
     TaskDetailsView,
 )
 from airgun.views.syncplan import SyncPlanCreateView
+from airgun.waits import wait_for
 from airgun.widgets import (
     ActionsDropdown,
     ConfirmationDialog,
@@ -1,8 +1,8 @@
-from wait_for import wait_for
 from widgetastic.widget import GenericLocatorWidget, Text, TextInput, View
 from widgetastic_patternfly5.ouia import Switch as PF5OUIASwitch
 
 from airgun.views.common import BaseLoggedInView
+from airgun.waits import wait_for
 
 
 def _wait_for_spinner(widget):
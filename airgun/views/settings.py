@@ -1,8 +1,8 @@
-from wait_for import wait_for
 from widgetastic.widget import Table, Text
 from widgetastic_patternfly import Button
 
 from airgun.views.common import BaseLoggedInView, SatTab, SearchableViewMixin
+from airgun.waits import wait_for
 from airgun.widgets import FieldWithEditButton
 
 
@@ -1,4 +1,3 @@
-from wait_for import wait_for
 from widgetastic.widget import (
     Checkbox,
     FileInput,
@@ -18,6 +17,7 @@ from airgun.views.common import (
     SearchableViewMixinPF4,
 )
 from airgun.views.host_new import ManageColumnsView
+from airgun.waits import wait_for
 from airgun.widgets import (
     ConfirmationDialog,
     ItemsListReadOnly,
@@ -1,4 +1,3 @@
-from wait_for import wait_for
 from widgetastic.exceptions import NoSuchElementException
 from widgetastic.widget import Text, Widget
 from widgetastic_patternfly5 import Button as PF5Button
@@ -6,6 +5,7 @@ from widgetastic_patternfly5.components.table import PatternflyTable, Patternfly
 from widgetastic_patternfly5.ouia import Switch as PF5OUIASwitch
 
 from airgun.views.common import BaseLoggedInView
+from airgun.waits import wait_for
 
 
 class NodeNotFoundError(Exception):
@@ -137,8 +137,115 @@ class SyncStatusTreeTable(PatternflyTable):
     ROWS = './tbody/tr'
     HEADERS = './thead/tr/th|./thead/tr/td'
     EXPAND_ALL_BUTTON = './thead//th[contains(@class, "pf-v5-c-table__toggle")]//button'
+    RESULT_COLUMN = 'Progress / Result'
     Row = SyncStatusTreeRow
 
+    # Tree structure of all rows in a single pass: level, number of children
+    # and name of every row, see tree_index(). The rows are not read again while
+    # the index is valid, i.e. until rows are added, removed or their names or
+    # levels change, which resets the token kept on the tbody element.
+    TREE_INDEX_SCRIPT = """
+        var table = arguments[0], known = arguments[1];
+        var tbody = table.tBodies[0];
+        if (!tbody) { return null; }
+        var hidden = tbody.querySelectorAll(':scope > tr[hidden]').length;
+        if (known !== null && tbody.__airgunTreeIndex === known) {
+          return {token: known, hidden: hidden, rows: null};
+        }
+        if (!tbody.__airgunTreeObserver) {
+          tbody.__airgunTreeObserver = new MutationObserver(function (records) {
+            for (var i = 0; i < records.length; i++) {
+              var target = records[i].target;
+              if (target === tbody || records[i].attributeName === 'aria-level' ||
+                  (target.nodeType === 1 ? target : target.parentNode).closest('th')) {
+                tbody.__airgunTreeIndex = null;
+                return;
+              }
+            }
+          });
+          tbody.__airgunTreeObserver.observe(tbody, {
+            childList: true, subtree: true, characterData: true, attributes: true,
+            attributeFilter: ['aria-level']});
+        }
+        var token = Date.now() + ':' + Math.random();
+        tbody.__airgunTreeIndex = token;
+        var rows = [];
+        for (var i = 0; i < tbody.rows.length; i++) {
+          var row = tbody.rows[i];
+          var name = row.querySelector(
+            "div.pf-v5-c-table__tree-view-text span[role='button']");
+          rows.push([
+            parseInt(row.getAttribute('aria-level'), 10) || 1,
+            parseInt(row.getAttribute('aria-setsize'), 10) || 0,
+            name ? name.textContent.trim() : null]);
+        }
+        return {token: token, hidden: hidden, rows: rows};
+        """
+
+    # rowCell(row, column): cell of row in column at header position column,
+    # the same cell as row[column] of PatternflyTableRow, which skips the <th>
+    # of the row
+    ROW_CELL_FUNCTION = """
+        function rowCell(row, column) {
+          var cells = row.querySelectorAll(':scope > td');
+          return row.querySelector(':scope > th') ? cells[Math.max(column - 1, 0)] : cells[column];
+        }
+        """
+
+    # Text of cells in column at header position arguments[2] of rows at
+    # positions arguments[1] (all rows if null)
+    ROW_CELLS_SCRIPT = (
+        ROW_CELL_FUNCTION
+        + """
+        var tbody = arguments[0].tBodies[0], positions = arguments[1];
+        var column = arguments[2], result = [];
+        if (positions === null) {
+          positions = [];
+          for (var i = 0; i < tbody.rows.length; i++) { positions.push(i); }
+        }
+        for (var i = 0; i < positions.length; i++) {
+          var cell = rowCell(tbody.rows[positions[i]], column);
+          result.push(cell ? cell.innerText.trim() : null);
+        }
+        return result;
+        """
+    )
+
+    # Whether rows at positions arguments[1] show a progress bar and text of
+    # their cell in column at header position arguments[2]
+    PROGRESS_SCRIPT = (
+        ROW_CELL_FUNCTION
+        + """
+        var tbody = arguments[0].tBodies[0], positions = arguments[1];
+        var column = arguments[2], result = [];
+        for (var i = 0; i < positions.length; i++) {
+          var row = tbody.rows[positions[i]], cell = rowCell(row, column);
+          result.push([
+            row.querySelector("div[class*='pf-v5-c-progress']") !== null,
+            cell ? cell.innerText.trim() : null]);
+        }
+        return result;
+        """
+    )
+
+    # Positions of rows whose checkbox is checked, out of rows at positions
+    # arguments[1]
+    CHECKED_ROWS_SCRIPT = """
+        var tbody = arguments[0].tBodies[0], positions = arguments[1], checked = [];
+        for (var i = 0; i < positions.length; i++) {
+          var checkbox = tbody.rows[positions[i]].querySelector("input[type='checkbox']");
+          if (checkbox && checkbox.checked) { checked.push(positions[i]); }
+        }
+        return checked;
+        """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._index_token = None
+        # [(path, position, number of children)] of all named rows, in order
+        self._index_entries = []
+        self._index_paths = {}
+
     def _visible_rows(self):
         """Yield only rows that are not hidden (i.e. not collapsed children)."""
         for row in self:
@@ -166,74 +273,161 @@ class SyncStatusTreeTable(PatternflyTable):
             delay=0.5,
         )
 
-    def read(self):
-        """Return a nested dict built from the tree hierarchy.
+    def tree_index(self):
+        """Expand all nodes and return the tree structure of the table as a
+        list of ``(path, position, number of children)`` of all named rows,
+        where ``path`` is a tuple of names from the root product to the row
+        and ``position`` is the position of the row in the table body.
 
-        Expands all nodes first, then walks visible rows using
-        ``aria-level`` to reconstruct the tree.  Leaf rows (``aria-setsize="0"``)
-        store their Progress / Result text as the value.
+        The structure is read by a single :attr:`TREE_INDEX_SCRIPT` call and
+        reused until the rows of the table change.
         """
-        self._expand_all()
-        result = {}
-        # Stack tracks (level, dict_ref) for the current nesting path
-        stack = [(0, result)]
-        for row in self._visible_rows():
-            name = row.name
+        result = self.browser.execute_script(
+            self.TREE_INDEX_SCRIPT, self, self._index_token, silent=True
+        )
+        if result is None:
+            self._index_token = None
+            self._index_entries = []
+            self._index_paths = {}
+            return self._index_entries
+        if result['hidden']:
+            self._expand_all()
+        if result['rows'] is not None:
+            self._build_index(result['rows'])
+            self._index_token = result['token']
+        return self._index_entries
+
+    def _build_index(self, rows):
+        entries = []
+        # names of the ancestors of the current row, by level
+        stack = []
+        for position, (level, setsize, name) in enumerate(rows):
             if name is None:
                 continue
-            level = row.aria_level or 1
-            # Pop stack back to the parent of this level
             while stack and stack[-1][0] >= level:
                 stack.pop()
-            parent_dict = stack[-1][1] if stack else result
-            if row.is_expandable:
-                row.expand()
-                child_dict = {}
-                parent_dict[name] = child_dict
-                stack.append((level, child_dict))
+            path = (*(ancestor for _, ancestor in stack), name)
+            entries.append((path, position, setsize))
+            if setsize > 0:
+                stack.append((level, name))
+        self._index_entries = entries
+        self._index_paths = {}
+        for path, position, _ in entries:
+            self._index_paths.setdefault(path, position)
+
+    def _row_at(self, position):
+        """Return row at ``position`` in the table body."""
+        # same as RowQueryTableMixin, positions do not account for the header row
+        return self._create_row(self, position - 1 if self._is_header_in_body else position)
+
+    def _find_position(self, node_path):
+        """Return position of the row at ``node_path`` in the index. Names of
+        intermediate levels which are not in the tree are skipped.
+        """
+        path = tuple(name for name in node_path if name is not None)
+        if not path:
+            raise NodeNotFoundError(f'Empty node path {node_path}')
+        position = self._index_paths.get(path)
+        if position is not None:
+            return position
+        names = {name for entry_path, _, _ in self._index_entries for name in entry_path}
+        wanted = [name for name in path[:-1] if name in names]
+        for entry_path, entry_position, _ in self._index_entries:
+            if entry_path[-1] != path[-1]:
+                continue
+            ancestors = iter(entry_path[:-1])
+            if all(name in ancestors for name in wanted):
+                return entry_position
+        raise NodeNotFoundError(f'Node "{path[-1]}" not found in path {node_path}')
+
+    def read(self):
+        """Return a nested dict built from the tree hierarchy.
+
+        Expands all nodes first, then builds the tree from
+        :meth:`tree_index`.  Leaf rows (``aria-setsize="0"``) store their
+        Progress / Result text as the value, all read by a single call.
+        """
+        entries = self.tree_index()
+        column = self.header_index_mapping[self.RESULT_COLUMN]
+        results = self.browser.execute_script(
+            self.ROW_CELLS_SCRIPT, self, None, column, silent=True
+        )
+        result = {}
+        for path, position, setsize in entries:
+            parent_dict = result
+            for name in path[:-1]:
+                parent_dict = parent_dict.setdefault(name, {})
+            if setsize > 0:
+                parent_dict.setdefault(path[-1], {})
             else:
-                parent_dict[name] = row.result
+                parent_dict[path[-1]] = results[position]
         return result
 
     def get_row_by_name(self, name):
-        """Find and return the first visible row matching the given name.
+        """Find and return the first row matching the given name.
 
         :param name: the text to match in the Name column
         :return: SyncStatusTreeRow
         :raises NodeNotFoundError: if no row matches
         """
-        for row in self._visible_rows():
-            if row.name == name:
-                return row
+        for path, position, _ in self.tree_index():
+            if path[-1] == name:
+                return self._row_at(position)
         raise NodeNotFoundError(f'Row with name "{name}" not found')
 
     def get_node_from_path(self, node_path):
-        """Navigate the tree to find a node by its path.
-
-        Expands parent nodes as needed to reveal child rows.
+        """Find a node by its path in :meth:`tree_index`.
 
         :param node_path: a list or tuple representing the path to a node,
             e.g. ('product1', 'repo1')
         :return: SyncStatusTreeRow
         :raises NodeNotFoundError: if the target node is not found
         """
-        non_none_path = [name for name in node_path if name is not None]
-        current_row = None
-        for i, name in enumerate(non_none_path):
-            is_last = i == len(non_none_path) - 1
-            if current_row is not None:
-                current_row.expand()
-            found = False
-            for row in self._visible_rows():
-                if row.name == name:
-                    current_row = row
-                    found = True
-                    break
-            if not found:
-                if is_last:
-                    raise NodeNotFoundError(f'Node "{name}" not found in path {node_path}')
-                # Intermediate level not present in tree, skip it
-        return current_row
+        self.tree_index()
+        return self._row_at(self._find_position(node_path))
+
+    def get_nodes_from_paths(self, node_paths):
+        """Find nodes by their paths, see :meth:`get_node_from_path`, with a
+        single read of the tree.
+
+        :return: list of SyncStatusTreeRow, in order of ``node_paths``
+        """
+        self.tree_index()
+        return [self._row_at(self._find_position(node_path)) for node_path in node_paths]
+
+    def progress(self, node_paths):
+        """Return progress of nodes at ``node_paths``, read by a single call.
+
+        :return: list of ``(has progress bar, Progress / Result text)``
+            tuples, in order of ``node_paths``
+        """
+        self.tree_index()
+        positions = [self._find_position(node_path) for node_path in node_paths]
+        column = self.header_index_mapping[self.RESULT_COLUMN]
+        return [
+            tuple(progress)
+            for progress in self.browser.execute_script(
+                self.PROGRESS_SCRIPT, self, positions, column, silent=True
+            )
+        ]
+
+    def select_nodes(self, node_paths, value=True):
+        """Select (or deselect) checkboxes of nodes at ``node_paths``. State
+        of all the checkboxes is read by a single call and only those which
+        need to change are clicked.
+
+        :return: list of SyncStatusTreeRow, in order of ``node_paths``
+        """
+        self.tree_index()
+        positions = [self._find_position(node_path) for node_path in node_paths]
+        checked = set(
+            self.browser.execute_script(self.CHECKED_ROWS_SCRIPT, self, positions, silent=True)
+        )
+        rows = [self._row_at(position) for position in positions]
+        for position, row in dict(zip(positions, rows, strict=True)).items():
+            if (position in checked) != bool(value):
+                row.select(value)
+        return rows
 
 
 class SelectAllDropdown(Widget):
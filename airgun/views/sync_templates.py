@@ -1,4 +1,3 @@
-from wait_for import wait_for
 from widgetastic.widget import (
     Checkbox,
     ConditionalSwitchableView,
@@ -11,6 +10,7 @@ from widgetastic_patternfly import BreadCrumb
 from widgetastic_patternfly5 import PatternflyTable as PF5Table
 
 from airgun.views.common import BaseLoggedInView
+from airgun.waits import wait_for
 from airgun.widgets import PF5RadioGroup
 
 
@@ -1,9 +1,9 @@
-from wait_for import wait_for
 from widgetastic.widget import Table, Text, View
 from widgetastic_patternfly import BreadCrumb, Button
 from widgetastic_patternfly5 import Button as PF5Button, Pagination as PF5Pagination
 
 from airgun.views.common import BaseLoggedInView, SearchableViewMixinPF4
+from airgun.waits import wait_for
 from airgun.widgets import (
     ActionsDropdown,
     PieChart,
@@ -0,0 +1,388 @@
+"""Named readiness conditions to wait for instead of sleeping for a fixed time.
+
+Every condition polls the UI until it is ready and returns as soon as it is,
+e.g.::
+
+    before = waits.fingerprint(view.table)
+    view.search_field.fill(value)
+    waits.search_results_refreshed(view.table, before)
+
+Default timeout and poll interval of every condition can be changed in
+``[waits]`` section of settings file, by ``<condition name>_timeout`` and
+``<condition name>_delay`` options::
+
+    [waits]
+    search_results_refreshed_timeout=20
+    page_stable_delay=0.5
+
+and for a single wait by ``timeout`` and ``delay`` arguments. With
+``silent_failure=True``, a condition that is not met in time is not an error,
+the wait just returns once the timeout expired.
+
+All airgun waits go through :func:`wait_for`, a drop-in replacement of
+:func:`wait_for.wait_for`, which polls by the polling profile configured by
+``settings.airgun.polling_profile`` and scales timeouts by
+``settings.airgun.timeout_scale``, see :func:`get_polling_profile`.
+"""
+
+from datetime import timedelta
+import functools
+import importlib
+import random
+import time
+import uuid
+
+from wait_for import wait_for as _wait_for
+from widgetastic.exceptions import NoSuchElementException
+
+from airgun import settings, tracing
+
+# All the named conditions, by name
+WAITS = {}
+
+# Cheap fingerprint of element (whole document if not passed) contents, which
+# changes whenever the element is re-rendered
+FINGERPRINT_SCRIPT = """
+    var el = arguments[0] || document.body;
+    if (!el || !el.isConnected) { return null; }
+    var text = el.innerText || '', hash = 0;
+    for (var i = 0; i < text.length; i++) { hash = (hash * 31 + text.charCodeAt(i)) | 0; }
+    return el.getElementsByTagName('*').length + ':' + text.length + ':' + hash;
+    """
+
+TOASTS = (
+    "//div[contains(@class, 'pf-c-alert-group') or contains(@class, 'pf-v5-c-alert-group')"
+    " or contains(@class, 'toast-notifications-list-pf')]"
+    "//div[contains(@class, 'alert')]"
+)
+
+LOADING_INDICATORS = (
+    ".//*[contains(@class, 'pf-c-spinner') or contains(@class, 'pf-v5-c-spinner')"
+    " or contains(@class, 'spinner-lg') or contains(@class, 'pf-c-skeleton')"
+    " or contains(@class, 'pf-v5-c-skeleton')]"
+)
+
+
+class FixedPolling:
+    """Polls in intervals requested by the wait, e.g. ``delay=5``."""
+
+    def delays(self, delay):
+        """Yield number of seconds to sleep before every next poll.
+
+        :param float delay: poll interval requested by the wait
+        """
+        while True:
+            yield delay
+
+
+class AdaptivePolling(FixedPolling):
+    """Polls fast at first and backs off exponentially, with random jitter, up
+    to a ceiling, which is the poll interval requested by the wait (but at most
+    ``max_delay``). Quick conditions are thus noticed right away, while slow
+    ones are not polled more often than the wait asked for.
+
+    :param float initial_delay: interval before the second poll
+    :param float factor: multiplier of every next interval
+    :param float max_delay: maximal interval, regardless of the one requested
+    :param float jitter: max relative random deviation of every interval
+    """
+
+    def __init__(self, initial_delay=0.1, factor=2, max_delay=10, jitter=0.1):
+        self.initial_delay = initial_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delays(self, delay):
+        ceiling = min(delay, self.max_delay)
+        current = min(self.initial_delay, ceiling)
+        while True:
+            yield current * (1 + random.uniform(-self.jitter, self.jitter))
+            current = min(current * self.factor, ceiling)
+
+
+# Polling profiles by name, see get_polling_profile()
+POLLING_PROFILES = {
+    'fixed': FixedPolling,
+    'adaptive': AdaptivePolling,
+}
+
+
+def get_polling_profile():
+    """Return polling profile configured by ``settings.airgun.polling_profile``:
+    ``adaptive`` (default), ``fixed`` or ``package.module:ClassName`` of a
+    custom profile with ``delays(delay)`` method. :class:`AdaptivePolling` is
+    configured by ``polling_initial_delay``, ``polling_factor``,
+    ``polling_max_delay`` and ``polling_jitter`` settings.
+    """
+    name = settings.airgun.polling_profile or 'adaptive'
+    if name == 'adaptive':
+        return AdaptivePolling(
+            initial_delay=float(settings.airgun.polling_initial_delay),
+            factor=float(settings.airgun.polling_factor),
+            max_delay=float(settings.airgun.polling_max_delay),
+            jitter=float(settings.airgun.polling_jitter),
+        )
+    if name in POLLING_PROFILES:
+        return POLLING_PROFILES[name]()
+    module_name, _, class_name = name.partition(':')
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+def scale_timeout(timeout):
+    """Scale number of seconds to wait for by ``settings.airgun.timeout_scale``,
+    e.g. ``2`` for slow environments.
+    """
+    if isinstance(timeout, timedelta):
+        timeout = timeout.total_seconds()
+    return timeout * float(settings.airgun.timeout_scale or 1)
+
+
+def wait_for(func, func_args=None, func_kwargs=None, logger=None, **kwargs):
+    """Drop-in replacement of :func:`wait_for.wait_for` taking the same arguments.
+    The timeout is scaled by :func:`scale_timeout` and ``func`` is polled by
+    :func:`get_polling_profile`, with ``delay`` (1 second by default) as the
+    requested poll interval. With ``fail_func`` (e.g. a page refresh), which
+    runs after every failed poll, ``func`` is polled every ``delay`` seconds,
+    so the page is not reloaded faster than requested.
+    """
+    func_args = func_args or []
+    func_kwargs = func_kwargs or {}
+    timeout = scale_timeout(kwargs.pop('timeout', 120))
+    profile = FixedPolling() if kwargs.get('fail_func') else get_polling_profile()
+    delays = profile.delays(kwargs.pop('delay', 1))
+    kwargs.pop('expo', None)
+    kwargs.setdefault('message', getattr(func, '__name__', repr(func)))
+    start = time.monotonic()
+    polled = False
+
+    def poll():
+        nonlocal polled
+        if polled:
+            remaining = start + timeout - time.monotonic()
+            if remaining > 0:
+                time.sleep(min(next(delays), remaining))
+        polled = True
+        return func(*func_args, **func_kwargs)
+
+    # the sleeps are done by poll(), so the fail_func (if any) runs right after
+    # the failed poll
+    with tracing.span(kwargs['message'], 'wait', timeout=timeout):
+        return _wait_for(poll, logger=logger, timeout=timeout, delay=0, **kwargs)
+
+
+class Wait:
+    """A named condition to wait for.
+
+    :param str name: name of the condition, also used for its settings
+    :param callable condition: function creating the predicate to poll from
+        arguments of the wait
+    :param float timeout: default number of seconds to wait for
+    :param float delay: default number of seconds between the polls
+    """
+
+    def __init__(self, name, condition, timeout, delay):
+        self.name = name
+        self.condition = condition
+        self.default_timeout = timeout
+        self.default_delay = delay
+        functools.update_wrapper(self, condition)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {self.name}>'
+
+    @property
+    def timeout(self):
+        """Timeout of the wait, as configured in settings."""
+        return float(getattr(settings.waits, f'{self.name}_timeout', self.default_timeout))
+
+    @property
+    def delay(self):
+        """Poll interval of the wait, as configured in settings."""
+        return float(getattr(settings.waits, f'{self.name}_delay', self.default_delay))
+
+    def __call__(self, *args, timeout=None, delay=None, silent_failure=False, **kwargs):
+        """Wait until the condition is met.
+
+        :return: the result of :func:`wait_for.wait_for`
+        :raises wait_for.TimedOutError: if the condition was not met in time and
+            ``silent_failure`` is not set
+        """
+        return wait_for(
+            self.condition(*args, **kwargs),
+            timeout=self.timeout if timeout is None else timeout,
+            delay=self.delay if delay is None else delay,
+            handle_exception=True,
+            silent_failure=silent_failure,
+            message=f'wait for {self.name}',
+            very_quiet=True,
+        )
+
+
+def wait_condition(timeout, delay):
+    """Register decorated function as a named condition. The function gets the
+    arguments of the wait and returns a predicate to poll.
+    """
+
+    def decorator(condition):
+        wait = Wait(condition.__name__, condition, timeout, delay)
+        WAITS[wait.name] = wait
+        return wait
+
+    return decorator
+
+
+def fingerprint(target):
+    """Return fingerprint of current contents of ``target``, a widget or a
+    browser for the whole document, or ``None`` if it is not on the page.
+    Useful as ``before`` argument of :func:`search_results_refreshed`.
+    """
+    browser = getattr(target, 'browser', target)
+    element = _root_widget(target)
+    try:
+        return browser.execute_script(FINGERPRINT_SCRIPT, element, silent=True)
+    except NoSuchElementException:
+        return None
+
+
+def _root_widget(target):
+    """Return ``target`` if it is a widget with its own element, ``None`` for
+    browsers and views without root locator, which span the whole page.
+    """
+    return target if hasattr(target, '__locator__') else None
+
+
+class _Stability:
+    """Tracks for how long a polled value did not change."""
+
+    def __init__(self):
+        self.value = object()
+        self.since = None
+
+    def update(self, value):
+        """Record the polled value and return number of seconds it did not
+        change for, ``None`` if it has just changed.
+        """
+        now = time.monotonic()
+        if value != self.value:
+            self.value = value
+            self.since = now
+            return None
+        return now - self.since
+
+
+@wait_condition(timeout=10, delay=0.2)
+def page_stable(browser, settle=0):
+    """Page is safe and its contents did not change between two polls (and for
+    at least ``settle`` seconds). Nothing has to change first, so right after
+    a click wait for the element which should appear instead.
+    """
+    stability = _Stability()
+    settled = _Stability()
+
+    def predicate():
+        if browser.is_page_settled():
+            # known to be settled, no need to compare the contents
+            settled_for = settled.update(True)
+            return settle <= 0 or (settled_for is not None and settled_for >= settle)
+        settled.update(False)
+        stable_for = stability.update(fingerprint(browser))
+        return stable_for is not None and stable_for >= settle
+
+    return predicate
+
+
+@wait_condition(timeout=10, delay=0.3)
+def search_results_refreshed(target, before=None, settle=1):
+    """Contents of ``target`` (a widget, e.g. a table, or a browser) were
+    updated after a search or a filter was applied and stopped changing.
+
+    :param str optional before: :func:`fingerprint` of the target taken before
+        the search. Once it differs, the results are considered refreshed as
+        soon as they do not change between two polls. Otherwise (or if search
+        results did not change at all), they have to stay unchanged for
+        ``settle`` seconds.
+    """
+    browser = getattr(target, 'browser', target)
+    stability = _Stability()
+
+    def predicate():
+        browser.plugin.ensure_page_safe()
+        current = fingerprint(target)
+        stable_for = stability.update(current)
+        if stable_for is None:
+            return False
+        if before is not None and current is not None and current != before:
+            return True
+        return stable_for >= settle
+
+    return predicate
+
+
+@wait_condition(timeout=20, delay=0.2)
+def wizard_step_rendered(view):
+    """Wizard step (or any other view) is displayed, shows no loading
+    indicators and its contents stopped changing. Only loading indicators
+    inside the view count, e.g. a spinner of the notification drawer does not,
+    unless the view has no root locator and spans the whole page.
+    """
+    stability = _Stability()
+
+    def predicate():
+        if not view.is_displayed:
+            return False
+        if view.browser.elements(LOADING_INDICATORS, parent=_root_widget(view)):
+            return False
+        return stability.update(fingerprint(view)) is not None
+
+    return predicate
+
+
+@wait_condition(timeout=10, delay=0.2)
+def toast_appeared(browser, text=None):
+    """A toast notification (containing ``text``, if passed) is displayed."""
+
+    def predicate():
+        for toast in browser.elements(TOASTS):
+            if text is None or text in browser.text(toast):
+                return True
+        return False
+
+    return predicate
+
+
+@wait_condition(timeout=10, delay=0.2)
+def element_displayed(browser, locator, parent=None):
+    """Element is present on the page and visible."""
+    return lambda: browser.probe(locator, parent=parent, visible=True) is not None
+
+
+@wait_condition(timeout=10, delay=0.2)
+def widget_enabled(widget):
+    """Widget is displayed and enabled."""
+    return lambda: widget.is_displayed and widget.is_enabled
+
+
+@wait_condition(timeout=10, delay=0.2)
+def page_reloaded(browser, mark):
+    """Page marked by :func:`mark_page` was reloaded (or replaced by another
+    one) and the new one is safe.
+    """
+
+    def predicate():
+        if browser.execute_script('return window.__airgunPageMark;', silent=True) == mark:
+            return False
+        browser.plugin.ensure_page_safe()
+        return True
+
+    return predicate
+
+
+def mark_page(browser):
+    """Mark currently loaded page, see :func:`page_reloaded`.
+
+    :return: the mark
+    """
+    mark = uuid.uuid4().hex
+    browser.execute_script('window.__airgunPageMark = arguments[0];', mark, silent=True)
+    return mark
@@ -1,10 +1,12 @@
+from contextlib import contextmanager
 import json
-import time
 
 from cached_property import cached_property
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.keys import Keys
-from wait_for import wait_for
-from widgetastic.exceptions import NoSuchElementException, WidgetOperationFailed
+from wait_for import TimedOutError
+from widgetastic.exceptions import NoSuchElementException, RowNotFound, WidgetOperationFailed
+from widgetastic.log import create_item_logger
 from widgetastic.widget import (
     Checkbox,
     ClickableMixin,
@@ -12,13 +14,14 @@ from widgetastic.widget import (
     ParametrizedLocator,
     Select,
     Table,
+    TableRow,
     Text,
     TextInput,
     View,
     Widget,
     do_not_read_this_widget,
 )
-from widgetastic.xpath import quote
+from widgetastic.xpath import normalize_space, quote
 from widgetastic_patternfly import (
     AggregateStatusCard,
     Button,
@@ -52,8 +55,10 @@ from widgetastic_patternfly5.ouia import (
     OUIAGenericWidget,
 )
 
+from airgun import settings, waits
 from airgun.exceptions import DisabledWidgetError, ReadOnlyWidgetError
-from airgun.utils import get_widget_by_name
+from airgun.utils import get_widget_by_name, to_bool
+from airgun.waits import wait_for
 
 
 class SatSelect(Select):
@@ -1176,9 +1181,9 @@ class ValidationErrors(Widget):
         """Returns boolean value whether view has fields with invalid data or
         not.
         """
-        time.sleep(
-            1
-        )  # ensure_page_safe doesn't help here and there's nothing to wait_for because the error won't always be there
+        # ensure_page_safe doesn't help here and there's nothing to wait_for because the
+        # error won't always be there, so just let the page settle
+        waits.page_stable(self.browser, silent_failure=True)
         return self.browser.elements(self.ERROR_ELEMENTS) != []
 
     @property
@@ -1978,18 +1983,24 @@ class Pagination(Widget):
     @cached_property
     def per_page(self):
         """Return the per page widget"""
-        if (
-            self.browser.wait_for_element(
-                self.PER_PAGE_SELECT, parent=self, timeout=1, exception=False
+        if self.browser.is_page_settled():
+            has_select = self.browser.probe(self.PER_PAGE_SELECT, parent=self) is not None
+        else:
+            has_select = (
+                self.browser.wait_for_element(
+                    self.PER_PAGE_SELECT, parent=self, timeout=1, exception=False
+                )
+                is not None
             )
-            is not None
-        ):
+        if has_select:
             return Select(self, self.PER_PAGE_SELECT)
         return ActionsDropdown(self, self.PER_PAGE_BUTTON_DROPDOWN)
 
     @property
     def is_displayed(self):
         """Check whether this Pagination widget exists and visible"""
+        if self.browser.is_page_settled():
+            return self.browser.probe(self.pages, parent=self, visible=True) is not None
         return (
             self.browser.wait_for_element(
                 self.pages, parent=self, visible=True, timeout=1, exception=False
@@ -2047,7 +2058,79 @@ class Pagination(Widget):
                 widget.fill(value)
 
 
-class SatTable(Table):
+class RowQueryTableMixin:
+    """Table mixin which resolves rows matching column and row filters, i.e.
+    ``table.row(name='foo')`` or ``table.rows(description__contains='bar')``,
+    with a single javascript call instead of one webdriver call per matching
+    row. :meth:`row` asks only for the first matching row.
+
+    Filters that can't be expressed as a XPath query (regular expressions)
+    and tables with rowspan/colspan cells are handled by the original
+    :class:`widgetastic.widget.Table` implementation.
+    """
+
+    # Number of levels between the matching row element and the element whose
+    # position among its siblings is the index of the row, see ROW_AT_INDEX
+    ROW_INDEX_ELEMENT_DEPTH = 0
+    ROW_QUERY_SCRIPT = """
+        var table = arguments[0], query = arguments[1], limit = arguments[2];
+        var depth = arguments[3];
+        var result = document.evaluate(
+          query, table, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var count = result.snapshotLength;
+        if (limit !== null) { count = Math.min(count, limit); }
+        var positions = [];
+        for (var i = 0; i < count; i++) {
+          var e = result.snapshotItem(i);
+          for (var level = 0; level < depth; level++) { e = e.parentNode; }
+          var tag = depth ? e.tagName : null, position = 0;
+          while (e.previousElementSibling) {
+            e = e.previousElementSibling;
+            if (tag === null || e.tagName === tag) { position++; }
+          }
+          positions.push(position);
+        }
+        return positions;
+        """
+
+    @property
+    def can_query_rows(self):
+        """Whether filtered rows can be resolved by :attr:`ROW_QUERY_SCRIPT`."""
+        return type(self).rows is Table.rows and not self.table_tree
+
+    def _filter_rows_by_query(self, query, limit=None):
+        """Return rows matching XPath ``query``, at most ``limit`` of them."""
+        positions = self.browser.execute_script(
+            self.ROW_QUERY_SCRIPT, self, query, limit, self.ROW_INDEX_ELEMENT_DEPTH, silent=True
+        )
+        # positions do not account for the header row in the table body, same as
+        # Table._get_number_preceeding_rows()
+        return [
+            self._create_row(
+                self,
+                position - 1 if self._is_header_in_body else position,
+                logger=create_item_logger(self.logger, position),
+            )
+            for position in positions
+        ]
+
+    def row(self, *extra_filters, **filters):
+        if (filters or extra_filters) and self.can_query_rows:
+            processed_filters, regexp_filters, row_filters = self._process_filters(
+                *extra_filters, **filters
+            )
+            if not regexp_filters:
+                query = self._build_query(processed_filters, row_filters)
+                rows = self._filter_rows_by_query(query, limit=1)
+                if not rows:
+                    raise RowNotFound(
+                        f'Row not found when using filters {extra_filters!r}/{filters!r}'
+                    )
+                return rows[0]
+        return super().row(*extra_filters, **filters)
+
+
+class SatTable(RowQueryTableMixin, Table):
     """Satellite version of table.
 
     Includes a paginator sub-widget. If found, then the paginator is used to read all entries from
@@ -2092,6 +2175,66 @@ class SatTable(Table):
     )
     COLUMN_AT_POSITION = './td[not(@hidden)][{0}]'
 
+    # Read the table with a single javascript call, see _read_bulk()
+    BULK_READ = True
+    BULK_READ_SCRIPT = """
+        var table = arguments[0], rowsXpath = arguments[1], cellXpath = arguments[2];
+        var positions = arguments[3], top = arguments[4], bottom = arguments[5];
+        var limit = arguments[6];
+        function nodes(xpath, context) {
+          var result = document.evaluate(
+            xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+          var list = [];
+          for (var i = 0; i < result.snapshotLength; i++) { list.push(result.snapshotItem(i)); }
+          return list;
+        }
+        function text(el) {
+          var value = el.innerText;
+          if (!value) { value = el.textContent || el.innerText; }
+          return value || '';
+        }
+        var rows = nodes(rowsXpath, table);
+        var stop = rows.length - bottom;
+        if (limit !== null) { stop = Math.min(stop, top + limit); }
+        var result = [];
+        for (var index = top; index < stop; index++) {
+          var cells = [];
+          for (var i = 0; i < positions.length; i++) {
+            var cell = nodes(cellXpath.replace('{0}', positions[i]), rows[index])[0];
+            cells.push(cell === undefined ? null : text(cell));
+          }
+          result.push({index: index, cells: cells});
+        }
+        return result;
+        """
+
+    # Wait until the pagination shows the expected page, see _wait_for_page()
+    PAGE_CHANGE_SCRIPT = """
+        var root = arguments[0], expected = String(arguments[1]), timeout = arguments[2];
+        var callback = arguments[arguments.length - 1];
+        var start = Date.now(), finished = false, observer = null, timer = null;
+        function finish(status) {
+          if (finished) { return; }
+          finished = true;
+          if (observer) { observer.disconnect(); }
+          clearTimeout(timer);
+          callback(status);
+        }
+        function check() {
+          if (!root.isConnected) { finish('detached'); return true; }
+          var input = root.querySelector("input[aria-label='Current page']");
+          if (input && input.value === expected) { finish('changed'); return true; }
+          if (Date.now() - start > timeout) { finish('timeout'); return true; }
+          return false;
+        }
+        if (check()) { return; }
+        observer = new MutationObserver(check);
+        observer.observe(document, {
+          childList: true, subtree: true, attributes: true, characterData: true});
+        // value of the input is a property, changing it is not a DOM mutation
+        (function poll() { if (!check()) { timer = setTimeout(poll, 100); } })();
+        """
+
     no_rows_message = (
         ".//td/span[contains(@data-block, 'no-rows-message') or "
         "contains(@data-block, 'no-search-results-message')]"
@@ -2114,88 +2257,343 @@ class SatTable(Table):
             return False
         return True
 
-    def read_limited(self, limit):
-        """This is almost the same as inherited read but has a limit. Use it for tables that take too long to read.
-        Reads the table. Returns a list, every item in the list is contents read from the row."""
+    def _column_has_widget(self, position, header):
+        """Whether the cell at ``position`` is read by a column widget, resolved the
+        same way as :attr:`widgetastic.widget.table.TableColumn.widget` does it.
+        """
+        key = position if header is None else header
+        return key in self.column_widgets
+
+    @property
+    def can_bulk_read(self):
+        """Whether the table can be read by :meth:`_read_bulk`. Tables with
+        rowspan/colspan cells or customized rows are read row by row.
+        """
+        return (
+            self.BULK_READ
+            and self.Row.read is TableRow.read
+            and type(self).rows is Table.rows
+            and not self.has_rowcolspan
+        )
+
+    def _column_positions(self, columns=None):
+        """Return positions of the columns to read, all of them if ``columns``
+        is not set. Column of ``assoc_column`` is always included.
+
+        :param list optional columns: column names or positions
+        """
+        if columns is None:
+            return list(range(len(self.headers)))
+        positions = set()
+        for column in columns:
+            if isinstance(column, int):
+                positions.add(column)
+                continue
+            try:
+                positions.add(self.header_index_mapping[self.ensure_normal(column)])
+            except KeyError as e:
+                raise ValueError(f'Table {self.locator} has no column {column!r}') from e
+        if self.assoc_column_position is not None:
+            positions.add(self.assoc_column_position)
+        return sorted(positions)
+
+    def _read_row(self, row, positions=None):
+        """Read values of the row cells at ``positions``, all of them if not
+        set. Result has the same shape as :meth:`TableRow.read`.
+        """
+        if positions is None:
+            return row.read()
+        headers = self.headers
+        return {headers[position] or position: row[position].read() for position in positions}
+
+    def _read_bulk(self, limit=None, columns=None):
+        """Read the table with a single javascript call returning text of all
+        the cells. Honours ``rows_ignore_top``/``rows_ignore_bottom``,
+        ``assoc_column`` and hidden columns exactly as :meth:`Table.read`.
+        Columns with column widgets are read by their widgets, cell by cell.
+
+        :param int optional limit: read at most ``limit`` rows
+        :param list optional columns: read only these columns
+        :return: list of row values, ``assoc_column`` is not applied
+        """
+        headers = self.headers
+        positions = self._column_positions(columns)
+        widget_positions = [
+            position
+            for position in positions
+            if self._column_has_widget(position, headers[position])
+        ]
+        rows_data = self.browser.execute_script(
+            self.BULK_READ_SCRIPT,
+            self,
+            self.ROWS,
+            self.COLUMN_AT_POSITION,
+            [position + 1 for position in positions],
+            self.rows_ignore_top or 0,
+            self.rows_ignore_bottom or 0,
+            limit,
+            silent=True,
+        )
+        row_reads = []
+        for row_data in rows_data:
+            row = self._create_row(self, row_data['index'])
+            if None in row_data['cells']:
+                # let the row read fail in the usual way on missing cells
+                row_reads.append(self._read_row(row, None if columns is None else positions))
+                continue
+            row_read = {
+                headers[position] or position: normalize_space(text)
+                for position, text in zip(positions, row_data['cells'], strict=True)
+            }
+            for position in widget_positions:
+                row_read[headers[position] or position] = row[position].read()
+            row_reads.append(row_read)
+        return row_reads
+
+    def _process_row_reads(self, row_reads):
+        """Turn the list of row values into the return value of :meth:`read`,
+        i.e. a dict keyed by ``assoc_column`` values if the column is set.
+        """
+        if self.assoc_column_position is None:
+            return row_reads
+        result = {}
+        for row_read in row_reads:
+            try:
+                key = row_read.pop(self.header_index_mapping[self.assoc_column_position])
+            except KeyError:
+                try:
+                    key = row_read.pop(self.assoc_column_position)
+                except KeyError:
+                    try:
+                        key = row_read.pop(self.assoc_column)
+                    except KeyError as e:
+                        raise ValueError(
+                            f'The assoc_column={self.assoc_column!r} could not be retrieved'
+                        ) from e
+            if key in result:
+                raise ValueError(f'Duplicate value for {key}={result[key]!r}')
+            result[key] = row_read
+        return result
+
+    def _read_page_rows(self, limit=None, columns=None):
+        """Read the rows of currently displayed page as a list of row values,
+        without applying ``assoc_column``.
+
+        :param int optional limit: read at most ``limit`` rows
+        :param list optional columns: read only these columns
+        """
+        if self.can_bulk_read:
+            return self._read_bulk(limit=limit, columns=columns)
         rows = list(self)
         # Cut the unwanted rows if necessary
         if self.rows_ignore_top is not None:
             rows = rows[self.rows_ignore_top :]
         if self.rows_ignore_bottom is not None and self.rows_ignore_bottom > 0:
             rows = rows[: -self.rows_ignore_bottom]
-        if self.assoc_column_position is None:
-            ret = []
-            rows_read = 0
-            for row in rows:
-                if rows_read >= limit:
-                    break
-                ret.append(row.read())
-                rows_read = rows_read + 1
-            return ret
-        else:
-            result = {}
-            rows_read = 0
-            for row in rows:
-                if rows_read >= limit:
-                    break
-                row_read = row.read()
-                try:
-                    key = row_read.pop(self.header_index_mapping[self.assoc_column_position])
-                except KeyError:
-                    try:
-                        key = row_read.pop(self.assoc_column_position)
-                    except KeyError:
-                        try:
-                            key = row_read.pop(self.assoc_column)
-                        except KeyError as e:
-                            raise ValueError(
-                                f'The assoc_column={self.assoc_column!r} could not be retrieved'
-                            ) from e
-                if key in result:
-                    raise ValueError(f'Duplicate value for {key}={result[key]!r}')
-                result[key] = row_read
-                rows_read = rows_read + 1
-            return result
-
-    def read(self, limit=None):
-        """Return empty list in case table is empty"""
+        positions = None if columns is None else self._column_positions(columns)
+        return [self._read_row(row, positions) for row in rows[:limit]]
+
+    def _read_page(self, columns=None):
+        """Read the rows of currently displayed page."""
+        if self.can_bulk_read or columns is not None:
+            return self._process_row_reads(self._read_page_rows(columns=columns))
+        return super().read()
+
+    def read_limited(self, limit, columns=None):
+        """This is almost the same as inherited read but has a limit. Use it for tables that take too long to read.
+        Reads the table. Returns a list, every item in the list is contents read from the row."""
+        return self._process_row_reads(self._read_page_rows(limit=limit, columns=columns))
+
+    def read(self, limit=None, per_page=None, restore_per_page=None, columns=None):
+        """Return empty list in case table is empty
+
+        :param int optional limit: read at most ``limit`` rows of current page
+        :param optional per_page: page size to switch paginated table to before
+            reading it, see :meth:`maximize_per_page`. ``'max'`` for the largest
+            available, a number for the largest up to that number, ``0`` to keep
+            the current page size. Defaults to ``settings.airgun.table_per_page``.
+        :param bool optional restore_per_page: switch back to the original page
+            size after reading. Defaults to ``settings.airgun.table_restore_per_page``.
+        :param list optional columns: names (or positions) of the columns to read,
+            other columns and their widgets are not touched at all. Column of
+            ``assoc_column`` is always read.
+        """
         if not self.has_rows:
             self.logger.debug(f'Table {self.locator} is empty')
             return []
         if limit is not None:
-            return self.read_limited(limit)
+            return self.read_limited(limit, columns=columns)
         if self.pagination.is_displayed:
-            return self._read_all()
-        return super().read()
+            with self._read_per_page(per_page, restore_per_page):
+                return self._read_all(columns=columns)
+        return self._read_page(columns=columns)
 
-    def _read_all(self):
-        """Return all available table values with using pagination navigation."""
-        table_rows = []
+    @property
+    def per_page_sizes(self):
+        """Sorted list of page sizes available in the pagination."""
+        sizes = []
+        for option in self.pagination.per_page_options:
+            try:
+                sizes.append(int(option.split()[0]))
+            except (ValueError, IndexError):
+                continue
+        return sorted(sizes)
+
+    def set_per_page(self, count, timeout=30):
+        """Switch the pagination to ``count`` items per page and wait for the
+        table to be updated.
+        """
+        self.pagination.set_per_page(count)
+        wait_for(
+            lambda: self.pagination.current_per_page == count,
+            timeout=timeout,
+            delay=0.2,
+            logger=self.logger,
+        )
+
+    def maximize_per_page(self, cap=None):
+        """Switch the pagination to the largest available page size, to read the
+        table in as few page transitions as possible. Nothing is done if all the
+        rows already fit into a single page.
+
+        :param int optional cap: use the largest page size up to ``cap`` items
+        :return: the previous page size if it was changed, ``None`` otherwise
+        """
+        if self.pagination.total_pages <= 1:
+            return None
+        current = self.pagination.current_per_page
+        sizes = [size for size in self.per_page_sizes if cap is None or size <= cap]
+        if not sizes or sizes[-1] <= current:
+            return None
+        self.logger.debug(f'Changing page size of table {self.locator} to {sizes[-1]}')
+        self.set_per_page(sizes[-1])
+        return current
+
+    @contextmanager
+    def _read_per_page(self, per_page=None, restore_per_page=None):
+        """Maximize page size of the paginated table while reading it, as
+        requested by :meth:`read` arguments or settings.
+        """
+        if per_page is None:
+            per_page = settings.airgun.table_per_page
+        if restore_per_page is None:
+            restore_per_page = to_bool(settings.airgun.table_restore_per_page)
+        previous = None
+        if per_page and str(per_page) != '0':
+            cap = None if str(per_page).lower() == 'max' else int(per_page)
+            previous = self.maximize_per_page(cap=cap)
+        try:
+            yield
+        finally:
+            if restore_per_page and previous is not None:
+                self.set_per_page(previous)
+
+    def iter_rows(
+        self,
+        predicate=None,
+        from_first_page=True,
+        per_page=None,
+        restore_per_page=None,
+        columns=None,
+    ):
+        """Yield values of table rows page by page. Next page is opened only
+        once all the rows of the current page were consumed, so breaking out
+        of the loop early avoids reading the rest of the table.
+
+        Example::
+
+            for row in view.table.iter_rows(lambda row: row['Status'] == 'Failed'):
+                ...
+
+        :param callable optional predicate: yield only the rows for which
+            ``predicate(row)`` is true
+        :param bool optional from_first_page: go to the first page before
+            reading, otherwise start with the currently displayed page
+        :param per_page: same as for :meth:`read`
+        :param restore_per_page: same as for :meth:`read`
+        :param columns: same as for :meth:`read`, ``predicate`` gets only these
+            columns
+        """
+        if not self.has_rows:
+            self.logger.debug(f'Table {self.locator} is empty')
+            return
+        if not self.pagination.is_displayed:
+            yield from self._iter_page_rows(predicate, columns)
+            return
+        with self._read_per_page(per_page, restore_per_page):
+            for _ in self._iter_pages(from_first_page=from_first_page):
+                yield from self._iter_page_rows(predicate, columns)
+
+    def _iter_page_rows(self, predicate=None, columns=None):
+        """Yield values of the rows of currently displayed page matching ``predicate``."""
+        for row_read in self._read_page_rows(columns=columns):
+            if predicate is None or predicate(row_read):
+                yield row_read
+
+    def find_row(self, predicate, **kwargs):
+        """Return values of the first row matching ``predicate`` or ``None``,
+        reading no further pages once the row is found. Keyword arguments are
+        passed to :meth:`iter_rows`.
+        """
+        return next(self.iter_rows(predicate, **kwargs), None)
+
+    def _iter_pages(self, from_first_page=True):
+        """Open the table pages one after another, yielding the number of the
+        page displayed.
+        """
         page_number = 1
-        if self.pagination.current_page != page_number:
+        if not from_first_page:
+            page_number = self.pagination.current_page
+        elif self.pagination.current_page != page_number:
             # goto first page
             self.pagination.first_page()
-            wait_for(
-                lambda: self.pagination.current_page == page_number,
-                timeout=30,
-                delay=1,
-                logger=self.logger,
-            )
+            self._wait_for_page(page_number)
         while page_number <= self.pagination.total_pages:
-            page_table_rows = super().read()
-            table_rows.extend(page_table_rows)
+            yield page_number
             if page_number == self.pagination.total_pages:
                 break
             self.pagination.next_page()
             page_number += 1
             # ensure that we are at the right page (to not read the same page twice) and
             # to escape any ui bug that will cause hanging on this loop.
-            wait_for(
-                lambda page_number=page_number: self.pagination.current_page == page_number,
-                timeout=30,
-                delay=1,
-                logger=self.logger,
+            self._wait_for_page(page_number)
+
+    def _wait_for_page(self, page_number, timeout=30):
+        """Wait until the pagination displays page ``page_number``. The page is
+        awaited in the browser by :attr:`PAGE_CHANGE_SCRIPT`, falling back to
+        polling the pagination if the script can't be used.
+
+        :raises TimedOutError: if the page was not displayed in time
+        """
+        try:
+            status = self.browser.execute_async_script(
+                self.PAGE_CHANGE_SCRIPT,
+                self.pagination,
+                page_number,
+                timeout * 1000,
+                timeout=timeout,
+                silent=True,
             )
+        except (NoSuchElementException, WebDriverException) as err:
+            self.logger.debug('Waiting for page change in browser failed: %s', err)
+            status = None
+        if status == 'changed':
+            return
+        if status == 'timeout':
+            raise TimedOutError(f'Page {page_number} was not displayed in {timeout} seconds')
+        # pagination was re-rendered or the script could not run at all
+        wait_for(
+            lambda: self.pagination.current_page == page_number,
+            timeout=timeout,
+            delay=1,
+            logger=self.logger,
+        )
+
+    def _read_all(self, columns=None):
+        """Return all available table values with using pagination navigation."""
+        table_rows = []
+        for _ in self._iter_pages():
+            table_rows.extend(self._read_page(columns=columns))
         return table_rows
 
 
@@ -3027,13 +3425,22 @@ class SearchInput(TextInput):
         return changed
 
     def fill(self, value, enter_timeout=1, after_enter_timeout=3):
-        """Fill the search input with supplied value"""
+        """Fill the search input with supplied value
+
+        :param enter_timeout: max number of seconds to wait for the page to
+            settle before the search is submitted
+        :param after_enter_timeout: max number of seconds to wait for the search
+            results to be refreshed
+        """
         changed = super().fill(value)
         if changed:
             # workaround for BZ #2140636
-            time.sleep(enter_timeout)
+            waits.page_stable(self.browser, timeout=enter_timeout, silent_failure=True)
+            before = waits.fingerprint(self.browser)
             self.browser.send_keys(Keys.ENTER, self)
-            time.sleep(after_enter_timeout)
+            waits.search_results_refreshed(
+                self.browser, before, timeout=after_enter_timeout, silent_failure=True
+            )
         return changed
 
 
@@ -3066,7 +3473,7 @@ class DualListSelector(EditModal):
     )
 
 
-class SatPatternflyTable(BasePatternflyTable, Table):
+class SatPatternflyTable(RowQueryTableMixin, BasePatternflyTable, Table):
     def __init__(
         self,
         parent,
@@ -3172,7 +3579,7 @@ class CompoundExpandableTableRow(PatternflyTableRow):
         return result
 
 
-class CompoundExpandableTable(PatternflyTable):
+class CompoundExpandableTable(RowQueryTableMixin, PatternflyTable):
     """PatternFly table with inline expandable child rows.
 
     This handles tables where each row group is in its own <tbody>,
@@ -3183,6 +3590,8 @@ class CompoundExpandableTable(PatternflyTable):
     # Override to only select parent rows (first tr in each tbody)
     ROWS = './tbody/tr[1]'
     ROW_AT_INDEX = './tbody[{0}]/tr[1]'
+    # rows are indexed by position of their tbody
+    ROW_INDEX_ELEMENT_DEPTH = 1
 
     Row = CompoundExpandableTableRow
     # Locator for child rows within a specific tbody
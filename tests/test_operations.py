@@ -0,0 +1,138 @@
+"""Tests of :mod:`airgun.operations` with a stub session, no browser is
+started.
+"""
+
+import pytest
+from wait_for import TimedOutError
+
+from airgun.operations import OperationPoller
+
+# requested number of seconds between the checks of stub operations
+DELAY = 0.01
+
+
+class StubPlugin:
+    def ensure_page_safe(self):
+        pass
+
+
+class StubBrowser:
+    """Browser recording the pages opened by the poller."""
+
+    def __init__(self, url='/current'):
+        self._url = url
+        self.opened = []
+        self.plugin = StubPlugin()
+
+    @property
+    def url(self):
+        return self._url
+
+    @url.setter
+    def url(self, url):
+        self.opened.append(url)
+        self._url = url
+
+
+class StubSession:
+    def __init__(self):
+        self.browser = StubBrowser()
+        self.operations = OperationPoller(self)
+
+
+class Checks:
+    """Check finishing after ``count`` calls, recording the page of every call."""
+
+    def __init__(self, browser, count=1):
+        self.browser = browser
+        self.count = count
+        self.pages = []
+
+    def __call__(self):
+        self.pages.append(self.browser.url)
+        return len(self.pages) >= self.count
+
+
+@pytest.fixture
+def session():
+    return StubSession()
+
+
+def start(session, name, check, **kwargs):
+    kwargs.setdefault('delay', DELAY)
+    return session.operations.start(name, check, **kwargs)
+
+
+def test_result_of_finished_operation(session):
+    check = Checks(session.browser, count=3)
+    operation = start(session, 'op', check, finish=lambda: 'result')
+    assert not operation.done()
+    assert operation.result() == 'result'
+    assert len(check.pages) == check.count
+    assert not session.operations.pending
+
+
+def test_operations_grouped_by_page(session):
+    checks = {
+        name: Checks(session.browser, count=2) for name in ('a1', 'a2', 'b1', 'current', 'b2', 'a3')
+    }
+    for name, check in checks.items():
+        url = '/current' if name == 'current' else f'/{name[0]}'
+        start(session, name, check, url=url)
+    assert session.operations.wait()
+    for name, check in checks.items():
+        assert set(check.pages) == {'/current' if name == 'current' else f'/{name[0]}'}
+    # operations on the current page go first, each other page is opened
+    # once a round
+    assert session.browser.opened == ['/a', '/b', '/a', '/current']
+
+
+def test_page_reopened_after_operation_left_it(session):
+    browser = session.browser
+    check = Checks(browser)
+    start(session, 'leaving', lambda: setattr(browser, 'url', '/elsewhere'), url='/a')
+    start(session, 'staying', check, url='/a')
+    session.operations.poll()
+    assert check.pages == ['/a']
+    assert browser.opened == ['/a', '/elsewhere', '/a']
+
+
+def test_error_raised_by_result(session):
+    def check():
+        raise ValueError('failed check')
+
+    failing = start(session, 'failing', check)
+    other = start(session, 'other', Checks(session.browser, count=2))
+    assert session.operations.wait()
+    assert other.result() is None
+    with pytest.raises(ValueError, match='failed check'):
+        failing.result()
+
+
+def test_handle_exception(session):
+    errors = [LookupError('row not there yet')]
+
+    def check():
+        if errors:
+            raise errors.pop()
+        return True
+
+    operation = start(session, 'op', check, handle_exception=True)
+    assert operation.wait()
+    assert operation.result() is None
+    assert not errors
+
+
+def test_operation_timeout(session):
+    operation = start(session, 'op', lambda: False, timeout=DELAY)
+    assert operation.wait()
+    with pytest.raises(TimedOutError):
+        operation.result()
+
+
+def test_wait_timeout(session):
+    operation = start(session, 'op', lambda: False)
+    assert not operation.wait(timeout=DELAY)
+    with pytest.raises(TimedOutError):
+        operation.result(timeout=DELAY)
+    assert session.operations.pending == [operation]
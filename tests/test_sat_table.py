@@ -0,0 +1,169 @@
+"""Tests of :class:`airgun.widgets.SatTable` against small HTML pages served by
+:mod:`airgun.offline`.
+"""
+
+import pytest
+
+pytest.importorskip('lxml')
+pytest.importorskip('cssselect')
+
+from widgetastic.widget import View
+
+from airgun.offline import offline_browser
+from airgun.widgets import SatTable
+
+ARCHITECTURES = [(f'arch{index}', f'RHEL {index}') for index in range(1, 6)]
+PER_PAGE = 2
+
+
+def table_rows(items):
+    return ''.join(
+        f'<tr><td><a href="/architectures/{name}/edit">{name}</a></td><td>{systems}</td></tr>'
+        for name, systems in items
+    )
+
+
+def plain_table_page(items=ARCHITECTURES):
+    """Return HTML of the architectures table without pagination."""
+    return f"""<html><body>
+        <table class="table">
+          <thead><tr><th>Name</th><th>Operating systems</th></tr></thead>
+          <tbody>{table_rows(items)}</tbody>
+        </table>
+        </body></html>"""
+
+
+def table_page(page=1, per_page=PER_PAGE, sizes=(PER_PAGE, 5)):
+    """Return HTML of ``page`` of the architectures table with pagination."""
+    total_pages = -(-len(ARCHITECTURES) // per_page)
+    first = (page - 1) * per_page
+    rows = table_rows(ARCHITECTURES[first : first + per_page])
+    options = ''.join(
+        f'<li><button class="pf-c-options-menu__menu-item">{size} per page'
+        f'{"<i></i>" if size == per_page else ""}</button></li>'
+        for size in sizes
+    )
+    last = ' disabled=""' if page == total_pages else ''
+    return f"""<html><body>
+        <table class="table">
+          <thead><tr><th>Name</th><th>Operating systems</th></tr></thead>
+          <tbody>{rows}</tbody>
+        </table>
+        <div class="pf-c-pagination">
+          <div class="pf-c-options-menu pf-m-expanded">
+            <button class="pf-c-options-menu__toggle">
+              <span class="pf-c-options-menu__toggle-text">
+                {first + 1} - {min(first + per_page, len(ARCHITECTURES))}
+                of {len(ARCHITECTURES)}</span>
+            </button>
+            <ul class="pf-c-options-menu__menu">{options}</ul>
+          </div>
+          <nav>
+            <button data-action="first">first</button>
+            <button data-action="previous">previous</button>
+            <div class="pf-c-pagination__nav-page-select">
+              <input aria-label="Current page" value="{page}"><span>of {total_pages}</span>
+            </div>
+            <button data-action="next"{last}>next</button>
+            <button data-action="last"{last}>last</button>
+          </nav>
+        </div>
+        </body></html>"""
+
+
+class TableView(View):
+    table = SatTable('.//table')
+
+
+@pytest.fixture
+def paged_browser():
+    """Browser showing the first page of the table, the pagination buttons
+    and page sizes load the pages they would show.
+    """
+    browser = offline_browser(table_page())
+    driver = browser.selenium
+    state = {'page': 1, 'per_page': PER_PAGE}
+
+    def show(page=None, per_page=None):
+        state['page'] = page or state['page']
+        state['per_page'] = per_page or state['per_page']
+        driver.load(table_page(state['page'], state['per_page']))
+
+    driver.on_click("//button[@data-action='next']", lambda node: show(state['page'] + 1))
+    driver.on_click("//button[@data-action='first']", lambda node: show(1))
+    driver.on_click(
+        "//button[contains(@class, 'pf-c-options-menu__menu-item')]",
+        lambda node: show(1, int(node.text.split()[0])),
+    )
+    browser.state = state
+    return browser
+
+
+def read_commands(items):
+    """Return values of the table of ``items`` and the number of webdriver
+    commands reading it took.
+    """
+    browser = offline_browser(plain_table_page(items))
+    metrics = browser.extra_objects['session'].metrics
+    table = TableView(browser).table
+    assert table.headers == ('Name', 'Operating systems')
+    metrics.reset()
+    return table.read(), len(metrics)
+
+
+def test_bulk_read():
+    values, commands = read_commands(ARCHITECTURES)
+    assert values == [
+        {'Name': name, 'Operating systems': systems} for name, systems in ARCHITECTURES
+    ]
+    # the cells are read by a single script, whatever the number of rows
+    assert read_commands(ARCHITECTURES[:2])[1] == commands
+
+
+def test_read_limited_and_columns():
+    browser = offline_browser(plain_table_page())
+    table = TableView(browser).table
+    assert table.read_limited(2) == [
+        {'Name': 'arch1', 'Operating systems': 'RHEL 1'},
+        {'Name': 'arch2', 'Operating systems': 'RHEL 2'},
+    ]
+    assert table.read(limit=1, columns=['Operating systems']) == [{'Operating systems': 'RHEL 1'}]
+
+
+def test_row_query():
+    browser = offline_browser(plain_table_page())
+    table = TableView(browser).table
+    row = table.row(name='arch3')
+    assert row.index == ARCHITECTURES.index(('arch3', 'RHEL 3'))
+    assert row['Operating systems'].text == 'RHEL 3'
+    assert [row.name.text for row in table.rows(operating_systems__contains='RHEL')] == [
+        name for name, _ in ARCHITECTURES
+    ]
+
+
+def test_read_all_pages(paged_browser):
+    table = TableView(paged_browser).table
+    assert table.read(per_page=0) == [
+        {'Name': name, 'Operating systems': systems} for name, systems in ARCHITECTURES
+    ]
+    assert paged_browser.state == {'page': len(ARCHITECTURES) // PER_PAGE + 1, 'per_page': PER_PAGE}
+
+
+def test_read_maximizes_per_page(paged_browser):
+    table = TableView(paged_browser).table
+    assert len(table.read(per_page='max', restore_per_page=False)) == len(ARCHITECTURES)
+    assert paged_browser.state == {'page': 1, 'per_page': len(ARCHITECTURES)}
+
+
+def test_read_restores_per_page(paged_browser):
+    table = TableView(paged_browser).table
+    assert len(table.read(per_page='max', restore_per_page=True)) == len(ARCHITECTURES)
+    assert paged_browser.state['per_page'] == PER_PAGE
+
+
+def test_find_row_stops_at_matching_page(paged_browser):
+    table = TableView(paged_browser).table
+    row = table.find_row(lambda row: row['Name'] == 'arch3', per_page=0)
+    assert row == {'Name': 'arch3', 'Operating systems': 'RHEL 3'}
+    # the third row is on the second page, the last one was not opened
+    assert paged_browser.state['page'] == ARCHITECTURES.index(('arch3', 'RHEL 3')) // PER_PAGE + 1
@@ -0,0 +1,128 @@
+"""Tests of :class:`airgun.views.sync_status.SyncStatusTreeTable` against small
+HTML pages served by :mod:`airgun.offline`.
+"""
+
+import pytest
+
+pytest.importorskip('lxml')
+pytest.importorskip('cssselect')
+
+from airgun.offline import offline_browser
+from airgun.views.sync_status import NodeNotFoundError, SyncStatusTreeTable
+
+PROGRESS_BAR = '<div class="pf-v5-c-progress"><span>50%</span></div>'
+
+# (level, number of children, name, Progress / Result cell)
+TREE = [
+    (1, 2, 'prod1', ''),
+    (2, 0, 'repo1', 'Syncing complete'),
+    (2, 0, 'repo2', 'Never synced'),
+    (1, 1, 'RHEL', ''),
+    (2, 1, '7.5', ''),
+    (3, 1, 'x86_64', ''),
+    (4, 0, 'RHEL 7 RPMs', PROGRESS_BAR),
+]
+RPMS = ('RHEL', '7.5', 'x86_64', 'RHEL 7 RPMs')
+
+
+def tree_page(collapsed=False):
+    """Return HTML of the sync status table of :data:`TREE`, with children of
+    the products hidden if ``collapsed``.
+    """
+    rows = ''.join(
+        f'<tr aria-level="{level}" aria-setsize="{setsize}"'
+        f' aria-expanded="{"false" if collapsed else "true"}"'
+        f'{" hidden" if collapsed and level > 1 else ""}>'
+        '<th><span class="pf-v5-c-table__toggle"><button>toggle</button></span>'
+        '<input type="checkbox">'
+        f'<div class="pf-v5-c-table__tree-view-text"><span role="button">{name}</span></div>'
+        f'</th><td>{result}</td></tr>'
+        for level, setsize, name, result in TREE
+    )
+    return f"""<html><body>
+        <table data-ouia-component-id="sync-status-table">
+          <thead><tr>
+            <th class="pf-v5-c-table__toggle"><button>expand all</button>Name</th>
+            <th>Progress / Result</th>
+          </tr></thead>
+          <tbody>{rows}</tbody>
+        </table>
+        </body></html>"""
+
+
+def checked_names(browser):
+    """Return names of rows with a checked checkbox."""
+    return browser.selenium.document.xpath('//input[@checked]/following-sibling::div/span/text()')
+
+
+@pytest.fixture
+def browser():
+    return offline_browser(tree_page())
+
+
+@pytest.fixture
+def table(browser):
+    return SyncStatusTreeTable(browser, locator='.//table')
+
+
+def test_read(table):
+    assert table.read() == {
+        'prod1': {'repo1': 'Syncing complete', 'repo2': 'Never synced'},
+        'RHEL': {'7.5': {'x86_64': {'RHEL 7 RPMs': '50%'}}},
+    }
+
+
+def test_read_expands_collapsed_tree():
+    browser = offline_browser(tree_page(collapsed=True))
+    browser.selenium.on_click(
+        "//th[contains(@class, 'pf-v5-c-table__toggle')]",
+        lambda node: browser.selenium.load(tree_page()),
+    )
+    table = SyncStatusTreeTable(browser, locator='.//table')
+    assert table.read()['prod1'] == {'repo1': 'Syncing complete', 'repo2': 'Never synced'}
+    assert not browser.elements('//tr[@hidden]')
+
+
+def test_tree_index_read_once(browser, table):
+    metrics = browser.extra_objects['session'].metrics
+    table.tree_index()
+    metrics.reset()
+    table.get_nodes_from_paths([('prod1', 'repo1'), RPMS])
+    lookups = len(metrics)
+    metrics.reset()
+    # more lookups do not read the tree again
+    table.get_nodes_from_paths([('prod1', 'repo1'), RPMS, ('prod1', 'repo2'), RPMS])
+    assert len(metrics) == lookups
+
+
+def test_node_lookups(table):
+    rows = table.get_nodes_from_paths(
+        [
+            ('prod1', 'repo2'),
+            RPMS,
+            # names of intermediate levels may be left out or be unknown
+            ('RHEL', None, 'RHEL 7 RPMs'),
+            ('RHEL', '7.6', 'x86_64', 'RHEL 7 RPMs'),
+        ]
+    )
+    assert [row.name for row in rows] == ['repo2', *['RHEL 7 RPMs'] * 3]
+    assert table.get_row_by_name('x86_64').is_expandable
+    with pytest.raises(NodeNotFoundError):
+        table.get_node_from_path(('prod1', 'repo3'))
+
+
+def test_progress(table):
+    assert table.progress([('prod1', 'repo1'), RPMS]) == [
+        (False, 'Syncing complete'),
+        (True, '50%'),
+    ]
+    assert table.get_node_from_path(RPMS).has_progress
+
+
+def test_select_nodes(browser, table):
+    table.select_nodes([('prod1', 'repo1'), ('prod1', 'repo2')])
+    # already selected checkboxes are not clicked again
+    table.select_nodes([('prod1', 'repo2'), RPMS])
+    assert checked_names(browser) == ['repo1', 'repo2', 'RHEL 7 RPMs']
+    table.select_nodes([('prod1', 'repo1')], value=False)
+    assert checked_names(browser) == ['repo2', 'RHEL 7 RPMs']
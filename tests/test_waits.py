@@ -0,0 +1,105 @@
+"""Tests of named conditions of :mod:`airgun.waits`."""
+
+import time
+
+import pytest
+
+pytest.importorskip('lxml')
+pytest.importorskip('cssselect')
+
+from wait_for import TimedOutError
+from widgetastic.widget import Text, View
+
+from airgun import waits
+from airgun.offline import offline_browser
+
+SPINNER = '<div class="pf-v5-c-spinner"></div>'
+
+# short timeout for conditions which are not met
+TIMEOUT = 0.5
+# requested poll interval
+DELAY = 10
+
+
+def wizard_page(spinner_inside=False, spinner_outside=False):
+    """Return HTML of a wizard step, with loading spinner inside and (or)
+    outside of it.
+    """
+    return f"""<html><body>
+        <div id="drawer">{SPINNER if spinner_outside else ''}</div>
+        <div id="wizard"><h2>Details</h2>{SPINNER if spinner_inside else ''}</div>
+        </body></html>"""
+
+
+class WizardStep(View):
+    ROOT = "//div[@id='wizard']"
+    title = Text('.//h2')
+
+    @property
+    def is_displayed(self):
+        return self.title.is_displayed
+
+
+class PageView(View):
+    title = Text("//div[@id='wizard']/h2")
+
+    @property
+    def is_displayed(self):
+        return self.title.is_displayed
+
+
+@pytest.mark.parametrize('view_class', [WizardStep, PageView])
+def test_wizard_step_rendered(view_class):
+    view = view_class(offline_browser(wizard_page()))
+    _, duration = waits.wizard_step_rendered(view, timeout=10)
+    assert duration < TIMEOUT
+
+
+def test_wizard_step_rendered_ignores_spinner_outside():
+    view = WizardStep(offline_browser(wizard_page(spinner_outside=True)))
+    waits.wizard_step_rendered(view, timeout=10)
+
+
+@pytest.mark.parametrize(
+    ('view_class', 'page'),
+    [
+        (WizardStep, wizard_page(spinner_inside=True)),
+        # a view without root spans the whole page
+        (PageView, wizard_page(spinner_outside=True)),
+    ],
+)
+def test_wizard_step_rendered_waits_for_spinner(view_class, page):
+    view = view_class(offline_browser(page))
+    with pytest.raises(TimedOutError):
+        waits.wizard_step_rendered(view, timeout=TIMEOUT)
+
+
+class SettledBrowser:
+    """Browser whose page is known to be settled."""
+
+    def is_page_settled(self):
+        return True
+
+
+def test_page_stable_settle():
+    start = time.monotonic()
+    waits.page_stable(SettledBrowser(), settle=TIMEOUT, delay=0.1)
+    assert time.monotonic() - start >= TIMEOUT
+    _, duration = waits.page_stable(SettledBrowser())
+    assert duration < TIMEOUT
+
+
+@pytest.mark.parametrize('fail_func', [None, lambda: None])
+def test_wait_for_delays(monkeypatch, fail_func):
+    sleeps = []
+    monkeypatch.setattr(waits.time, 'sleep', sleeps.append)
+    calls = iter([False, False, False, True])
+    waits.wait_for(lambda: next(calls), timeout=60, delay=DELAY, fail_func=fail_func)
+    # wait_for.wait_for itself sleeps for delay=0
+    sleeps = [seconds for seconds in sleeps if seconds]
+    if fail_func is None:
+        # polled adaptively, fast at first
+        assert sleeps[0] < sleeps[-1] <= DELAY
+    else:
+        # not refreshed sooner than requested
+        assert sleeps == [DELAY] * 3